@@ -30,6 +30,9 @@ setup(
         "upscaling": [
             "realesrgan",
         ],
+        "jit": [
+            "numba>=0.61",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -22,6 +22,7 @@ from ..ui.painted_ui import (
 )
 from ..ui.animation import animate_to, EasingType, animation_manager
 from ..ui.theme import theme
+from ..ui.helpers import default_font
 from ..utils.asset_loader import get_asset
 
 logger = logging.getLogger(__name__)
@@ -344,8 +345,7 @@ class CleanMenuScreen:
         pygame.draw.rect(self.screen, border_color, rect, 2)
         
         # Desenhar texto
-        font = pygame.font.Font(None, 36)
-        text_surface = font.render(text, True, text_color)
+        text_surface = default_font(36).render(text, True, text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
     
@@ -24,6 +24,7 @@ from .character_screens import CharacterScreenManager
 from .stats_screen import StatsScreen
 from .story_screen import StoryScreen
 from ..ui.combat_screen import CombatScreen
+from ..ui.helpers import default_font
 from ..ui.mvp_combat_screen import MVPCombatScreen
 from ..enemies.intelligent_combat import IntelligentCombatEngine
 from ..core.turn_engine import Player
@@ -77,6 +78,10 @@ class GameUI:
         # Initialize pygame
         pygame.init()
         pygame.font.init()
+        if getattr(pygame, "IS_CE", False):
+            logger.info(f"Using pygame-ce {pygame.version.ver}")
+        else:
+            logger.info(f"Using pygame {pygame.version.ver} (pygame-ce is a faster drop-in replacement)")
         
         # Create display
         self.screen_width = self.config.ui.window_width
@@ -509,20 +514,18 @@ class GameUI:
         
     def _draw_placeholder(self) -> None:
         """Draw placeholder for unimplemented screens."""
-        font = pygame.font.Font(None, 48)
-        text = font.render(f"{self.current_state.value.title()} - Coming Soon!", True, (255, 255, 255))
+        text = default_font(48).render(f"{self.current_state.value.title()} - Coming Soon!", True, (255, 255, 255))
         rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
         self.screen.blit(text, rect)
         
         # Back instruction
-        instruction_font = pygame.font.Font(None, 24)
-        instruction_text = instruction_font.render("Press ESC to go back", True, (200, 200, 200))
+        instruction_text = default_font(24).render("Press ESC to go back", True, (200, 200, 200))
         instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 60))
         self.screen.blit(instruction_text, instruction_rect)
         
     def _draw_debug_info(self) -> None:
         """Draw debug information."""
-        font = pygame.font.Font(None, 24)
+        font = default_font(24)
         
         # FPS
         fps_text = font.render(f"FPS: {self.clock.get_fps():.1f}", True, (255, 255, 0))
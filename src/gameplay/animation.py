@@ -5,20 +5,47 @@ Geração automática de animações 30fps com IA e reprodução fluida.
 Enhanced for P2 Sprint with precise timing and state management.
 """
 
+import io
 import pygame
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class AnimationClip:
+    """
+    Dados imutáveis de uma animação (frames, fps, loop).
+    
+    Compartilhado entre todas as entidades que tocam a mesma animação;
+    o estado de reprodução fica em cada FrameAnimation.
+    """
+    
+    __slots__ = ("frames", "fps", "loop", "frame_duration", "total_duration")
+    
+    def __init__(self, frames: List[pygame.Surface], fps: int = 30, loop: bool = True):
+        if not frames:
+            raise ValueError("Frames list cannot be empty")
+            
+        self.fps = fps
+        self.loop = loop
+        self.frame_duration = 1.0 / fps
+        self.set_frames(frames)
+        
+    def set_frames(self, frames: List[pygame.Surface]):
+        """Troca os frames (ex.: após escalar) mantendo a duração consistente."""
+        self.frames = frames
+        self.total_duration = len(frames) * self.frame_duration
+
+
 class FrameAnimation:
     """
     Reproduz animação de sprite sheet a 30 fps com controle de loop.
     Enhanced for P2 with precise timing and state management.
     """
     
-    def __init__(self, frames: List[pygame.Surface], fps: int = 30, loop: bool = True):
+    def __init__(self, frames: List[pygame.Surface] = None, fps: int = 30, loop: bool = True,
+                 clip: Optional[AnimationClip] = None):
         """
         Inicializa animação de frames.
         
@@ -26,21 +53,38 @@ class FrameAnimation:
             frames: Lista de surfaces dos quadros
             fps: Frames por segundo
             loop: Se deve repetir a animação
+            clip: Clip compartilhado (ignora frames/fps/loop se informado)
         """
-        if not frames:
-            raise ValueError("Frames list cannot be empty")
-            
-        self.frames = frames
-        self.fps = fps
-        self.loop = loop
+        self.clip = clip if clip is not None else AnimationClip(frames, fps, loop)
         self.timer = 0.0
         self.current_frame = 0
         self.finished = False
         self.paused = False
         
-        # P2 enhancements
-        self.frame_duration = 1.0 / self.fps
-        self.total_duration = len(self.frames) * self.frame_duration
+    # Dados da animação vêm do clip compartilhado
+    @property
+    def frames(self) -> List[pygame.Surface]:
+        return self.clip.frames
+    
+    @frames.setter
+    def frames(self, frames: List[pygame.Surface]):
+        self.clip.set_frames(frames)
+        
+    @property
+    def fps(self) -> int:
+        return self.clip.fps
+    
+    @property
+    def loop(self) -> bool:
+        return self.clip.loop
+    
+    @property
+    def frame_duration(self) -> float:
+        return self.clip.frame_duration
+    
+    @property
+    def total_duration(self) -> float:
+        return self.clip.total_duration
         
     def update(self, dt: float):
         """
@@ -114,6 +158,8 @@ class AnimationManager:
         self.animations: Dict[str, Dict[str, FrameAnimation]] = {}
         self.current_animations: Dict[str, str] = {}
         self.pending_transitions: Dict[str, str] = {}
+        # Índice plano (entity_id, action) -> animação para lookups no draw
+        self._flat: Dict[Tuple[str, str], FrameAnimation] = {}
         
     def add_animation(self, entity_id: str, action: str, frames: List[pygame.Surface], 
                      fps: int = 30, loop: bool = True):
@@ -130,12 +176,38 @@ class AnimationManager:
         if entity_id not in self.animations:
             self.animations[entity_id] = {}
             
-        self.animations[entity_id][action] = FrameAnimation(frames, fps, loop)
+        animation = FrameAnimation(frames, fps, loop)
+        self.animations[entity_id][action] = animation
+        self._flat[(entity_id, action)] = animation
         
         # Se é a primeira animação, definir como atual
         if entity_id not in self.current_animations:
             self.current_animations[entity_id] = action
             
+    def share_animations(self, source_id: str, entity_id: str):
+        """
+        Registra para entity_id as animações de source_id sem copiar frames.
+        
+        Cada entidade ganha só seu estado de reprodução; os clips
+        (frames/fps/loop) são os mesmos da entidade base.
+        
+        Args:
+            source_id: ID da entidade base (ex.: "goblin")
+            entity_id: ID da nova entidade (ex.: "goblin_0")
+        """
+        source = self.animations.get(source_id)
+        if not source:
+            return
+            
+        animations = self.animations.setdefault(entity_id, {})
+        for action, base_animation in source.items():
+            animation = FrameAnimation(clip=base_animation.clip)
+            animations[action] = animation
+            self._flat[(entity_id, action)] = animation
+            
+            if entity_id not in self.current_animations:
+                self.current_animations[entity_id] = action
+                
     def play_animation(self, entity_id: str, action: str, force_restart: bool = False):
         """
         Inicia uma animação específica.
@@ -202,16 +274,16 @@ class AnimationManager:
         Returns:
             Surface do frame atual ou None
         """
-        if entity_id not in self.current_animations:
+        current_action = self.current_animations.get(entity_id)
+        if current_action is None:
             return None
             
-        current_action = self.current_animations[entity_id]
+        return self.get_current_frame_fast(entity_id, current_action)
         
-        if (entity_id in self.animations and 
-            current_action in self.animations[entity_id]):
-            return self.animations[entity_id][current_action].current()
-            
-        return None
+    def get_current_frame_fast(self, entity_id: str, action: str) -> Optional[pygame.Surface]:
+        """Frame atual de uma ação específica com um único lookup no índice plano."""
+        animation = self._flat.get((entity_id, action))
+        return animation.current() if animation is not None else None
         
     def is_animation_finished(self, entity_id: str) -> bool:
         """Verifica se a animação atual da entidade terminou."""
@@ -236,7 +308,7 @@ animation_manager = AnimationManager()
 
 
 def load_sprite_sheet(image_path: str, frame_count: int, frame_width: int = None, 
-                     frame_height: int = None) -> List[pygame.Surface]:
+                     frame_height: int = None, data: bytes = None) -> List[pygame.Surface]:
     """
     Carrega uma sprite sheet em frames individuais.
     
@@ -245,23 +317,28 @@ def load_sprite_sheet(image_path: str, frame_count: int, frame_width: int = None
         frame_count: Número de frames na sheet
         frame_width: Largura de cada frame (auto se None)
         frame_height: Altura de cada frame (auto se None)
+        data: Conteúdo do arquivo já lido (opcional, evita I/O aqui)
         
     Returns:
         Lista de surfaces dos frames
     """
     try:
-        sheet = pygame.image.load(image_path).convert_alpha()
+        if data is not None:
+            sheet = pygame.image.load(io.BytesIO(data), image_path).convert_alpha()
+        else:
+            sheet = pygame.image.load(image_path).convert_alpha()
         
         if frame_width is None:
             frame_width = sheet.get_width() // frame_count
         if frame_height is None:
             frame_height = sheet.get_height()
             
+        # O sheet decodificado funciona como atlas: cada frame é uma subsurface
+        # (uma região do mesmo buffer de pixels), sem cópia por frame
         frames = []
         for i in range(frame_count):
             frame_rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
-            frame = sheet.subsurface(frame_rect).copy()
-            frames.append(frame)
+            frames.append(sheet.subsurface(frame_rect))
             
         logger.info(f"Loaded {len(frames)} frames from {image_path}")
         return frames
@@ -0,0 +1,133 @@
+"""
+Kernels compilados (Numba) para as animações dos slots de combate e da mão.
+
+Operam diretamente sobre os arrays float32 de CombatZone._slot_state e
+CombatScreen._card_anim. Numba é opcional: sem ele, NUMBA_AVAILABLE fica
+False e as telas usam o caminho vetorizado em NumPy.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+def _update_slots(hovered, hover, target_hover, glow, target_glow, scale, target_scale,
+                  tween_active, tween_progress, sx, sy, tx, ty, out_cx, out_cy,
+                  dt, tween_duration):
+    """
+    Avança hover/glow/escala e o tween para o centro de todos os slots (in-place).
+
+    Slots com tween ativo recebem o centro interpolado em out_cx/out_cy;
+    tween_active é desligado ao fim do tween.
+    """
+    # Fatores de suavização exponencial independentes do frame rate
+    # (dt * k ultrapassaria o alvo com dt grande)
+    hover_k = 1.0 - math.exp(-8.0 * dt)
+    glow_k = 1.0 - math.exp(-6.0 * dt)
+    scale_k = 1.0 - math.exp(-10.0 * dt)
+
+    for i in range(hover.shape[0]):
+        # Alvos de hover (y offset, glow, escala)
+        if hovered[i]:
+            target_hover[i] = -15.0
+            target_glow[i] = 255.0
+            target_scale[i] = 1.05
+        else:
+            target_hover[i] = 0.0
+            target_glow[i] = 0.0
+            target_scale[i] = 1.0
+
+        # Interpolação suave para hover
+        hover[i] += (target_hover[i] - hover[i]) * hover_k
+        glow[i] += (target_glow[i] - glow[i]) * glow_k
+        scale[i] += (target_scale[i] - scale[i]) * scale_k
+
+        # Tween para centro com easing out cubic
+        if tween_active[i]:
+            tween_progress[i] += dt * 1000  # converter para ms
+            progress = min(tween_progress[i] / tween_duration, 1.0)
+            remaining = 1.0 - progress
+            eased = 1.0 - remaining * remaining * remaining
+            out_cx[i] = sx[i] + (tx[i] - sx[i]) * eased
+            out_cy[i] = sy[i] + (ty[i] - sy[i]) * eased
+            if progress >= 1.0:
+                tween_active[i] = False
+
+
+def _update_card_anim(hovered, selected, hover_y, target_hover_y, scale, target_scale,
+                      glow, target_glow, rotation, target_rotation, anim_time, bob_offset,
+                      draw_progress, dragging, n, dt):
+    """
+    Avança hover/escala/glow/rotação, pulsing idle e draw das n primeiras cartas (in-place).
+    
+    Mesma semântica de CombatScreen._update_card_anim_numpy. Os arrays vêm
+    primeiro, na ordem de CARD_ANIM_KERNEL_ARRAYS, para o chamador montar a
+    tupla de argumentos uma vez só.
+    """
+    ease = dt * 10.0
+    
+    for i in range(n):
+        anim_time[i] += dt
+        
+        # Hover tem prioridade sobre seleção
+        if hovered[i] and not dragging:
+            target_hover_y[i] = -25.0
+            target_scale[i] = 1.15
+            target_glow[i] = 200.0
+            target_rotation[i] = 3.0
+        elif selected[i]:
+            target_hover_y[i] = -15.0
+            target_scale[i] = 1.08
+            target_glow[i] = 120.0
+            target_rotation[i] = 1.5
+        else:
+            target_hover_y[i] = 0.0
+            target_scale[i] = 1.0
+            target_glow[i] = 0.0
+            target_rotation[i] = 0.0
+            
+        hover_y[i] += (target_hover_y[i] - hover_y[i]) * ease
+        scale[i] += (target_scale[i] - scale[i]) * ease
+        glow[i] += (target_glow[i] - glow[i]) * ease
+        rotation[i] += (target_rotation[i] - rotation[i]) * ease
+        
+        # Pulsing senoidal quando idle
+        if not hovered[i] and not selected[i]:
+            hover_y[i] += math.sin((anim_time[i] + bob_offset[i]) * 2.0) * 3.0
+            
+        draw_progress[i] = min(draw_progress[i] + dt * 3.0, 1.0)
+
+
+# Campos de CombatScreen._card_anim passados a update_card_anim, na ordem da assinatura
+CARD_ANIM_KERNEL_ARRAYS = (
+    "hovered", "selected", "hover_y", "target_hover_y", "scale", "target_scale",
+    "glow", "target_glow", "rotation", "target_rotation", "anim_time", "bob_offset",
+    "draw_progress",
+)
+
+
+def _warmup():
+    """Compila os kernels na importação (com cache=True, só na primeira execução)."""
+    f = np.zeros(1, dtype=np.float32)
+    b = np.zeros(1, dtype=np.bool_)
+    update_slots(b, f, f.copy(), f.copy(), f.copy(), f.copy(), f.copy(), b.copy(), f.copy(),
+                 f.copy(), f.copy(), f.copy(), f.copy(), f.copy(), f.copy(),
+                 np.float32(0.0), np.float32(300.0))
+    update_card_anim(b, b.copy(), f, f.copy(), f.copy(), f.copy(), f.copy(), f.copy(),
+                     f.copy(), f.copy(), f.copy(), f.copy(), f.copy(), False, 1, np.float32(0.0))
+
+
+if NUMBA_AVAILABLE:
+    update_slots = njit(cache=True, fastmath=True)(_update_slots)
+    update_card_anim = njit(cache=True, fastmath=True)(_update_card_anim)
+    _warmup()
+else:
+    update_slots = None
+    update_card_anim = None
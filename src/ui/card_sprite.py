@@ -86,16 +86,23 @@ class CardSprite(pygame.sprite.Sprite):
         if abs(self.hover_scale - 1.0) > 0.01:
             self._update_scaled_image()
             
+    def is_animating(self) -> bool:
+        """True while lift, scale or outline still change what gets drawn."""
+        return (self.outline_alpha > 0
+                or self.rect.y != int(self.base_y + self.target_lift)
+                or abs(self.hover_scale - self.target_scale) > 0.01)
+            
     def _update_scaled_image(self) -> None:
         """Update the scaled image based on hover scale."""
         if self.hover_scale != 1.0:
-            # Scale the base image
+            # Scale the base image. The size changes every hover frame, so use
+            # the unfiltered scale; smoothscale is several times slower here
             old_center = self.rect.center
             new_size = (
                 int(self.base_image.get_width() * self.hover_scale),
                 int(self.base_image.get_height() * self.hover_scale)
             )
-            self.image = pygame.transform.smoothscale(self.base_image, new_size)
+            self.image = pygame.transform.scale(self.base_image, new_size)
             self.rect = self.image.get_rect(center=old_center)
         else:
             self.image = self.base_image
@@ -106,7 +113,10 @@ class CardSprite(pygame.sprite.Sprite):
         """Draw the card with outline effects."""
         # Draw main image
         surface.blit(self.image, self.rect)
+        self.draw_effects(surface)
         
+    def draw_effects(self, surface: pygame.Surface) -> None:
+        """Draw only the overlay effects (for callers that batch the image blits)."""
         # Draw pulsing outline if hovering
         if self.outline_alpha > 0:
             self._draw_outline(surface)
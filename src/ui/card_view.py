@@ -29,6 +29,7 @@ class CardView:
         
         # Surface cache
         self._card_surface: Optional[pygame.Surface] = None
+        self._scaled_surface: Optional[pygame.Surface] = None  # _card_surface no último size pedido
         self._needs_redraw = True
         
         # Tentar carregar frame da carta
@@ -150,6 +151,7 @@ class CardView:
         """
         if self._needs_redraw or self._card_surface is None:
             self._card_surface = self._create_card_surface()
+            self._scaled_surface = None
             self._needs_redraw = False
         
         # Usar parâmetros ou valores padrão
@@ -158,7 +160,11 @@ class CardView:
         if size is not None:
             # CORREÇÃO CRÍTICA: Usar tamanho personalizado com escala correta
             w, h = size
-            frame = pygame.transform.smoothscale(self._card_surface, size)
+            # smoothscale só quando o tamanho pedido muda (mão redesenha todo frame)
+            frame = self._scaled_surface
+            if frame is None or frame.get_size() != tuple(size):
+                frame = pygame.transform.smoothscale(self._card_surface, size)
+                self._scaled_surface = frame
             card_rect = frame.get_rect()
             if isinstance(draw_pos, (list, tuple)) and len(draw_pos) == 2:
                 card_rect.center = draw_pos
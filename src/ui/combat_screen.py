@@ -5,11 +5,17 @@ Interface de combate cinematográfica com design moderno, animações fluidas e
 Implementa a Fase 4 do roadmap com experiência visual premium.
 """
 
+import os
 import pygame
+import numpy as np
 import logging
 import math
+import random
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from enum import Enum
 from pathlib import Path
 
@@ -21,15 +27,361 @@ from ..enemies.intelligent_combat import IntelligentCombatEngine
 from ..ui.theme import UITheme, theme
 from ..ui.animation import AnimationManager, EasingType
 from ..ui.particles import ParticleSystem, ParticleEmitter, ParticleType
-from ..ui.helpers import fit_height, fit_width, create_gradient_surface, draw_outlined_text, apply_glow_effect
+from ..ui._slot_kernels import (
+    update_slots as update_slots_kernel, update_card_anim as update_card_anim_kernel, CARD_ANIM_KERNEL_ARRAYS
+)
+from ..ui.helpers import (
+    fit_height, fit_width, draw_outlined_text, apply_glow_effect,
+    ensure_alpha_format, default_font, render_text
+)
 from ..components.button import Button
 from ..generators.asset_generator import AssetGenerator
-from ..utils.asset_loader import AssetLoader
-from ..gameplay.animation import animation_manager
-from ..utils.sprite_loader import load_character_animations, scale_animation_frames
+from ..utils.asset_loader import AssetLoader, AssetInfo
+from ..gameplay.animation import animation_manager, AnimationClip, FrameAnimation, load_sprite_sheet
+from ..utils.sprite_loader import (
+    load_character_animations, scale_animation_frames,
+    character_sheet_paths, read_files_parallel, iter_files_parallel, load_image
+)
 
 logger = logging.getLogger(__name__)
 
+# Diretório dos assets gerados (sprites/backgrounds melhorados)
+GENERATED_ASSETS_DIR = Path("assets/generated")
+
+# Simular deck de cartas (expandir no futuro); dicts tratados como somente leitura
+_AVAILABLE_CARDS = (
+    {"name": "Fireball", "cost": 3, "damage": 4, "type": "spell"},
+    {"name": "Sword Strike", "cost": 2, "damage": 3, "type": "attack"},
+    {"name": "Heal", "cost": 2, "heal": 3, "type": "heal"},
+    {"name": "Lightning Bolt", "cost": 4, "damage": 5, "type": "spell"},
+    {"name": "Shield Block", "cost": 1, "defense": 2, "type": "defense"},
+    {"name": "Ice Shard", "cost": 2, "damage": 2, "type": "spell"},
+    {"name": "Power Strike", "cost": 3, "damage": 4, "type": "attack"},
+    {"name": "Minor Heal", "cost": 1, "heal": 2, "type": "heal"},
+)
+
+# Subconjunto usado por draw_card (cartas básicas)
+_BASIC_CARDS = _AVAILABLE_CARDS[:5]
+
+# Cor de fundo das cartas por tipo
+_CARD_TYPE_COLORS: Mapping[str, Tuple[int, int, int]] = MappingProxyType({
+    "spell": (120, 80, 200),     # Roxo para spells
+    "attack": (200, 80, 80),     # Vermelho para ataques
+    "heal": (80, 200, 120),      # Verde para cura
+    "defense": (80, 120, 200),   # Azul para defesa
+})
+_CARD_DEFAULT_COLOR = (150, 150, 150)
+
+# Limites da mão do jogador
+INITIAL_HAND_SIZE = 5
+MAX_HAND_SIZE = 10
+
+# Altura da zona de inimigos (topo da tela)
+ENEMY_ZONE_HEIGHT = 300
+
+# Máximo de surfaces de carta compostas (template, tamanho) mantidas em cache
+CARD_BG_CACHE_SIZE = 32
+
+# Máximo de molduras/glows do desenho fallback das cartas mantidos em cache
+CARD_FRAME_CACHE_SIZE = 128
+
+# Estilo do fallback de carta por estado: (borda, fundo RGBA, espessura da borda)
+_CARD_FALLBACK_STYLES: Mapping[str, Tuple[Tuple[int, int, int], Tuple[int, int, int, int], int]] = MappingProxyType({
+    "selected": ((255, 215, 0), (70, 80, 120, 220), 3),   # Dourado para selecionada
+    "hovered": ((150, 200, 255), (60, 70, 110, 220), 2),  # Azul claro para hover
+    "normal": ((80, 80, 80), (50, 50, 50, 180), 1),       # Cinza normal
+})
+
+# Cores de HP indexadas pela porcentagem de vida (0..100, arredondada para cima):
+# até 30% vermelho, até 60% amarelo, acima disso verde
+_HP_COLOR_LUT: Tuple[Tuple[int, int, int], ...] = (
+    ((255, 50, 50),) * 31 + ((255, 200, 0),) * 30 + ((0, 200, 0),) * 40
+)
+_ENEMY_HP_COLOR_LUT: Tuple[Tuple[int, int, int], ...] = (
+    ((200, 0, 0),) * 31 + ((255, 255, 0),) * 30 + ((0, 200, 0),) * 40
+)
+
+
+def _hp_percent(hp, max_hp) -> int:
+    """Índice nas tabelas de cor de HP; aritmética inteira, sem erro de ponto flutuante em 30%/60%."""
+    if max_hp <= 0:
+        return 0
+    return min(100, max(0, int(-(-hp * 100 // max_hp))))
+
+
+# Tabelas de mapeamento por tipo de inimigo (somente leitura)
+_ENEMY_ANIM_IDS: Mapping[str, str] = MappingProxyType({
+    'goblin': 'goblin',
+    'orc': 'orc',
+    'skeleton': 'skeleton',
+    'wizard': 'mage',
+    'dragon': 'dragon'
+})
+
+# Sprites melhorados em assets/generated
+_ENEMY_SPRITE_FILES: Mapping[str, str] = MappingProxyType({
+    'goblin': 'goblin_sprite_enhanced.png',
+    'orc': 'orc_sprite_enhanced.png',
+    'skeleton': 'skeleton_sprite_enhanced.png',
+    'wizard': 'dark_mage_sprite_enhanced.png',
+    'dark_mage': 'dark_mage_sprite_enhanced.png',
+    'dragon': 'dragon_sprite_enhanced.png'
+})
+
+# Fallback para sprites originais se os melhorados não existirem
+_ENEMY_SPRITE_FALLBACK_KEYS: Mapping[str, str] = MappingProxyType({
+    'goblin': 'goblin_scout_sprite',
+    'orc': 'orc_berserker_sprite',
+    'skeleton': 'skeleton_archer_sprite',
+    'wizard': 'dark_mage_sprite',
+    'dragon': 'dragon_sprite'
+})
+
+# Chaves de enemy_sprites por trecho do nome/id do inimigo
+_ENEMY_SPRITE_KEYS: Mapping[str, str] = MappingProxyType({
+    'goblin': 'goblin_scout',
+    'orc': 'orc_berserker',
+    'skeleton': 'skeleton_archer',
+    'mage': 'dark_mage'
+})
+
+# Backgrounds específicos por tipo de inimigo predominante
+_ENEMY_BACKGROUNDS: Mapping[str, str] = MappingProxyType({
+    'goblin': 'combat_bg_goblin_cave.png',
+    'orc': 'combat_bg_orc_camp.png',
+    'skeleton': 'combat_bg_skeleton_crypt.png',
+    'dragon': 'combat_bg_dragon_lair.png',
+    'wizard': 'combat_bg_dark_tower.png',
+    'dark_mage': 'combat_bg_dark_tower.png'
+})
+
+# Sufixos removidos ao gerar aliases no índice de assets (ordem importa)
+ASSET_ALIAS_SUFFIXES = ("_enhanced", "_sprite")
+
+# Texturas de botão (escalada + hover com glow) por (asset, tamanho, cor, raio)
+_BUTTON_TEXTURE_CACHE: Dict[Tuple, Dict[str, pygame.Surface]] = {}
+
+
+def _button_textures(texture_key: str, texture: pygame.Surface, size: Tuple[int, int],
+                     glow_color: Tuple[int, int, int], glow_radius: int) -> Dict[str, pygame.Surface]:
+    """Retorna as texturas normal/hover/pressed de um botão, gerando o glow uma única vez."""
+    key = (texture_key, size, glow_color, glow_radius)
+    cached = _BUTTON_TEXTURE_CACHE.get(key)
+    if cached is None:
+        scaled_texture = pygame.transform.scale(texture, size)
+        cached = {
+            "normal": scaled_texture,
+            "hover": apply_glow_effect(scaled_texture, glow_color, glow_radius),
+            "pressed": scaled_texture
+        }
+        _BUTTON_TEXTURE_CACHE[key] = cached
+    return dict(cached)
+
+
+# Sprites carregados do disco e escalados, por (caminho, altura alvo).
+# Módulo (não instância) para sobreviver a reentradas na tela de combate.
+_SCALED_SPRITE_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}
+
+
+def _load_scaled_sprite(path: str, target_height: int, data: Optional[bytes] = None) -> pygame.Surface:
+    """Carrega e escala (fit_height) um sprite, reaproveitando o resultado em cache."""
+    key = (path, target_height)
+    sprite = _SCALED_SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = fit_height(load_image(path, data), target_height)
+        _SCALED_SPRITE_CACHE[key] = sprite
+    return sprite
+
+
+# Assets já em memória (fallbacks do AssetLoader) escalados, por (nome do asset,
+# altura alvo). O AssetLoader devolve surfaces novas a cada tela, então a chave
+# é o nome, não o id() da surface.
+_SCALED_ASSET_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}
+
+
+def _fit_asset(name: str, surface: pygame.Surface, target_height: int) -> pygame.Surface:
+    """fit_height de um asset carregado, calculado uma vez por (nome, altura)."""
+    key = (name, target_height)
+    sprite = _SCALED_ASSET_CACHE.get(key)
+    if sprite is None:
+        sprite = fit_height(surface, target_height)
+        _SCALED_ASSET_CACHE[key] = sprite
+    return sprite
+
+
+# Clips de sprite sheet (idle/ataque/cast de jogador e inimigos) por
+# (caminho, n_frames, loop), com frames já em formato de display
+# (convert_alpha em load_sprite_sheet). None registra sheet ausente/inválido
+# para não tentar decodificar de novo. Sobrevive a reentradas no combate.
+_CLIP_CACHE: Dict[Tuple[str, int, bool], Optional[AnimationClip]] = {}
+
+
+def _cached_clip(path: str, n_frames: int, loop: bool, data: Optional[bytes] = None) -> Optional[AnimationClip]:
+    """Decodifica um sprite sheet uma única vez e devolve o clip compartilhado."""
+    key = (path, n_frames, loop)
+    if key not in _CLIP_CACHE:
+        frames = load_sprite_sheet(path, n_frames, data=data)
+        _CLIP_CACHE[key] = AnimationClip(frames, fps=30, loop=loop) if frames else None
+    return _CLIP_CACHE[key]
+
+
+# Animação do jogador por tipo de carta: (sheet, n_frames, reset para idle em ms)
+_CAST_ACTION = ("assets/ia/knight_cast_sheet.png", 8, 250)      # Cast para spells
+_ATTACK_ACTION = ("assets/ia/knight_attack_sheet.png", 8, 300)  # Ataques físicos
+_PLAYER_CARD_ACTIONS: Mapping[str, Tuple[str, int, int]] = MappingProxyType({
+    "spell": _CAST_ACTION,
+    "magic": _CAST_ACTION,
+})
+
+
+# Backgrounds de combate já carregados, escalados e com overlay aplicado,
+# por (caminho, largura, altura, cor do overlay, alpha do overlay).
+_BG_CACHE: Dict[Tuple[str, int, int, Tuple[int, int, int], int], pygame.Surface] = {}
+
+# Overlays sólidos em tela cheia por (largura, altura, cor); o alpha é
+# aplicado como alpha de superfície a cada uso.
+_OVERLAY_CACHE: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def _overlay_surface(size: Tuple[int, int], color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """Overlay de cor sólida com o alpha pedido, criado uma vez por (tamanho, cor)."""
+    key = (size[0], size[1], color)
+    overlay = _OVERLAY_CACHE.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert()
+        overlay.fill(color)
+        _OVERLAY_CACHE[key] = overlay
+    overlay.set_alpha(alpha)
+    return overlay
+
+
+def _load_background(path: str, size: Tuple[int, int],
+                     overlay_color: Tuple[int, int, int], overlay_alpha: int) -> pygame.Surface:
+    """Carrega background em tela cheia com overlay de atmosfera, reaproveitando o cache."""
+    key = (str(path), size[0], size[1], overlay_color, overlay_alpha)
+    background = _BG_CACHE.get(key)
+    if background is None:
+        background = pygame.image.load(path).convert()
+        
+        # Redimensionar para fit screen
+        if background.get_size() != size:
+            background = pygame.transform.scale(background, size)
+            
+        # Overlay aplicado in-place: bg * (1 - a) + cor * a, sem criar (nem
+        # manter no _OVERLAY_CACHE) uma surface de tela cheia só para isso
+        keep = 255 - overlay_alpha
+        background.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+        background.fill(tuple(c * overlay_alpha // 255 for c in overlay_color),
+                        special_flags=pygame.BLEND_RGB_ADD)
+        
+        _BG_CACHE[key] = background
+    return background
+
+
+# Selo de custo das cartas (círculo + número), um por valor de custo
+_COST_BADGE_CACHE: Dict[Any, pygame.Surface] = {}
+
+
+def _cost_badge(cost) -> pygame.Surface:
+    """Selo 25x25 com o custo da carta, composto uma vez por valor."""
+    badge = _COST_BADGE_CACHE.get(cost)
+    if badge is None:
+        badge = pygame.Surface((25, 25), pygame.SRCALPHA)
+        center = (12, 12)
+        pygame.draw.circle(badge, (20, 30, 60), center, 12)
+        pygame.draw.circle(badge, (100, 200, 255), center, 12, 2)
+        text = render_text(16, str(cost), (100, 200, 255))
+        badge.blit(text, text.get_rect(center=center))
+        if pygame.display.get_surface() is not None:
+            badge = badge.convert_alpha()
+        _COST_BADGE_CACHE[cost] = badge
+    return badge
+
+
+# Gradiente do background placeholder por resolução (largura, altura)
+_FALLBACK_BG_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+
+def _fallback_gradient(size: Tuple[int, int]) -> pygame.Surface:
+    """
+    Gradiente medieval escuro em tela cheia, gerado uma vez por resolução.
+    
+    Calculado numa coluna de 1px com NumPy e esticado para a tela inteira.
+    """
+    background = _FALLBACK_BG_CACHE.get(size)
+    if background is None:
+        width, height = size
+        progress = np.arange(height, dtype=np.float32) / height
+        # Cores mais ricas para combate: vermelho base, verde sutil, azul para profundidade
+        base = np.array([40, 30, 20], dtype=np.float32)
+        span = np.array([20, 15, 25], dtype=np.float32)
+        column = (base + progress[:, None] * span).astype(np.uint8)  # (H, 3)
+        
+        # surfarray é x-major: (W, H, 3)
+        strip = pygame.Surface((1, height))
+        pygame.surfarray.blit_array(strip, column[None, :, :])
+        background = pygame.transform.scale(strip, size).convert()
+        _FALLBACK_BG_CACHE[size] = background
+    return background
+
+
+# Tipo do inimigo (Enum/str) -> string minúscula, resolvido uma vez por valor
+_ENUM_STR_CACHE: Dict[Any, str] = {}
+
+
+def _enum_to_str(enemy_type) -> str:
+    """Converte o tipo do inimigo (enum value/name ou str) para string minúscula, com cache."""
+    cached = _ENUM_STR_CACHE.get(enemy_type)
+    if cached is None:
+        if hasattr(enemy_type, 'value'):
+            cached = enemy_type.value.lower()
+        elif hasattr(enemy_type, 'name'):
+            cached = enemy_type.name.lower()
+        else:
+            cached = str(enemy_type).lower()
+        _ENUM_STR_CACHE[enemy_type] = cached
+    return cached
+
+
+def _enemy_type_str(enemy) -> str:
+    """
+    Tipo do inimigo como string minúscula (enum value/name ou str).
+    
+    Resolvido uma vez e memorizado no próprio inimigo, já que enemy_type
+    não muda durante a vida do objeto; inimigos novos do mesmo tipo
+    reaproveitam a conversão de _enum_to_str.
+    """
+    cached = enemy.__dict__.get("_type_str")
+    if cached is None:
+        cached = _enum_to_str(enemy.enemy_type)
+        enemy.__dict__["_type_str"] = cached
+    return cached
+
+
+def _card_text_key(card_data: dict) -> Tuple:
+    """Campos da carta que afetam o texto desenhado (parte da chave do cache de surfaces)."""
+    return tuple(card_data.get(field) for field in ("name", "cost", "damage", "heal", "defense"))
+
+
+@dataclass(slots=True)
+class PlayerView:
+    """
+    Dados do jogador lidos pelo HUD, atualizados uma vez por update().
+    
+    Os draws (que podem rodar várias vezes por frame com redesenho por
+    região) leem campos prontos em vez de sondar o jogador com hasattr.
+    """
+    present: bool = False
+    has_hp: bool = False
+    has_mana: bool = False
+    hp: int = 0
+    max_hp: int = 0
+    mana: int = 0
+    max_mana: int = 0
+    turn: int = 1
+
 
 class CombatState(Enum):
     """Estados da tela de combate."""
@@ -43,9 +395,39 @@ class CombatState(Enum):
     PAUSED = "paused"
 
 
+# Campos float32 do estado dos slots (Structure-of-Arrays em CombatZone)
+_SLOT_FIELDS = (
+    "hover_y", "target_hover_y", "glow", "target_glow", "scale", "target_scale",
+    "tween_progress", "tween_sx", "tween_sy", "tween_tx", "tween_ty", "tween_cx", "tween_cy",
+)
+
+
+# Campos float32 do estado de animação das cartas da mão (SoA em CombatScreen),
+# indexados pela posição da carta em player_hand
+_CARD_ANIM_FIELDS = (
+    "hover_y", "target_hover_y", "scale", "target_scale", "glow", "target_glow",
+    "rotation", "target_rotation", "anim_time", "bob_offset", "draw_progress",
+)
+HAND_ANIM_CAPACITY = MAX_HAND_SIZE  # Cresce se necessário
+
+# Alvos de animação da mão por estado: (hover, selecionada, idle)
+_CARD_ANIM_TARGETS = (
+    ("target_hover_y", (-25.0, -15.0, 0.0)),  # More pronounced hover
+    ("target_scale", (1.15, 1.08, 1.0)),      # Larger scale
+    ("target_glow", (200.0, 120.0, 0.0)),     # Stronger glow
+    ("target_rotation", (3.0, 1.5, 0.0)),     # More visible rotation
+)
+
+
+# Diferença de escala abaixo da qual um slot é desenhado no tamanho base
+SLOT_SCALE_EPSILON = 1e-3
+
+
 class CombatZone:
     """Representa uma zona de combate com grid para cartas/inimigos."""
     
+    TWEEN_DURATION = 300  # ms
+    
     def __init__(self, rect: pygame.Rect, grid_size: Tuple[int, int], zone_type: str):
         self.rect = rect
         self.grid_cols, self.grid_rows = grid_size
@@ -53,6 +435,8 @@ class CombatZone:
         self.slots = []
         self.background_surface = None
         self.border_texture = None
+        self._slot_state: Dict[str, np.ndarray] = {}
+        self._glow_by_size: Dict[Tuple[int, int], pygame.Surface] = {}
         self._setup_grid()
         
     def _setup_grid(self):
@@ -60,91 +444,156 @@ class CombatZone:
         slot_width = (self.rect.width - theme.spacing.MARGIN_LARGE * (self.grid_cols + 1)) // self.grid_cols
         slot_height = (self.rect.height - theme.spacing.MARGIN_MEDIUM * (self.grid_rows + 1)) // self.grid_rows
         
+        # Estado de animação de todos os slots em arrays paralelos
+        count = self.grid_cols * self.grid_rows
+        self._slot_state = {name: np.zeros(count, dtype=np.float32) for name in _SLOT_FIELDS}
+        self._slot_state["scale"].fill(1.0)
+        self._slot_state["target_scale"].fill(1.0)
+        self._slot_state["hovered"] = np.zeros(count, dtype=bool)
+        self._slot_state["tween_active"] = np.zeros(count, dtype=bool)
+        
         for row in range(self.grid_rows):
             for col in range(self.grid_cols):
                 x = self.rect.x + theme.spacing.MARGIN_LARGE + col * (slot_width + theme.spacing.MARGIN_LARGE)
                 y = self.rect.y + theme.spacing.MARGIN_MEDIUM + row * (slot_height + theme.spacing.MARGIN_MEDIUM)
                 
-                slot = CombatSlot(x, y, slot_width, slot_height, len(self.slots))
+                slot = CombatSlot(self, x, y, slot_width, slot_height, len(self.slots))
                 self.slots.append(slot)
+                
+        # Anel de glow pré-renderizado para o tamanho dos slots
+        self.get_glow(slot_width, slot_height)
+        
+    def get_glow(self, width: int, height: int) -> pygame.Surface:
+        """
+        Anel de glow dourado (opacidade máxima) para uma carta do tamanho dado.
+        
+        Gerado uma vez por tamanho; no draw basta set_alpha + blit.
+        """
+        key = (width, height)
+        glow_surface = self._glow_by_size.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA)
+            pygame.draw.rect(glow_surface, (255, 215, 0), glow_surface.get_rect(), 5)
+            if pygame.display.get_surface() is not None:
+                # Formato do display: o blit por frame com set_alpha não converte pixels
+                glow_surface = glow_surface.convert_alpha()
+            self._glow_by_size[key] = glow_surface
+        return glow_surface
+                
+    def update_slots(self, dt: float):
+        """Atualiza as animações de todos os slots em uma passada vetorizada."""
+        state = self._slot_state
+        active = state["tween_active"]
+        tweening = active.copy()  # Slots que precisam do centro neste frame
+        
+        if update_slots_kernel is not None:
+            update_slots_kernel(
+                state["hovered"], state["hover_y"], state["target_hover_y"],
+                state["glow"], state["target_glow"], state["scale"], state["target_scale"],
+                active, state["tween_progress"], state["tween_sx"], state["tween_sy"],
+                state["tween_tx"], state["tween_ty"], state["tween_cx"], state["tween_cy"],
+                np.float32(dt), np.float32(self.TWEEN_DURATION)
+            )
+        else:
+            self._update_slots_numpy(dt)
+            
+        # Atualizar posição dos rects
+        offsets = state["hover_y"].astype(np.int32)
+        current_x, current_y = state["tween_cx"], state["tween_cy"]
+        for slot in self.slots:
+            i = slot.index
+            rect = slot.rect
+            rect.x = slot._base_x
+            rect.y = slot._base_y + int(offsets[i])
+            if tweening[i]:
+                rect.centerx = int(current_x[i])
+                rect.centery = int(current_y[i])
+                
+    def _update_slots_numpy(self, dt: float):
+        """Caminho NumPy de update_slots (quando Numba não está disponível)."""
+        state = self._slot_state
+        hovered = state["hovered"]
+        
+        # Alvos de hover (y offset, glow, escala)
+        state["target_hover_y"][:] = np.where(hovered, -15.0, 0.0)
+        state["target_glow"][:] = np.where(hovered, 255.0, 0.0)
+        state["target_scale"][:] = np.where(hovered, 1.05, 1.0)
+        
+        # Interpolação suave para hover (decaimento exponencial, estável com dt variável)
+        state["hover_y"] += (state["target_hover_y"] - state["hover_y"]) * (1.0 - math.exp(-8.0 * dt))
+        state["glow"] += (state["target_glow"] - state["glow"]) * (1.0 - math.exp(-6.0 * dt))
+        state["scale"] += (state["target_scale"] - state["scale"]) * (1.0 - math.exp(-10.0 * dt))
+        
+        # Animação de tween para centro (quando carta é jogada)
+        active = state["tween_active"]
+        if active.any():
+            state["tween_progress"][active] += dt * 1000  # converter para ms
+            progress = np.minimum(state["tween_progress"] / self.TWEEN_DURATION, 1.0)
+            
+            # Easing out cubic
+            remaining = 1 - progress
+            eased = 1 - remaining * remaining * remaining
+            state["tween_cx"][:] = state["tween_sx"] + (state["tween_tx"] - state["tween_sx"]) * eased
+            state["tween_cy"][:] = state["tween_sy"] + (state["tween_ty"] - state["tween_sy"]) * eased
+            active &= progress < 1.0
+
+
+def _slot_field(name: str):
+    """Propriedade que lê/escreve o campo ``name`` do estado SoA da zona."""
+    def fget(self):
+        return self.zone._slot_state[name][self.index].item()
+    
+    def fset(self, value):
+        self.zone._slot_state[name][self.index] = value
+    
+    return property(fget, fset)
 
 
 class CombatSlot:
-    """Slot individual para carta ou inimigo com animações."""
+    """Slot individual para carta ou inimigo (view sobre o estado da zona)."""
+    
+    __slots__ = ("zone", "base_rect", "rect", "_base_x", "_base_y", "_display_rect",
+                 "index", "entity", "is_selected")
     
-    def __init__(self, x: int, y: int, width: int, height: int, index: int):
+    def __init__(self, zone: CombatZone, x: int, y: int, width: int, height: int, index: int):
+        self.zone = zone
         self.base_rect = pygame.Rect(x, y, width, height)
+        self._base_x, self._base_y = x, y
+        # Rects persistentes, mutados in-place a cada frame
         self.rect = self.base_rect.copy()
+        self._display_rect = self.base_rect.copy()
         self.index = index
         self.entity = None  # Card ou Enemy
-        self.is_hovered = False
         self.is_selected = False
         
-        # Animações
-        self.hover_offset_y = 0
-        self.target_hover_y = 0
-        self.glow_alpha = 0
-        self.target_glow_alpha = 0
-        self.scale = 1.0
-        self.target_scale = 1.0
-        
-        # Estado de animação de tween para centro
-        self.tween_active = False
-        self.tween_start_pos = None
-        self.tween_target_pos = None
-        self.tween_progress = 0
-        self.tween_duration = 300  # ms
-        
-    def update(self, dt: float):
-        """Atualiza animações do slot."""
-        # Animação de hover (y offset)
-        if self.is_hovered:
-            self.target_hover_y = -15
-            self.target_glow_alpha = 255
-            self.target_scale = 1.05
-        else:
-            self.target_hover_y = 0
-            self.target_glow_alpha = 0
-            self.target_scale = 1.0
-            
-        # Interpolação suave para hover
-        self.hover_offset_y += (self.target_hover_y - self.hover_offset_y) * dt * 8
-        self.glow_alpha += (self.target_glow_alpha - self.glow_alpha) * dt * 6
-        self.scale += (self.target_scale - self.scale) * dt * 10
-        
-        # Atualizar posição do rect
-        self.rect = self.base_rect.copy()
-        self.rect.y += int(self.hover_offset_y)
-        
-        # Animação de tween para centro (quando carta é jogada)
-        if self.tween_active:
-            self.tween_progress += dt * 1000  # converter para ms
-            progress = min(self.tween_progress / self.tween_duration, 1.0)
-            
-            # Easing out cubic
-            eased_progress = 1 - (1 - progress) ** 3
-            
-            if self.tween_start_pos and self.tween_target_pos:
-                current_x = self.tween_start_pos[0] + (self.tween_target_pos[0] - self.tween_start_pos[0]) * eased_progress
-                current_y = self.tween_start_pos[1] + (self.tween_target_pos[1] - self.tween_start_pos[1]) * eased_progress
-                self.rect.center = (int(current_x), int(current_y))
-                
-            if progress >= 1.0:
-                self.tween_active = False
-                
+    # Animações (armazenadas em CombatZone._slot_state)
+    is_hovered = _slot_field("hovered")
+    hover_offset_y = _slot_field("hover_y")
+    target_hover_y = _slot_field("target_hover_y")
+    glow_alpha = _slot_field("glow")
+    target_glow_alpha = _slot_field("target_glow")
+    scale = _slot_field("scale")
+    target_scale = _slot_field("target_scale")
+    tween_active = _slot_field("tween_active")
+    tween_progress = _slot_field("tween_progress")
+    
     def start_center_tween(self, screen_center: Tuple[int, int]):
         """Inicia animação de tween para o centro da tela."""
-        self.tween_active = True
-        self.tween_start_pos = self.rect.center
-        self.tween_target_pos = screen_center
-        self.tween_progress = 0
+        state = self.zone._slot_state
+        i = self.index
+        state["tween_sx"][i], state["tween_sy"][i] = self.rect.center
+        state["tween_tx"][i], state["tween_ty"][i] = screen_center
+        state["tween_progress"][i] = 0
+        state["tween_active"][i] = True
         
     def get_display_rect(self) -> pygame.Rect:
         """Retorna retângulo para desenho considerando escala."""
-        if self.scale != 1.0:
-            scaled_width = int(self.rect.width * self.scale)
-            scaled_height = int(self.rect.height * self.scale)
-            scaled_rect = pygame.Rect(0, 0, scaled_width, scaled_height)
+        scale = self.scale
+        # A escala só se aproxima de 1.0 assintoticamente: abaixo do epsilon
+        # o rect escalado seria igual ao base, então usa self.rect direto
+        if abs(scale - 1.0) >= SLOT_SCALE_EPSILON:
+            scaled_rect = self._display_rect
+            scaled_rect.size = (int(self.rect.width * scale), int(self.rect.height * scale))
             scaled_rect.center = self.rect.center
             return scaled_rect
         return self.rect
@@ -163,6 +612,15 @@ class CombatScreen:
     - Transições suaves entre turnos
     """
     
+    # Surfaces de carta compostas por (template, tamanho), LRU compartilhado entre instâncias
+    _CARD_BG_CACHE: OrderedDict = OrderedDict()
+    
+    # Molduras (fundo + borda, já rotacionadas) e glows do fallback de carta, LRU
+    _CARD_FRAME_CACHE: OrderedDict = OrderedDict()
+    
+    # Background escolhido por personagem (primeiro candidato existente), entre instâncias
+    _CHARACTER_BG_PATHS: Dict[str, str] = {}
+    
     def __init__(self, screen: pygame.Surface, combat_engine: IntelligentCombatEngine, 
                  asset_generator: Optional[AssetGenerator] = None):
         """
@@ -175,13 +633,44 @@ class CombatScreen:
         """
         self.screen = screen
         self.combat_engine = combat_engine
+        # Resolvido uma vez: o engine expõe (ou não) a lista de inimigos
+        self._engine_has_enemies = hasattr(combat_engine, 'enemies')
+        # Engines legados aplicam a carta por conta própria (None se não houver)
+        self._legacy_use_card = getattr(combat_engine, 'use_card', None)
+        self._engine_has_player = hasattr(combat_engine, 'player')
+        self._player_view = PlayerView()
         self.asset_generator = asset_generator
+        self.debug_mode = False
+        # Overlay de debug: valores exibidos e linhas já renderizadas
+        self._debug_values: Tuple = ()
+        self._debug_surfaces: List[pygame.Surface] = []
+        self.background_surface: Optional[pygame.Surface] = None
+        self._status_card_bg: Optional[pygame.Surface] = None  # Montado no primeiro draw
+        self._status_card_key: Optional[Tuple[int, int, bool, bool]] = None
+        # Superfícies estáticas dos painéis/fundo, compostas no primeiro uso
+        self._zone_panel_cache: Dict[Tuple[str, int, int], pygame.Surface] = {}
+        self._player_panel_bg: Optional[pygame.Surface] = None
+        self._player_panel_key: Optional[Tuple[bool, bool]] = None
+        self._player_panel_shadow: Optional[pygame.Surface] = None
+        self._parallax_bg: Optional[pygame.Surface] = None
+        self._parallax_bg_source: Optional[pygame.Surface] = None
+        self._parallax_bg_size: Optional[Tuple[int, int]] = None
+        self._scaled_sprites: Dict[Tuple[int, Tuple[int, int]], Tuple[pygame.Surface, pygame.Surface]] = {}
         self.width = screen.get_width()
         self.height = screen.get_height()
         
+        # Alturas alvo dos sprites (jogador: 35% da tela, inimigos: 70% da zona)
+        self._player_target_h = int(self.height * 0.35)
+        self._enemy_target_h = int(ENEMY_ZONE_HEIGHT * 0.7)
+        
         # Estado da tela
         self.state = CombatState.PLAYER_TURN
         self.running = True
+        self._dirty = True  # Redesenhar só quando algo visual mudou
+        self._dirty_regions: List[pygame.Rect] = []  # Redesenho parcial (ver _animating_regions)
+        # Último frame de sprite exibido em cada zona (ver _animating_regions)
+        self._shown_player_frame = None
+        self._shown_enemy_frames: tuple = ()
         self.selected_card: Optional[Card] = None
         self.targeted_enemy: Optional[SmartEnemy] = None
         
@@ -198,50 +687,41 @@ class CombatScreen:
         
         # Cartas na mão do jogador (simulação para demo P1)
         self.player_hand = []
+        self._set_card_anim(self._new_card_anim(HAND_ANIM_CAPACITY))
+        
+        # RNG próprio da tela para compras de carta
+        self._rng = random.Random()
+        
+        # Hit-testing da mão: lista paralela de rects + probe 1x1 reutilizado
+        self._card_rects: List[pygame.Rect] = []
+        self._probe_rect = pygame.Rect(0, 0, 1, 1)
+        self._hovered_card_idx = -1  # Índice da carta com hover (-1 = nenhuma)
+        
+        # Rects reaproveitados pelas healthbars dos inimigos a cada frame
+        self._hp_bar_rect = pygame.Rect(0, 0, 0, 0)
+        self._hp_fill_rect = pygame.Rect(0, 0, 0, 0)
+        
+        # Centros x das colunas de inimigos (recalculados só quando a quantidade muda)
+        self._enemy_layout_count = 0
+        self._enemy_refs: List[dict] = []  # Alvos devolvidos por _get_enemy_at_position
+        self._enemy_center_x = np.empty(0, dtype=np.int32)
+        self._enemy_centers_x: List[int] = []
         
-        # Assets IA carregados
+        # Assets IA carregados + índice plano nome -> surface
         self.assets = {}
+        self._asset_index: Dict[str, pygame.Surface] = {}
+        self._generated_files: set = set()
         
         # Inicialização dos componentes
         self._load_ia_assets()
         self._load_sprite_animations()
         
-    def get_asset(self, asset_name: str, category: str = None) -> pygame.Surface:
-        """
-        Busca um asset na estrutura hierárquica.
-        
-        Args:
-            asset_name: Nome do asset ou variante
-            category: Categoria específica (opcional)
-            
-        Returns:
-            pygame.Surface do asset encontrado ou None
-        """
-        # Primeiro, tentar buscar na estrutura hierárquica
-        if category and category in self.assets:
-            if asset_name in self.assets[category]:
-                return self.assets[category][asset_name]
-        
-        # Buscar em todas as categorias
-        for cat_name, assets in self.assets.items():
-            if isinstance(assets, dict):
-                if asset_name in assets:
-                    return assets[asset_name]
-                # Tentar buscar por nome parcial
-                for variant_name, asset in assets.items():
-                    if asset_name in variant_name or variant_name in asset_name:
-                        return asset
-        
-        # Fallback: buscar diretamente (compatibilidade com estrutura antiga)
-        if asset_name in self.assets:
-            return self.assets[asset_name]
-            
-        return None
         self._setup_zones()
         self._init_demo_hand()  # Mover para depois de _setup_zones
         self._setup_buttons()
         self._setup_particles()
         self._setup_player_panel()
+        self._setup_chrome()
         self._generate_background()
         
         # Transições e overlays
@@ -276,38 +756,106 @@ class CombatScreen:
         from ..ui.particles import particle_manager
         self.particle_manager = particle_manager
         
+        # HUD já tem dados válidos se houver draw antes do primeiro update
+        self._refresh_player_view()
+        
         logger.info("Professional CombatScreen initialized with P2 Animation System")
         
+    def _build_asset_index(self):
+        """
+        Monta o índice plano de assets uma única vez.
+        
+        Cada asset entra com aliases explícitos (nome, nome sem sufixos
+        _sprite/_enhanced e as formas categoria/nome), de modo que get_asset
+        é só lookup em dict, sem busca por substring.
+        """
+        index: Dict[str, pygame.Surface] = {}
+        
+        def add(category: str, name: str, surface: pygame.Surface, exact: bool = True):
+            # Nomes reais sempre vencem; aliases não sobrescrevem nada
+            if exact:
+                index[name] = surface
+            short = name
+            for suffix in ASSET_ALIAS_SUFFIXES:
+                short = short.removesuffix(suffix)
+            for alias in dict.fromkeys((name, short)):
+                index.setdefault(alias, surface)
+                if category:
+                    index.setdefault(f"{category}/{alias}", surface)
+        
+        for key, value in self.assets.items():
+            if isinstance(value, dict):
+                # Estrutura hierárquica {categoria: {variante: surface}}
+                for name, surface in value.items():
+                    add(key, name, surface)
+            elif isinstance(value, AssetInfo):
+                # Estrutura plana do AssetLoader {nome: AssetInfo}
+                add(value.category, key, value.surface)
+                add(value.category, value.variant, value.surface, exact=False)
+            else:
+                add("", key, value)
+        self._asset_index = index
+        
+    def get_asset(self, asset_name: str, category: str = None) -> pygame.Surface:
+        """
+        Busca um asset na estrutura hierárquica.
+        
+        Args:
+            asset_name: Nome do asset ou variante
+            category: Categoria específica (opcional)
+            
+        Returns:
+            pygame.Surface do asset encontrado ou None
+        """
+        index = self._asset_index
+        if category:
+            asset = index.get(f"{category}/{asset_name}")
+            if asset is not None:
+                return asset
+                
+        return index.get(asset_name)
+        
+    def _convert_asset_surfaces(self, assets: Dict[str, Any]):
+        """Converte (in-place) todas as surfaces carregadas para o formato de display com alpha."""
+        for key, value in assets.items():
+            if isinstance(value, dict):
+                self._convert_asset_surfaces(value)
+            elif isinstance(value, AssetInfo):
+                value.surface = ensure_alpha_format(value.surface)
+            elif isinstance(value, pygame.Surface):
+                assets[key] = ensure_alpha_format(value)
+                
+    def _scan_generated_files(self):
+        """Lista assets/generated uma vez (um scandir) para testes de existência por nome."""
+        try:
+            with os.scandir(GENERATED_ASSETS_DIR) as entries:
+                self._generated_files = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            self._generated_files = set()
+            
+    def _generated_path(self, filename: str) -> Optional[str]:
+        """Caminho do arquivo em assets/generated se ele existir, senão None."""
+        if filename in self._generated_files:
+            return str(GENERATED_ASSETS_DIR / filename)
+        return None
+        
     def _load_ia_assets(self):
         """Carrega todos os assets gerados por IA usando o AssetLoader."""
+        self._scan_generated_files()
         try:
             # Usar o novo AssetLoader para carregar assets gerados
             asset_loader = AssetLoader()
             generated_assets = asset_loader.load_all_assets()
+            self._convert_asset_surfaces(generated_assets)
             self.assets.update(generated_assets)
+            self._build_asset_index()
             
             # Escalar background para o tamanho da tela
-            if "background" in generated_assets.get("background", {}):
-                self.background = pygame.transform.smoothscale(
-                    generated_assets["background"]["main"], 
-                    self.screen.get_size()
-                )
-            elif "background" in generated_assets.get("background", {}):
-                # Fallback para o primeiro background disponível
-                bg_variants = generated_assets["background"]
-                first_bg = next(iter(bg_variants.values()))
-                self.background = pygame.transform.smoothscale(
-                    first_bg, 
-                    self.screen.get_size()
-                )
-            else:
-                # Criar background fallback se não existir
-                self.background = create_gradient_surface(
-                    self.screen.get_size(),
-                    (40, 35, 25),    # Marrom escuro medieval no topo
-                    (20, 15, 10),    # Marrom mais escuro na base
-                    255
-                )
+            # (sem background, o fallback é gerado sob demanda em _generate_background)
+            main_bg = self._asset_index.get("background/main")
+            self.background = (
+                pygame.transform.smoothscale(main_bg, self.screen.get_size()) if main_bg else None
+            )
             
             # Verificar assets carregados na nova estrutura
             asset_categories = generated_assets.keys()
@@ -348,26 +896,36 @@ class CombatScreen:
             # Lista de personagens para carregar
             characters = ["knight", "goblin", "orc", "skeleton", "mage", "dragon"]
             
+            # Ler todos os sprite sheets em paralelo (decodificação segue na thread principal)
+            preloaded = read_files_parallel(
+                path for char_id in characters for path in character_sheet_paths(char_id)
+            )
+            
             # Carregar animações para cada personagem
             loaded_count = 0
             for char_id in characters:
-                if load_character_animations(char_id):
+                if load_character_animations(char_id, preloaded=preloaded):
                     loaded_count += 1
                     
                     # Escalar animações para tamanhos apropriados
                     if char_id == "knight":  # Jogador
-                        target_height = int(self.height * 0.35)
+                        target_height = self._player_target_h
                         scale_animation_frames(char_id, "idle", target_height)
                         scale_animation_frames(char_id, "attack", target_height)
                         scale_animation_frames(char_id, "cast", target_height)
                     else:  # Inimigos
-                        target_height = int(300 * 0.7)  # 70% da zona de inimigos
+                        target_height = self._enemy_target_h
                         scale_animation_frames(char_id, "idle", target_height)
                         scale_animation_frames(char_id, "attack", target_height)
                         scale_animation_frames(char_id, "hurt", target_height)
                         
             logger.info(f"✅ Animações carregadas: {loaded_count}/{len(characters)} personagens")
             
+            # Frames no formato de display (conversão única, não por blit)
+            for char_id in characters:
+                for animation in animation_manager.animations.get(char_id, {}).values():
+                    animation.frames = [ensure_alpha_format(frame) for frame in animation.frames]
+            
             # Inicializar animações dos personagens ativos
             self._initialize_character_animations()
             
@@ -381,41 +939,18 @@ class CombatScreen:
             animation_manager.play_animation("knight", "idle")
             
             # Inimigos baseados no combat engine
-            if hasattr(self.combat_engine, 'enemies'):
+            if self._engine_has_enemies:
                 for i, enemy in enumerate(self.combat_engine.enemies):
-                    # Mapear tipo de inimigo para ID de animação
-                    enemy_type_mapping = {
-                        'goblin': 'goblin',
-                        'orc': 'orc',
-                        'skeleton': 'skeleton',
-                        'wizard': 'mage',
-                        'dragon': 'dragon'
-                    }
-                    
-                    # Converter enum para string
-                    if hasattr(enemy.enemy_type, 'value'):
-                        enemy_type_str = enemy.enemy_type.value.lower()
-                    elif hasattr(enemy.enemy_type, 'name'):
-                        enemy_type_str = enemy.enemy_type.name.lower()
-                    else:
-                        enemy_type_str = str(enemy.enemy_type).lower()
+                    enemy_type_str = _enemy_type_str(enemy)
                         
                     # Usar mapeamento ou fallback para goblin
-                    anim_id = enemy_type_mapping.get(enemy_type_str, 'goblin')
+                    anim_id = _ENEMY_ANIM_IDS.get(enemy_type_str, 'goblin')
                     
                     # Usar índice como ID único para múltiplos inimigos do mesmo tipo
                     unique_id = f"{anim_id}_{i}"
                     
-                    # Copiar animações do tipo base para ID único
-                    if anim_id in animation_manager.animations:
-                        for action, animation in animation_manager.animations[anim_id].items():
-                            animation_manager.add_animation(
-                                entity_id=unique_id,
-                                action=action,
-                                frames=animation.frames.copy(),
-                                fps=animation.fps,
-                                loop=animation.loop
-                            )
+                    # Compartilhar clips do tipo base; cada ID único só tem estado próprio
+                    animation_manager.share_animations(anim_id, unique_id)
                     
                     # Iniciar animação idle
                     animation_manager.play_animation(unique_id, "idle")
@@ -426,34 +961,39 @@ class CombatScreen:
     def _setup_realtime_animations(self):
         """Sprint 2-b: Setup 30fps realtime animations for combat."""
         try:
-            from ..gameplay.animation import FrameAnimation, load_sprite_sheet
+            # Sheets idle: caminho -> (entidade, número de frames)
+            enemy_types = ["goblin", "orc", "skeleton", "mage"]
+            sheets = {"assets/ia/knight_idle_sheet.png": ("player", 10)}
+            sheets.update({f"assets/ia/{enemy_type}_idle_sheet.png": (enemy_type, 8) for enemy_type in enemy_types})
             
-            # Load player idle animation (30fps)
-            try:
-                knight_idle_frames = load_sprite_sheet("assets/ia/knight_idle_sheet.png", 10)
-                if knight_idle_frames:
-                    self.player_animation = FrameAnimation(knight_idle_frames, fps=30, loop=True)
+            # Sheets já decodificados (combate anterior) não voltam ao disco
+            pending = [path for path, (_, frame_count) in sheets.items()
+                       if (path, frame_count, True) not in _CLIP_CACHE]
+            
+            # Leitura em threads; decodificação na thread principal conforme cada arquivo chega
+            for sheet_path, data in iter_files_parallel(pending):
+                _cached_clip(sheet_path, sheets[sheet_path][1], loop=True, data=data)
+                
+            for sheet_path, (entity_type, frame_count) in sheets.items():
+                clip = _CLIP_CACHE.get((sheet_path, frame_count, True))
+                if clip is None:
+                    logger.debug(f"Failed to load {entity_type} animation")
+                    continue
+                    
+                animation = FrameAnimation(clip=clip)
+                if entity_type == "player":
+                    self.player_animation = animation
                     logger.info("✅ Player idle animation loaded (30fps)")
                 else:
-                    # Fallback: create simple animation
-                    self.player_animation = self._create_fallback_animation("player")
-                    logger.warning("Using fallback player animation")
-            except Exception as e:
-                logger.warning(f"Failed to load knight animation: {e}")
+                    self.enemy_animations[entity_type] = animation
+                    logger.debug(f"✅ {entity_type} animation loaded")
+                    
+            # Fallback: create simple animation para sheets ausentes/ilegíveis
+            if self.player_animation is None:
                 self.player_animation = self._create_fallback_animation("player")
-                
-            # Load enemy animations
-            enemy_types = ["goblin", "orc", "skeleton", "mage"]
+                logger.warning("Using fallback player animation")
             for enemy_type in enemy_types:
-                try:
-                    enemy_frames = load_sprite_sheet(f"assets/ia/{enemy_type}_idle_sheet.png", 8)
-                    if enemy_frames:
-                        self.enemy_animations[enemy_type] = FrameAnimation(enemy_frames, fps=30, loop=True)
-                        logger.debug(f"✅ {enemy_type} animation loaded")
-                    else:
-                        self.enemy_animations[enemy_type] = self._create_fallback_animation(enemy_type)
-                except Exception as e:
-                    logger.debug(f"Failed to load {enemy_type} animation: {e}")
+                if enemy_type not in self.enemy_animations:
                     self.enemy_animations[enemy_type] = self._create_fallback_animation(enemy_type)
                     
         except Exception as e:
@@ -497,11 +1037,26 @@ class CombatScreen:
     def _setup_zones(self):
         """Configura as zonas de combate seguindo as diretrizes de design."""
         # Zona de inimigos (topo) - 50px de margem, altura 300px
-        self.enemy_zone = pygame.Rect(50, 30, self.width - 100, 300)
+        self.enemy_zone = pygame.Rect(50, 30, self.width - 100, ENEMY_ZONE_HEIGHT)
         
         # Zona da mão do jogador (base) - altura 190px
         self.player_hand_zone = pygame.Rect(50, self.height - 220, self.width - 100, 190)
         
+        # Área onde o hover de cartas é possível: a zona da mão com folga para
+        # cartas levantadas/escaladas pelo hover
+        self._hand_hover_zone = self.player_hand_zone.inflate(100, 100)
+        
+        # Regiões redesenhadas quando só parte da cena anima: inimigos (com
+        # folga para as healthbars) e o sprite do jogador com o glow de hover
+        screen_rect = pygame.Rect(0, 0, self.width, self.height)
+        self._enemy_redraw_zone = self.enemy_zone.inflate(0, 40).clip(screen_rect)
+        self._player_redraw_zone = pygame.Rect(0, 0, 200, 300)
+        self._player_redraw_zone.center = (self.width // 2, self.height - 240)
+        
+        # Regiões cujo desenho depende da posição do mouse (hover das cartas
+        # e glow do sprite do jogador)
+        self._hover_regions = (self._hand_hover_zone, self._player_redraw_zone)
+        
         # Zona de status card (canto superior direito) - 280x150px
         status_width, status_height = 280, 150
         self.status_card_zone = pygame.Rect(
@@ -511,6 +1066,18 @@ class CombatScreen:
             status_height
         )
         
+        # Constantes de layout derivadas (resolução fixa, calculadas uma vez)
+        self._screen_center = (self.width // 2, self.height // 2)
+        self._hand_slot_width = self.player_hand_zone.width // 5
+        self._hand_slot_height = self.player_hand_zone.height - 20
+        self._hand_slot_y = self.player_hand_zone.top + 10
+        self._player_anchor = (self.width // 2, self.player_hand_zone.top - 10)
+        self._enemy_hp_bar_rect = pygame.Rect(0, 0, 120, 8)  # Só x/y mudam no draw
+        # Status card: coluna do texto/barras, largura das barras e y da primeira linha
+        self._status_text_x = self.status_card_zone.x + 15
+        self._status_bar_width = self.status_card_zone.width - 30
+        self._status_rows_y = self.status_card_zone.y + 45
+        
         # Cache dos sprites escalados
         self.enemy_sprites = {}
         self.player_sprite = None
@@ -523,63 +1090,52 @@ class CombatScreen:
         
     def _load_and_scale_enemy_sprites(self):
         """Carrega e escala sprites melhorados dos inimigos para a zona apropriada."""
-        if not hasattr(self.combat_engine, 'enemies'):
+        if not self._engine_has_enemies:
             return
             
-        max_enemy_height = int(self.enemy_zone.height * 0.7)  # 70% da zona
+        max_enemy_height = self._enemy_target_h
         
+        # 1ª passada: resolver tipo e caminho do sprite melhorado de cada inimigo
+        entries = []
         for i, enemy in enumerate(self.combat_engine.enemies):
-            # Mapear tipos de inimigo para sprites melhorados
-            enemy_type_mapping = {
-                'goblin': 'goblin_sprite_enhanced.png',
-                'orc': 'orc_sprite_enhanced.png', 
-                'skeleton': 'skeleton_sprite_enhanced.png',
-                'wizard': 'dark_mage_sprite_enhanced.png',
-                'dark_mage': 'dark_mage_sprite_enhanced.png',
-                'dragon': 'dragon_sprite_enhanced.png'
-            }
-            
-            # Fallback para sprites originais se os melhorados não existirem
-            enemy_type_fallback = {
-                'goblin': 'goblin_scout_sprite',
-                'orc': 'orc_berserker_sprite', 
-                'skeleton': 'skeleton_archer_sprite',
-                'wizard': 'dark_mage_sprite',
-                'dragon': 'dragon_sprite'
-            }
-            
-            # Converter enum para string
-            if hasattr(enemy.enemy_type, 'value'):
-                enemy_type_str = enemy.enemy_type.value.lower()
-            elif hasattr(enemy.enemy_type, 'name'):
-                enemy_type_str = enemy.enemy_type.name.lower()
-            else:
-                enemy_type_str = str(enemy.enemy_type).lower()
+            enemy_type_str = _enemy_type_str(enemy)
                 
+            enhanced_sprite_filename = _ENEMY_SPRITE_FILES.get(enemy_type_str)
+            enhanced_sprite_path = None
+            if enhanced_sprite_filename:
+                enhanced_sprite_path = self._generated_path(enhanced_sprite_filename)
+            entries.append((i, enemy, enemy_type_str, enhanced_sprite_path))
+            
+        # Ler em paralelo só o que ainda não está no cache de sprites escalados
+        preloaded = read_files_parallel(
+            path for _, _, _, path in entries
+            if path and (path, max_enemy_height) not in _SCALED_SPRITE_CACHE
+        )
+        
+        for i, enemy, enemy_type_str, enhanced_sprite_path in entries:
             # Usar índice como ID se não existir
             enemy_id = getattr(enemy, 'id', f"enemy_{i}")
             
             # Tentar carregar sprite melhorado primeiro
-            enhanced_sprite_filename = enemy_type_mapping.get(enemy_type_str)
             sprite_loaded = False
             
-            if enhanced_sprite_filename:
-                enhanced_sprite_path = Path("assets/generated") / enhanced_sprite_filename
-                if enhanced_sprite_path.exists():
-                    logger.info(f"🎨 Carregando sprite melhorado: {enhanced_sprite_path}")
-                    original_sprite = pygame.image.load(str(enhanced_sprite_path)).convert_alpha()
-                    scaled_sprite = fit_height(original_sprite, max_enemy_height)
-                    self.enemy_sprites[enemy_id] = scaled_sprite
-                    sprite_loaded = True
-                    logger.info(f"✅ Sprite melhorado carregado para {enemy_type_str}")
+            if enhanced_sprite_path and (
+                    enhanced_sprite_path in preloaded
+                    or (enhanced_sprite_path, max_enemy_height) in _SCALED_SPRITE_CACHE):
+                logger.info(f"🎨 Carregando sprite melhorado: {enhanced_sprite_path}")
+                self.enemy_sprites[enemy_id] = _load_scaled_sprite(
+                    enhanced_sprite_path, max_enemy_height, preloaded.get(enhanced_sprite_path)
+                )
+                sprite_loaded = True
+                logger.info(f"✅ Sprite melhorado carregado para {enemy_type_str}")
             
             # Fallback para sprite original se melhorado não existe
             if not sprite_loaded:
-                fallback_sprite_key = enemy_type_fallback.get(enemy_type_str, f"{enemy_type_str}_sprite")
+                fallback_sprite_key = _ENEMY_SPRITE_FALLBACK_KEYS.get(enemy_type_str, f"{enemy_type_str}_sprite")
                 
                 if fallback_sprite_key in self.assets:
                     original_sprite = self.assets[fallback_sprite_key]
-                    scaled_sprite = fit_height(original_sprite, max_enemy_height)
+                    scaled_sprite = _fit_asset(fallback_sprite_key, original_sprite, max_enemy_height)
                     self.enemy_sprites[enemy_id] = scaled_sprite
                     logger.info(f"✅ Sprite original carregado para {enemy_type_str}: {fallback_sprite_key}")
                 else:
@@ -597,19 +1153,17 @@ class CombatScreen:
             character_id = getattr(player, 'character_class', 'knight').lower()
             
             # Verificar sprites melhorados primeiro
-            enhanced_sprite_paths = [
-                f"assets/generated/{character_id}_sprite_enhanced.png",
-                f"assets/generated/{character_id}_transparent.png",
-                f"assets/generated/{character_id}_sprite.png"
+            enhanced_sprite_files = [
+                f"{character_id}_sprite_enhanced.png",
+                f"{character_id}_transparent.png",
+                f"{character_id}_sprite.png"
             ]
             
-            for sprite_path in enhanced_sprite_paths:
-                if Path(sprite_path).exists():
+            for sprite_file in enhanced_sprite_files:
+                sprite_path = self._generated_path(sprite_file)
+                if sprite_path:
                     logger.info(f"🎭 Carregando sprite melhorado para combate: {sprite_path}")
-                    sprite_image = pygame.image.load(sprite_path).convert_alpha()
-                    
-                    target_height = int(self.height * 0.35)
-                    self.player_sprite = fit_height(sprite_image, target_height)
+                    self.player_sprite = _load_scaled_sprite(sprite_path, self._player_target_h)
                     
                     logger.info("✅ Sprite melhorado do personagem carregado para combate")
                     return
@@ -618,10 +1172,13 @@ class CombatScreen:
             logger.warning(f"⚠️ Erro ao carregar sprite melhorado: {e}")
         
         # Fallback: usar sprite original se disponível
-        player_sprite = self.get_asset("knight", "sprite") or self.get_asset("player", "sprite")
+        player_sprite_key = "sprite/knight"
+        player_sprite = self.get_asset("knight", "sprite")
+        if not player_sprite:
+            player_sprite_key = "sprite/player"
+            player_sprite = self.get_asset("player", "sprite")
         if player_sprite:
-            target_height = int(self.height * 0.35)
-            self.player_sprite = fit_height(player_sprite, target_height)
+            self.player_sprite = _fit_asset(player_sprite_key, player_sprite, self._player_target_h)
             logger.info("Sprite original carregado como fallback")
         else:
             logger.warning("❌ Nenhum sprite do jogador encontrado")
@@ -645,12 +1202,10 @@ class CombatScreen:
         # Aplicar texturas IA nos botões se disponíveis
         button_texture = self.get_asset("mystical", "button")
         if button_texture:
-            scaled_texture = pygame.transform.scale(button_texture, (button_width, button_height))
-            self.end_turn_button.textures = {
-                "normal": scaled_texture,
-                "hover": apply_glow_effect(scaled_texture, (138, 43, 226), 3),  # Roxo
-                "pressed": scaled_texture
-            }
+            self.end_turn_button.textures = _button_textures(
+                "button/mystical", button_texture, (button_width, button_height),
+                (138, 43, 226), 3  # Roxo
+            )
         
         logger.info("Botões configurados com texturas IA")
         
@@ -661,57 +1216,52 @@ class CombatScreen:
             
     # ========== P2-6: HAND LOGIC ==========
     
+    def _draw_n(self, n: int, pool: Tuple[dict, ...] = _AVAILABLE_CARDS, unique: bool = False,
+                reorganize: bool = True) -> List[dict]:
+        """
+        Compra até ``n`` cartas aleatórias do pool, respeitando MAX_HAND_SIZE.
+        
+        Args:
+            n: Quantidade desejada
+            pool: Cartas disponíveis para sorteio
+            unique: Sortear sem repetição (mão inicial)
+            reorganize: Reposicionar a mão ao final (desnecessário se ela já
+                estava compactada, pois cada carta nasce no seu slot final)
+            
+        Returns:
+            Dados das cartas compradas (vazio se a mão está cheia)
+        """
+        n = min(n, MAX_HAND_SIZE - len(self.player_hand))
+        if n <= 0:
+            return []
+            
+        if unique:
+            drawn = self._rng.sample(pool, min(n, len(pool)))
+        else:
+            drawn = [self._rng.choice(pool) for _ in range(n)]
+            
+        for card_data in drawn:
+            self._add_card_to_hand(card_data, len(self.player_hand))
+        if reorganize:
+            self._reorganize_hand()  # Reposition all cards (uma vez por compra)
+        return drawn
+        
     def draw_initial_hand(self):
         """P2-6: Draw initial 5 cards para iniciar o combate."""
         self.player_hand.clear()
-        
-        # Simular deck de cartas (expandir no futuro)
-        available_cards = [
-            {"name": "Fireball", "cost": 3, "damage": 4, "type": "spell"},
-            {"name": "Sword Strike", "cost": 2, "damage": 3, "type": "attack"},
-            {"name": "Heal", "cost": 2, "heal": 3, "type": "heal"},
-            {"name": "Lightning Bolt", "cost": 4, "damage": 5, "type": "spell"},
-            {"name": "Shield Block", "cost": 1, "defense": 2, "type": "defense"},
-            {"name": "Ice Shard", "cost": 2, "damage": 2, "type": "spell"},
-            {"name": "Power Strike", "cost": 3, "damage": 4, "type": "attack"},
-            {"name": "Minor Heal", "cost": 1, "heal": 2, "type": "heal"}
-        ]
-        
-        # Draw 5 cartas aleatórias
-        import random
-        selected_cards = random.sample(available_cards, min(5, len(available_cards)))
-        
-        for i, card_data in enumerate(selected_cards):
-            self._add_card_to_hand(card_data, i)
-            
+        self._hovered_card_idx = -1
+        self._draw_n(INITIAL_HAND_SIZE, unique=True, reorganize=False)
         logger.info(f"P2-6: Drew initial hand of {len(self.player_hand)} cards")
         
-    def draw_card_from_deck(self, animate=True):
+    def draw_card_from_deck(self, animate=True, reorganize=True):
         """Sprint 2: Draw a single card from deck with animation."""
-        if len(self.player_hand) >= 10:  # Max hand size
+        drawn = self._draw_n(1, reorganize=reorganize)
+        if not drawn:
             logger.warning("Hand is full, cannot draw card")
             return None
             
-        available_cards = [
-            {"name": "Fireball", "cost": 3, "damage": 4, "type": "spell"},
-            {"name": "Sword Strike", "cost": 2, "damage": 3, "type": "attack"},
-            {"name": "Heal", "cost": 2, "heal": 3, "type": "heal"},
-            {"name": "Lightning Bolt", "cost": 4, "damage": 5, "type": "spell"},
-            {"name": "Shield Block", "cost": 1, "defense": 2, "type": "defense"},
-            {"name": "Ice Shard", "cost": 2, "damage": 2, "type": "spell"},
-            {"name": "Power Strike", "cost": 3, "damage": 4, "type": "attack"},
-            {"name": "Minor Heal", "cost": 1, "heal": 2, "type": "heal"}
-        ]
-        
-        import random
-        new_card = random.choice(available_cards)
-        position = len(self.player_hand)
-        
-        self._add_card_to_hand(new_card, position)
-        self._reorganize_hand()  # Reposition all cards
-        
-        logger.info(f"Drew {new_card['name']} from deck")
-        return new_card
+        logger.info(f"Drew {drawn[0]['name']} from deck")
+        return drawn[0]
         
     def discard_card(self, card_index: int, animate=True):
         """Sprint 2: Discard a card from hand with animation."""
@@ -719,7 +1269,7 @@ class CombatScreen:
             logger.warning(f"Invalid card index for discard: {card_index}")
             return False
             
-        discarded_card = self.player_hand.pop(card_index)
+        discarded_card = self._pop_hand_card(card_index)
         
         # Trigger discard animation if card has sprite
         if animate and discarded_card.get("sprite"):
@@ -731,23 +1281,6 @@ class CombatScreen:
         logger.info(f"Discarded {discarded_card['data']['name']}")
         return True
         
-    def _reorganize_hand(self):
-        """Sprint 2: Reorganize hand positions after draw/discard."""
-        for i, card in enumerate(self.player_hand):
-            slot_width = self.player_hand_zone.width // max(5, len(self.player_hand))
-            slot_x = self.player_hand_zone.left + i * slot_width + 10
-            slot_y = self.player_hand_zone.top + 10
-            
-            # Update card position
-            card["original_pos"] = (slot_x, slot_y)
-            card["slot_index"] = i
-            card["rect"].x = slot_x
-            card["rect"].y = slot_y
-            
-            # Update sprite position if available
-            if card.get("sprite"):
-                card["sprite"].set_position((slot_x, slot_y))
-                
     def get_hand_size(self) -> int:
         """Sprint 2: Get current hand size."""
         return len(self.player_hand)
@@ -764,18 +1297,18 @@ class CombatScreen:
         
     def _add_card_to_hand(self, card_data: dict, position: int):
         """P2-6: Adiciona uma carta na mão na posição especificada com CardSprite."""
-        slot_width = self.player_hand_zone.width // 5
-        slot_height = self.player_hand_zone.height - 20
+        slot_width = self._hand_slot_width
+        slot_height = self._hand_slot_height
         
         slot_x = self.player_hand_zone.left + position * slot_width + 10
-        slot_y = self.player_hand_zone.top + 10
+        slot_y = self._hand_slot_y
         
         # P2: Criar CardSprite para animações avançadas
         from .card_sprite import CardSprite
         card_sprite = None
         try:
-            # Sprint 2: Create card surface without text to avoid duplication
-            card_surface = self._create_card_surface(card_data, slot_width - 20, slot_height, include_text=False)
+            # Nome, custo e efeitos são estáticos: surface já composta (cacheada por template)
+            card_surface = self._create_card_face(card_data, slot_width - 20, slot_height)
             card_sprite = CardSprite(card_surface, (slot_x, slot_y))  # Posição como tupla
         except Exception as e:
             logger.warning(f"Failed to create CardSprite: {e}")
@@ -789,48 +1322,113 @@ class CombatScreen:
             "slot_index": position,
             # P2: CardSprite integration
             "sprite": card_sprite,
-            # P2: Propriedades de animação aprimoradas (fallback)
-            "hover_offset_y": 0,
-            "target_hover_y": 0,
-            "scale": 1.0,
-            "target_scale": 1.0,
-            "glow_alpha": 0,
-            "target_glow_alpha": 0,
-            "rotation": 0,
-            "target_rotation": 0,
-            "animation_time": 0,
-            "bob_offset": position * 0.5,
-            # P2: Card draw animation
-            "draw_animation": True,
-            "draw_progress": 0.0
         }
+        
+        # P2: Propriedades de animação aprimoradas (fallback) ficam no estado SoA
+        index = len(self.player_hand)
+        if index >= len(self._card_anim["scale"]):
+            self._grow_card_anim()
+        anim = self._card_anim
+        for values in anim.values():
+            values[index] = 0
+        anim["scale"][index] = 1.0
+        anim["target_scale"][index] = 1.0
+        anim["bob_offset"][index] = position * 0.5
+        
         self.player_hand.append(card)
+        self._sync_card_rects()
+        
+    @staticmethod
+    def _new_card_anim(capacity: int) -> Dict[str, np.ndarray]:
+        """Arrays paralelos (um por campo) para a animação das cartas da mão."""
+        anim = {name: np.zeros(capacity, dtype=np.float32) for name in _CARD_ANIM_FIELDS}
+        anim["scale"].fill(1.0)
+        anim["target_scale"].fill(1.0)
+        # Espelho vetorizado de card["is_hovered"] / card["is_selected"]
+        anim["hovered"] = np.zeros(capacity, dtype=bool)
+        anim["selected"] = np.zeros(capacity, dtype=bool)
+        return anim
+        
+    def _set_card_anim(self, anim: Dict[str, np.ndarray]):
+        """Instala o estado SoA da mão e a tupla de arrays do kernel (montada uma vez)."""
+        self._card_anim = anim
+        self._card_anim_args = tuple(anim[name] for name in CARD_ANIM_KERNEL_ARRAYS)
+        self._card_anim_views: Tuple[int, Dict[str, np.ndarray]] = (-1, {})
+        
+    def _grow_card_anim(self):
+        """Dobra a capacidade do estado de animação da mão, preservando os valores."""
+        old = self._card_anim
+        capacity = len(old["scale"])
+        anim = self._new_card_anim(capacity * 2)
+        for name, values in old.items():
+            anim[name][:capacity] = values
+        self._set_card_anim(anim)
+            
+    def _pop_hand_card(self, index: int) -> dict:
+        """Remove a carta ``index`` da mão, deslocando junto seu estado de animação."""
+        n = len(self.player_hand)
+        for values in self._card_anim.values():
+            values[index:n - 1] = values[index + 1:n]
+            
+        # Manter o índice de hover apontando para a mesma carta
+        if index == self._hovered_card_idx:
+            self._hovered_card_idx = -1
+        elif index < self._hovered_card_idx:
+            self._hovered_card_idx -= 1
+        return self.player_hand.pop(index)
+        
+    def _sync_card_rects(self):
+        """Atualiza a lista de rects usada no hit-testing da mão."""
+        self._card_rects = [card["rect"] for card in self.player_hand]
+        
+    def _card_cache_get(self, key: Tuple) -> Optional[pygame.Surface]:
+        """Busca surface de carta composta no LRU compartilhado."""
+        cache = CombatScreen._CARD_BG_CACHE
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+        return surface
+        
+    def _card_cache_put(self, key: Tuple, surface: pygame.Surface) -> pygame.Surface:
+        """Guarda surface de carta composta no LRU compartilhado (convertida para display)."""
+        cache = CombatScreen._CARD_BG_CACHE
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        cache[key] = surface
+        if len(cache) > CARD_BG_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
         
     def _create_card_surface(self, card_data: dict, width: int, height: int, include_text: bool = True) -> pygame.Surface:
         """P2: Cria surface visual para carta."""
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        
-        # Background da carta
-        card_color = {
-            "spell": (120, 80, 200),     # Roxo para spells
-            "attack": (200, 80, 80),     # Vermelho para ataques
-            "heal": (80, 200, 120),      # Verde para cura
-            "defense": (80, 120, 200)    # Azul para defesa
-        }.get(card_data.get("type", "spell"), (150, 150, 150))
-        
-        # Desenhar background com gradiente simples
-        pygame.draw.rect(surface, card_color, surface.get_rect(), border_radius=8)
-        pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), width=2, border_radius=8)
+        # Composição é cacheada por template de carta (o pool é fixo); cada carta recebe uma cópia
+        text_key = _card_text_key(card_data) if include_text else None
+        key = (card_data.get("type", "spell"), width, height, text_key)
+        cached = self._card_cache_get(key)
+        if cached is not None:
+            return cached.copy()
+            
+        if include_text:
+            surface = self._create_card_surface(card_data, width, height, include_text=False)
+        else:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            
+            # Background da carta
+            card_color = _CARD_TYPE_COLORS.get(key[0], _CARD_DEFAULT_COLOR)
+            
+            # Desenhar background com gradiente simples
+            pygame.draw.rect(surface, card_color, surface.get_rect(), border_radius=8)
+            pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), width=2, border_radius=8)
         
         # Sprint 2: Only include text if requested (for CardSprite, we skip text to avoid duplication)
         if include_text and hasattr(pygame, 'font') and pygame.font.get_init():
-            font = pygame.font.Font(None, 24)
+            font = self._get_font(24)
             text = font.render(card_data["name"], True, (255, 255, 255))
             text_rect = text.get_rect(centerx=width//2, y=10)
             surface.blit(text, text_rect)
             
             # Renderizar cost/damage
-            info_font = pygame.font.Font(None, 20)
+            info_font = self._get_font(20)
             cost_text = info_font.render(f"Cost: {card_data.get('cost', 0)}", True, (255, 255, 255))
             surface.blit(cost_text, (5, height - 40))
             
@@ -841,35 +1439,43 @@ class CombatScreen:
                 heal_text = info_font.render(f"Heal: {card_data['heal']}", True, (255, 255, 255))
                 surface.blit(heal_text, (5, height - 20))
         
-        return surface
+        return self._card_cache_put(key, surface).copy()
+        
+    def _create_card_face(self, card_data: dict, width: int, height: int) -> pygame.Surface:
+        """
+        Surface da carta na mão: background + info (nome, custo, efeitos) já compostos.
+        
+        Retorna a surface do cache sem copiar; não modificar (CardSprite faz
+        sua própria cópia).
+        """
+        key = ("face", width, height, _card_text_key(card_data))
+        cached = self._card_cache_get(key)
+        if cached is None:
+            surface = self._create_card_surface(card_data, width, height, include_text=False)
+            self._draw_card_info(surface, card_data, surface.get_rect())
+            cached = self._card_cache_put(key, surface)
+        return cached
+        
+    def _hand_index(self, card: dict) -> Optional[int]:
+        """Índice da carta na mão por identidade (evita comparar dicts campo a campo)."""
+        return next((i for i, c in enumerate(self.player_hand) if c is card), None)
         
     def discard_card(self, card: dict):
         """P2-6: Descarta uma carta da mão."""
-        if card in self.player_hand:
-            self.player_hand.remove(card)
+        idx = self._hand_index(card)
+        if idx is not None:
+            self._pop_hand_card(idx)
             self._reorganize_hand()
             logger.info(f"P2-6: Discarded {card['data']['name']}")
             
     def draw_card(self) -> bool:
-        """P2-6: Compra uma carta se há espaço na mão (máx 5)."""
-        if len(self.player_hand) >= 5:
+        """P2-6: Compra uma carta básica se há espaço na mão (máx MAX_HAND_SIZE)."""
+        drawn = self._draw_n(1, _BASIC_CARDS)
+        if not drawn:
             logger.warning("P2-6: Cannot draw card - hand is full")
             return False
             
-        # Simular draw de carta aleatória
-        available_cards = [
-            {"name": "Fireball", "cost": 3, "damage": 4, "type": "spell"},
-            {"name": "Sword Strike", "cost": 2, "damage": 3, "type": "attack"},
-            {"name": "Heal", "cost": 2, "heal": 3, "type": "heal"},
-            {"name": "Lightning Bolt", "cost": 4, "damage": 5, "type": "spell"},
-            {"name": "Shield Block", "cost": 1, "defense": 2, "type": "defense"}
-        ]
-        
-        import random
-        new_card = random.choice(available_cards)
-        self._add_card_to_hand(new_card, len(self.player_hand))
-        
-        logger.info(f"P2-6: Drew {new_card['name']} (hand size: {len(self.player_hand)})")
+        logger.info(f"P2-6: Drew {drawn[0]['name']} (hand size: {len(self.player_hand)})")
         return True
         
     def end_turn_draw(self):
@@ -903,8 +1509,29 @@ class CombatScreen:
             panel_height
         )
         
-        # Criar surface do painel com alpha
-        self.player_panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        # Barras de HP e mana: no painel (chrome) e na tela (fills por frame)
+        bar_width = panel_width // 2 - 20
+        self._player_panel_bars = (pygame.Rect(10, 15, bar_width, 12),
+                                   pygame.Rect(panel_width // 2 + 10, 15, bar_width, 12))
+        self._player_panel_bars_screen = tuple(
+            bar.move(self.player_panel_rect.topleft) for bar in self._player_panel_bars
+        )
+        self._player_panel_bottom_y = self.player_panel_rect.bottom - 25
+        
+    def _setup_chrome(self):
+        """
+        Pré-compõe os painéis estáticos da interface em uma única surface.
+        
+        Overlay da zona de inimigos e painel da mão nunca mudam durante o
+        combate, então são desenhados uma vez e blitados em uma só chamada.
+        """
+        self._chrome_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        
+        # Overlay escuro da zona de inimigos (55% opacidade)
+        self._chrome_surface.fill((0, 0, 0, 140), self.enemy_zone)
+        
+        # Painel azul-escuro translúcido da mão
+        self._chrome_surface.fill((30, 40, 90, 200), self.player_hand_zone)
         
     def _generate_background(self):
         """Gera background dinâmico baseado no tipo de inimigo predominante e personagem."""
@@ -933,54 +1560,22 @@ class CombatScreen:
     
     def _get_enemy_specific_background(self):
         """Obtém background específico baseado no tipo de inimigo predominante."""
-        if not hasattr(self.combat_engine, 'enemies') or not self.combat_engine.enemies:
+        if not self._engine_has_enemies or not self.combat_engine.enemies:
             return None
             
-        # Mapear tipos de inimigo para backgrounds específicos
-        enemy_bg_mapping = {
-            'goblin': 'combat_bg_goblin_cave.png',
-            'orc': 'combat_bg_orc_camp.png', 
-            'skeleton': 'combat_bg_skeleton_crypt.png',
-            'dragon': 'combat_bg_dragon_lair.png',
-            'wizard': 'combat_bg_dark_tower.png',
-            'dark_mage': 'combat_bg_dark_tower.png'
-        }
-        
-        # Contar tipos de inimigos para encontrar o predominante
-        enemy_counts = {}
-        for enemy in self.combat_engine.enemies:
-            # Converter enum para string
-            if hasattr(enemy.enemy_type, 'value'):
-                enemy_type_str = enemy.enemy_type.value.lower()
-            elif hasattr(enemy.enemy_type, 'name'):
-                enemy_type_str = enemy.enemy_type.name.lower()
-            else:
-                enemy_type_str = str(enemy.enemy_type).lower()
-                
-            enemy_counts[enemy_type_str] = enemy_counts.get(enemy_type_str, 0) + 1
+        # Contar tipos de inimigos para encontrar o predominante (uma passada)
+        enemy_counts = Counter(_enemy_type_str(enemy) for enemy in self.combat_engine.enemies)
         
         # Encontrar tipo predominante
         if enemy_counts:
-            predominant_type = max(enemy_counts, key=enemy_counts.get)
-            bg_filename = enemy_bg_mapping.get(predominant_type)
-            
-            if bg_filename:
-                bg_path = Path("assets/generated") / bg_filename
-                if bg_path.exists():
-                    logger.info(f"🎨 Carregando background do inimigo: {bg_path}")
-                    background = pygame.image.load(str(bg_path)).convert()
-                    
-                    # Redimensionar para fit screen
-                    if background.get_size() != (self.width, self.height):
-                        background = pygame.transform.scale(background, (self.width, self.height))
-                    
-                    # Aplicar overlay sutil para atmosfera de combate
-                    overlay = pygame.Surface((self.width, self.height))
-                    overlay.set_alpha(60)  # Overlay mais sutil
-                    overlay.fill((80, 0, 0))  # Tom avermelhado para combate
-                    background.blit(overlay, (0, 0))
-                    
-                    return background
+            predominant_type = enemy_counts.most_common(1)[0][0]
+            bg_filename = _ENEMY_BACKGROUNDS.get(predominant_type)
+            
+            bg_path = self._generated_path(bg_filename) if bg_filename else None
+            if bg_path:
+                logger.info(f"🎨 Carregando background do inimigo: {bg_path}")
+                # Overlay sutil avermelhado para atmosfera de combate
+                return _load_background(bg_path, (self.width, self.height), (80, 0, 0), 60)
         
         return None
     
@@ -991,61 +1586,54 @@ class CombatScreen:
             player = getattr(self.combat_engine, 'player', None)
             character_id = getattr(player, 'character_class', 'knight').lower()
             
-            # Verificar backgrounds melhorados dos personagens (novos backgrounds únicos)
-            character_bg_paths = [
-                f"assets/generated/{character_id}_bg_throne_room.png" if character_id == "knight" else None,
-                f"assets/generated/{character_id}_bg_sanctum.png" if character_id == "wizard" else None,
-                f"assets/generated/{character_id}_bg_lair.png" if character_id == "assassin" else None,
-                f"assets/generated/{character_id}_bg_hd_3440x1440.png",
-                f"assets/generated/{character_id}_bg.png"
-            ]
-            
-            # Filtrar None values
-            character_bg_paths = [path for path in character_bg_paths if path]
-            
-            for bg_path in character_bg_paths:
-                if Path(bg_path).exists():
-                    logger.info(f"🎨 Carregando background do personagem: {bg_path}")
-                    background = pygame.image.load(bg_path).convert()
-                    
-                    # Redimensionar para fit screen se necessário
-                    if background.get_size() != (self.width, self.height):
-                        background = pygame.transform.scale(background, (self.width, self.height))
-                    
-                    # Aplicar overlay sutil para atmosfera de combate
-                    overlay = pygame.Surface((self.width, self.height))
-                    overlay.set_alpha(40)  # Overlay bem sutil para personagem
-                    overlay.fill((60, 60, 60))  # Tom neutro
-                    background.blit(overlay, (0, 0))
-                    
-                    return background
-                    
+            bg_path = self._resolve_character_bg_path(character_id)
+            if bg_path:
+                logger.info(f"🎨 Carregando background do personagem: {bg_path}")
+                # Overlay bem sutil, em tom neutro, para o personagem
+                return _load_background(bg_path, (self.width, self.height), (60, 60, 60), 40)
+                
         except Exception as e:
             logger.warning(f"⚠️ Erro ao carregar background do personagem: {e}")
         
         return None
     
+    def _resolve_character_bg_path(self, character_id: str) -> Optional[str]:
+        """Primeiro background existente do personagem; o resultado encontrado é memorizado."""
+        cached = CombatScreen._CHARACTER_BG_PATHS.get(character_id)
+        if cached is not None:
+            return cached
+            
+        # Verificar backgrounds melhorados dos personagens (novos backgrounds únicos)
+        character_bg_files = [
+            f"{character_id}_bg_throne_room.png" if character_id == "knight" else None,
+            f"{character_id}_bg_sanctum.png" if character_id == "wizard" else None,
+            f"{character_id}_bg_lair.png" if character_id == "assassin" else None,
+            f"{character_id}_bg_hd_3440x1440.png",
+            f"{character_id}_bg.png"
+        ]
+        
+        # Filtrar None values e arquivos inexistentes
+        for name in character_bg_files:
+            bg_path = self._generated_path(name) if name else None
+            if bg_path:
+                CombatScreen._CHARACTER_BG_PATHS[character_id] = bg_path
+                return bg_path
+        # Ausência não é memorizada: o background pode ser gerado depois
+        return None
+        
     def _create_fallback_background(self):
         """Cria background fallback se nenhum específico for encontrado."""
         # Fallback: tentar background genérico
-        if "combat_bg" in self.assets:
-            self.background = self.assets["combat_bg"]
+        combat_bg = self.get_asset("combat_bg")
+        if combat_bg:
+            self.background = combat_bg
             # Redimensionar para fit screen se necessário
             if self.background.get_size() != (self.width, self.height):
                 self.background = pygame.transform.scale(self.background, (self.width, self.height))
         else:
-            # Criar background placeholder melhorado
-            self.background = pygame.Surface((self.width, self.height))
-            
-            # Gradiente medieval escuro
-            for y in range(self.height):
-                progress = y / self.height
-                # Cores mais ricas para combate
-                r = int(40 + progress * 20)  # Vermelho base
-                g = int(30 + progress * 15)  # Verde sutil
-                b = int(20 + progress * 25)  # Azul para profundidade
-                color = (r, g, b)
-                pygame.draw.line(self.background, color, (0, y), (self.width, y))
+            # Criar background placeholder melhorado: gradiente medieval escuro
+            # (compartilhado entre telas de combate na mesma resolução)
+            self.background = _fallback_gradient((self.width, self.height))
     
     def update(self, dt: float):
         """
@@ -1054,9 +1642,13 @@ class CombatScreen:
         Args:
             dt: Delta time em segundos
         """
-        # Atualizar posição do mouse para parallax
-        self.last_mouse_pos = self.mouse_pos
-        self.mouse_pos = pygame.mouse.get_pos()
+        # Posição do mouse vem dos eventos MOUSEMOTION (_handle_mouse_motion)
+        
+        # Pausado: nada anima, o último frame desenhado continua válido
+        if self.state == CombatState.PAUSED:
+            return
+            
+        self._refresh_player_view()
         
         # Atualizar sistema de animações
         animation_manager.update(dt)
@@ -1069,30 +1661,26 @@ class CombatScreen:
             enemy_anim.update(dt)
             
         # Sprint 2-b: Handle animation reset after attack
-        if hasattr(self, 'anim_reset_time') and self.anim_reset_time > 0:
+        if self.anim_reset_time > 0:
             self.anim_reset_time -= dt * 1000  # Convert to milliseconds
             if self.anim_reset_time <= 0:
                 # Reset to idle animation
                 try:
-                    from ..gameplay.animation import FrameAnimation, load_sprite_sheet
-                    knight_idle_frames = load_sprite_sheet("assets/ia/knight_idle_sheet.png", 10)
-                    if knight_idle_frames:
-                        self.player_animation = FrameAnimation(knight_idle_frames, fps=30, loop=True)
+                    idle_clip = _cached_clip("assets/ia/knight_idle_sheet.png", 10, loop=True)
+                    if idle_clip:
+                        self.player_animation = FrameAnimation(clip=idle_clip)
                     self.anim_reset_time = 0
                 except Exception as e:
                     logger.warning(f"Failed to reset player animation: {e}")
         
         # Sprint 2-b: Update particle system
-        if hasattr(self, 'particle_manager'):
-            self.particle_manager.update(dt)
+        self.particle_manager.update(dt)
         
         # P2: Atualizar animation manager integrado
-        if hasattr(self, 'animation_manager'):
-            self.animation_manager.update(dt)
+        self.animation_manager.update(dt)
         
         # Atualizar botões
-        if hasattr(self, 'end_turn_button'):
-            self.end_turn_button.update(dt)
+        self.end_turn_button.update(dt)
         
         # P1: Atualizar animações das cartas
         self._update_card_animations(dt)
@@ -1114,48 +1702,78 @@ class CombatScreen:
         # Atualizar estado do combate
         self._update_combat_state()
         
-    def _update_card_animations(self, dt: float):
-        """Atualiza animações avançadas das cartas - P1 implementação."""
-        for card in self.player_hand:
-            # Atualizar timer de animação
-            card["animation_time"] += dt
-            
-            # Efeito de "breathing" sutil para cartas não interagidas
-            if not card["is_hovered"] and not card["is_selected"] and not self.is_dragging:
-                bob_amplitude = 2.0  # pixels
-                bob_speed = 1.5 + card["bob_offset"]  # Velocidade ligeiramente diferente para cada carta
-                card["target_hover_y"] = math.sin(card["animation_time"] * bob_speed) * bob_amplitude
-            
-            # Animações de hover
-            if card["is_hovered"] and not self.is_dragging:
-                card["target_hover_y"] = -15  # Subir carta
-                card["target_scale"] = 1.08   # Escalar ligeiramente
-                card["target_glow_alpha"] = 100  # Brilho sutil
-                card["target_rotation"] = math.sin(card["animation_time"] * 3) * 1.5  # Leve oscilação
-            elif card["is_selected"]:
-                card["target_hover_y"] = -10
-                card["target_scale"] = 1.05
-                card["target_glow_alpha"] = 150
-                card["target_rotation"] = 0
+        # Marcar o frame (inteiro ou só as regiões em movimento) para redesenho
+        if not self._dirty:
+            regions = self._animating_regions()
+            if regions is None:
+                self._dirty = True
             else:
-                # Reset para estado normal
-                if not card.get("breathing_active", True):  # Manter breathing se não estiver interagindo
-                    card["target_hover_y"] = 0
-                card["target_scale"] = 1.0
-                card["target_glow_alpha"] = 0
-                card["target_rotation"] = 0
-            
-            # Suavização das animações (interpolação exponencial)
-            smooth_factor = 8.0
-            card["hover_offset_y"] += (card["target_hover_y"] - card["hover_offset_y"]) * dt * smooth_factor
-            card["scale"] += (card["target_scale"] - card["scale"]) * dt * smooth_factor
-            card["glow_alpha"] += (card["target_glow_alpha"] - card["glow_alpha"]) * dt * smooth_factor
-            card["rotation"] += (card["target_rotation"] - card["rotation"]) * dt * smooth_factor
-            
-            # Atualizar posição da carta baseada nas animações
-            original_x, original_y = card["original_pos"]
-            card["rect"].x = original_x
-            card["rect"].y = original_y + int(card["hover_offset_y"])
+                for rect in regions:
+                    self._add_dirty_region(rect)
+        
+    def _animating_regions(self) -> Optional[List[pygame.Rect]]:
+        """
+        Regiões da tela com elementos visuais ainda em movimento.
+        
+        Returns:
+            None se a cena inteira precisa ser redesenhada (transição de turno,
+            rajadas de partículas vivas); senão a lista, possivelmente vazia,
+            de regiões a atualizar
+        """
+        # Movimento do mouse já marca o frame como sujo em handle_event;
+        # emissores contínuos deixados no manager global não contam
+        if self.turn_transition_active or self.particle_manager.has_live_bursts():
+            return None
+            
+        regions = []
+        # Idles em loop nunca terminam: zonas de sprite só sujam quando o
+        # frame exibido muda
+        if self.player_animation:
+            player_frame = (self.player_animation, self.player_animation.current_frame)
+        else:
+            player_frame = animation_manager.get_current_frame("knight")
+        if player_frame != self._shown_player_frame:
+            self._shown_player_frame = player_frame
+            regions.append(self._player_redraw_zone)
+            
+        enemy_frames = ()
+        if self._engine_has_enemies:
+            enemy_frames = tuple(
+                animation_manager.get_current_frame(f"{self._get_enemy_anim_id(enemy)}_{i}")
+                for i, enemy in enumerate(self.combat_engine.enemies)
+            )
+        if enemy_frames != self._shown_enemy_frames:
+            self._shown_enemy_frames = enemy_frames
+            regions.append(self._enemy_redraw_zone)
+            
+        for card in self.player_hand:
+            card_sprite = card.get("sprite")
+            # Fallback sem sprite tem pulsing contínuo
+            if not card_sprite or card_sprite.is_animating():
+                regions.append(self._hand_hover_zone)
+                break
+                
+        return regions
+        
+    def _add_dirty_region(self, rect: pygame.Rect):
+        """Marca uma região para o próximo redesenho parcial (sem repetir)."""
+        if rect not in self._dirty_regions:
+            self._dirty_regions.append(rect)
+            
+    def _draw_regions(self, regions: List[pygame.Rect]):
+        """
+        Redesenha só as regiões dadas e envia apenas elas ao display.
+        
+        A cena é desenhada com clip em cada região, então as camadas
+        sobrepostas (background, chrome, sprites, cartas) continuam corretas,
+        mas os blits só escrevem os pixels de dentro da região.
+        """
+        screen = self.screen
+        for rect in regions:
+            screen.set_clip(rect)
+            self.draw()
+        screen.set_clip(None)
+        pygame.display.update(regions)
         
     def _update_combat_state(self):
         """Atualiza o estado interno do combate."""
@@ -1178,10 +1796,25 @@ class CombatScreen:
         """
         # Check for combat end states
         if self.state == CombatState.VICTORY:
+            self._dirty = True
             return "victory"
         elif self.state == CombatState.DEFEAT:
+            self._dirty = True
             return "defeat"
             
+        # Movimento sem drag só muda hovers: redesenha apenas as regiões que o
+        # cursor deixou ou alcançou (debug mostra a posição, então tela inteira)
+        if event.type == pygame.MOUSEMOTION and not self.is_dragging and not self.debug_mode:
+            previous = self.mouse_pos
+            self._handle_mouse_motion(event.pos)
+            for rect in self._hover_regions:
+                if rect.collidepoint(previous) or rect.collidepoint(event.pos):
+                    self._add_dirty_region(rect)
+            return None
+            
+        # Qualquer outro input pode mudar hover/seleção/estado
+        self._dirty = True
+            
         if event.type == pygame.QUIT:
             self.running = False
             return "exit"
@@ -1243,7 +1876,7 @@ class CombatScreen:
             return
                     
         # Verificar clique nos sprites de inimigos (para targeting)
-        if self.state == CombatState.TARGET_SELECTION and hasattr(self.combat_engine, 'enemies'):
+        if self.state == CombatState.TARGET_SELECTION and self._engine_has_enemies:
             # TODO: Implementar targeting de inimigos
             pass
                     
@@ -1258,7 +1891,8 @@ class CombatScreen:
         """Processa movimento do mouse - P1 drag & drop e hover effects."""
         x, y = pos
         
-        # Armazenar posição do mouse para futuros efeitos de hover
+        # Armazenar posição do mouse para futuros efeitos de hover (fonte única)
+        self.last_mouse_pos = self.mouse_pos
         self.mouse_pos = pos
         
         # P1: Processar drag se estiver arrastando uma carta
@@ -1274,8 +1908,7 @@ class CombatScreen:
         self.state = CombatState.CARD_SELECTION
         
         # Iniciar animação de tween para centro
-        screen_center = (self.width // 2, self.height // 2)
-        slot.start_center_tween(screen_center)
+        slot.start_center_tween(self._screen_center)
         
         # Se a carta não precisa de target, usar imediatamente
         if hasattr(self.selected_card, 'needs_target') and not self.selected_card.needs_target:
@@ -1330,64 +1963,54 @@ class CombatScreen:
             if not card_data:
                 # Fallback: try to get data from card object
                 card_data = getattr(card, '__dict__', {})
+                
+            # Engine legado aplica a carta inteira (dano, cura, custo): não duplicar aqui
+            if self._legacy_use_card is not None:
+                self._legacy_use_card(card, target)
+                return
+                
+            # Uma leitura de cada campo; carta sem efeito nem custo não faz nada
+            damage = card_data.get("damage")
+            heal_amount = card_data.get("heal")
+            cost = card_data.get("cost")
+            if not (damage or heal_amount or cost):
+                return
             
-            # Sprint 2-b: Enhanced TurnEngine integration with particles and animations
+            # Os efeitos visuais são disparados só aqui; o TurnEngine recebe
+            # particle_emitter=None para não emitir uma segunda vez
             if target:  # Card targets an enemy
-                target_pos = self._get_target_position(target)
-                
                 # Apply damage with particle effects
-                if card_data.get("damage"):
-                    damage = card_data["damage"]
+                if damage:
+                    target_pos = self._get_target_position(target)
                     
                     # Sprint 2-b: Trigger attack animation
                     self._trigger_attack_animation(card_data.get("type", "attack"))
                     
                     # Apply damage through TurnEngine
-                    actual_damage = self.turn_engine.apply_damage(
-                        target, damage, 
-                        particle_emitter=getattr(self, 'particle_manager', None),
-                        target_pos=target_pos
-                    )
+                    actual_damage = self.turn_engine.apply_damage(target, damage)
                     
                     # Sprint 2-b: Spawn hit particles
-                    if hasattr(self, 'particle_manager'):
-                        self.particle_manager.spawn_hit_particles(target_pos, count=15)
+                    self.particle_manager.spawn_hit_particles(target_pos, count=15)
                     
                     logger.info(f"Card dealt {actual_damage} damage to {getattr(target, 'name', 'target')}")
                     
-            else:  # Card affects player
-                player_pos = (400, 300)  # Default player position
+            elif heal_amount:  # Card affects player
+                # Sprint 2-b: Trigger heal animation
+                self._trigger_heal_animation()
                 
-                # Apply healing with particle effects
-                if card_data.get("heal"):
-                    heal_amount = card_data["heal"]
-                    
-                    # Sprint 2-b: Trigger heal animation
-                    self._trigger_heal_animation()
-                    
-                    actual_healing = self.turn_engine.apply_healing(
-                        self.turn_engine.player, heal_amount,
-                        particle_emitter=getattr(self, 'particle_manager', None),
-                        target_pos=player_pos
-                    )
-                    
-                    # Sprint 2-b: Spawn heal particles
-                    if hasattr(self, 'particle_manager'):
-                        heal_emitter = self.particle_manager.emitters[0] if self.particle_manager.emitters else None
-                        if heal_emitter:
-                            heal_emitter.emit_heal(count=8)
-                    
-                    logger.info(f"Card healed player for {actual_healing} HP")
+                actual_healing = self.turn_engine.apply_healing(self.turn_engine.player, heal_amount)
+                
+                # Sprint 2-b: Spawn heal particles
+                emitters = self.particle_manager.emitters
+                if emitters:
+                    emitters[0].emit_heal(count=8)
+                
+                logger.info(f"Card healed player for {actual_healing} HP")
                     
             # Deduct mana cost
-            if card_data.get("cost"):
-                cost = card_data["cost"]
+            if cost:
                 self.turn_engine.player.mana = max(0, self.turn_engine.player.mana - cost)
                 logger.debug(f"Spent {cost} mana, remaining: {self.turn_engine.player.mana}")
-            
-            # Fallback to combat engine if available
-            if hasattr(self.combat_engine, 'use_card'):
-                self.combat_engine.use_card(card, target)
                 
         except Exception as e:
             logger.error(f"Failed to apply card effect: {e}")
@@ -1396,7 +2019,7 @@ class CombatScreen:
         """Sprint 2: Get screen position for a target entity."""
         try:
             # Try to find target in enemy slots
-            if hasattr(self, 'enemy_slots') and hasattr(self.combat_engine, 'enemies'):
+            if hasattr(self, 'enemy_slots') and self._engine_has_enemies:
                 for i, enemy in enumerate(self.combat_engine.enemies):
                     if enemy == target and i < len(self.enemy_slots):
                         slot = self.enemy_slots[i]
@@ -1411,20 +2034,12 @@ class CombatScreen:
     def _trigger_attack_animation(self, card_type: str = "attack"):
         """Sprint 2-b: Trigger player attack animation with auto-reset."""
         try:
-            from ..gameplay.animation import FrameAnimation, load_sprite_sheet
-            
-            # Load attack animation based on card type
-            if card_type in ["spell", "magic"]:
-                # Use cast animation for spells
-                attack_frames = load_sprite_sheet("assets/ia/knight_cast_sheet.png", 8)
-                reset_duration = 250  # 250ms for cast
-            else:
-                # Use attack animation for physical attacks
-                attack_frames = load_sprite_sheet("assets/ia/knight_attack_sheet.png", 8)
-                reset_duration = 300  # 300ms for attack
+            # Load attack animation based on card type (cast para spells, ataque para o resto)
+            sheet_path, frame_count, reset_duration = _PLAYER_CARD_ACTIONS.get(card_type, _ATTACK_ACTION)
+            attack_clip = _cached_clip(sheet_path, frame_count, loop=False)
                 
-            if attack_frames:
-                self.player_animation = FrameAnimation(attack_frames, fps=30, loop=False)
+            if attack_clip:
+                self.player_animation = FrameAnimation(clip=attack_clip)
                 self.anim_reset_time = reset_duration  # Auto-reset to idle
                 logger.debug(f"Triggered {card_type} animation")
             else:
@@ -1436,13 +2051,12 @@ class CombatScreen:
     def _trigger_heal_animation(self):
         """Sprint 2-b: Trigger player heal animation."""
         try:
-            from ..gameplay.animation import FrameAnimation, load_sprite_sheet
-            
             # Try to load heal/cast animation
-            heal_frames = load_sprite_sheet("assets/ia/knight_cast_sheet.png", 8)
-            if heal_frames:
-                self.player_animation = FrameAnimation(heal_frames, fps=30, loop=False)
-                self.anim_reset_time = 250  # Auto-reset to idle after 250ms
+            sheet_path, frame_count, reset_duration = _CAST_ACTION
+            heal_clip = _cached_clip(sheet_path, frame_count, loop=False)
+            if heal_clip:
+                self.player_animation = FrameAnimation(clip=heal_clip)
+                self.anim_reset_time = reset_duration  # Auto-reset to idle after 250ms
                 logger.debug("Triggered heal animation")
             else:
                 logger.warning("No heal animation frames found")
@@ -1466,7 +2080,7 @@ class CombatScreen:
         
     def _trigger_attack_particles(self, position: Tuple[int, int]):
         """P2: Dispara partículas de ataque com efeitos aprimorados."""
-        if hasattr(self, 'particle_system'):
+        if self.particle_system is not None:
             # Usar o novo sistema P2 de partículas
             self.particle_system.emit_impact(position)
             self.particle_system.emit_damage(position)
@@ -1497,10 +2111,9 @@ class CombatScreen:
     
     def _get_card_at_position(self, pos: Tuple[int, int]) -> Optional[dict]:
         """Retorna a carta na posição especificada."""
-        for card in self.player_hand:
-            if card["rect"].collidepoint(pos):
-                return card
-        return None
+        self._probe_rect.topleft = pos
+        index = self._probe_rect.collidelist(self._card_rects)
+        return self.player_hand[index] if index != -1 else None
         
     def _start_drag(self, card: dict, pos: Tuple[int, int]):
         """Inicia o drag de uma carta."""
@@ -1513,7 +2126,7 @@ class CombatScreen:
         self.drag_offset = (pos[0] - card_center[0], pos[1] - card_center[1])
         
         # Marcar carta como selecionada visualmente
-        card["is_selected"] = True
+        self._set_card_selected(card, True)
         
     def _update_drag(self, pos: Tuple[int, int]):
         """Atualiza a posição da carta sendo arrastada."""
@@ -1522,8 +2135,10 @@ class CombatScreen:
             
         # Verificar se passou do threshold para iniciar drag
         if not self.is_dragging:
-            distance = ((pos[0] - self.drag_start_pos[0])**2 + (pos[1] - self.drag_start_pos[1])**2)**0.5
-            if distance >= self.drag_threshold:
+            # Comparação com a distância ao quadrado (sem sqrt)
+            dx = pos[0] - self.drag_start_pos[0]
+            dy = pos[1] - self.drag_start_pos[1]
+            if dx * dx + dy * dy >= self.drag_threshold * self.drag_threshold:
                 self.is_dragging = True
                 self.state = CombatState.CARD_SELECTION
                 
@@ -1573,21 +2188,50 @@ class CombatScreen:
             # Entrar em modo de targeting manual
             logger.info(f"Card {card['data']['name']} requires manual targeting")
             
+    def _enemy_layout(self, count: int) -> np.ndarray:
+        """
+        Centros x das colunas da zona de inimigos para ``count`` inimigos (cacheado).
+        
+        O array serve ao hit test vetorizado; a mesma tabela fica em
+        _enemy_centers_x como list[int] para os acessos por índice do draw.
+        """
+        if count != self._enemy_layout_count:
+            col_width = self.enemy_zone.width // count
+            self._enemy_center_x = (self.enemy_zone.left + col_width // 2
+                                    + np.arange(count, dtype=np.int32) * col_width)
+            self._enemy_centers_x = self._enemy_center_x.tolist()
+            self._enemy_layout_count = count
+        return self._enemy_center_x
+        
     def _get_enemy_at_position(self, pos: Tuple[int, int]) -> Optional[dict]:
         """Retorna o inimigo na posição especificada."""
-        if hasattr(self.combat_engine, 'enemies') and self.combat_engine.enemies:
-            # Calcular posições dos inimigos baseado no layout atual
-            enemies = self.combat_engine.enemies
-            col_width = self.enemy_zone.width // len(enemies)
-            
-            for i, enemy in enumerate(enemies):
-                enemy_x = self.enemy_zone.left + col_width // 2 + i * col_width
-                enemy_rect = pygame.Rect(enemy_x - 50, self.enemy_zone.y, 100, self.enemy_zone.height)
+        if self._engine_has_enemies and self.combat_engine.enemies:
+            zone = self.enemy_zone
+            px, py = pos
+            if not zone.top <= py < zone.bottom:
+                return None
                 
-                if enemy_rect.collidepoint(pos):
-                    return {"enemy": enemy, "index": i}
+            # Hitbox de 100px centrada em cada coluna, testada para todas de uma vez
+            enemies = self.combat_engine.enemies
+            offsets = px - self._enemy_layout(len(enemies))
+            hits = np.flatnonzero((offsets >= -50) & (offsets < 50))
+            if hits.size:
+                return self._enemy_ref(enemies, int(hits[0]))
         return None
         
+    def _enemy_ref(self, enemies: list, i: int) -> dict:
+        """
+        Dict {"enemy", "index"} do inimigo i, criado uma vez por layout.
+        
+        A lista é refeita só quando a lista de inimigos muda (tamanho ou
+        objeto na posição), então cliques repetidos devolvem o mesmo dict.
+        """
+        refs = self._enemy_refs
+        if len(refs) != len(enemies) or refs[i]["enemy"] is not enemies[i]:
+            refs = self._enemy_refs = [{"enemy": enemy, "index": index}
+                                       for index, enemy in enumerate(enemies)]
+        return refs[i]
+        
     def _use_card_on_enemy(self, card: dict, target: dict):
         """Usa carta diretamente em um inimigo."""
         try:
@@ -1622,122 +2266,161 @@ class CombatScreen:
             
     def _get_enemy_screen_position(self, enemy_index: int) -> Tuple[int, int]:
         """Retorna a posição na tela do inimigo especificado."""
-        if hasattr(self.combat_engine, 'enemies') and self.combat_engine.enemies:
-            enemies = self.combat_engine.enemies
-            col_width = self.enemy_zone.width // len(enemies)
-            enemy_x = self.enemy_zone.left + col_width // 2 + enemy_index * col_width
-            enemy_y = self.enemy_zone.centery
-            return (enemy_x, enemy_y)
+        if self._engine_has_enemies and self.combat_engine.enemies:
+            self._enemy_layout(len(self.combat_engine.enemies))
+            enemy_x = self._enemy_centers_x[enemy_index]
+            return (enemy_x, self.enemy_zone.centery)
         return (self.enemy_zone.centerx, self.enemy_zone.centery)
         
     def _remove_card_from_hand(self, card: dict):
         """Remove carta da mão do jogador."""
-        if card in self.player_hand:
-            self.player_hand.remove(card)
+        idx = self._hand_index(card)
+        if idx is not None:
+            self._pop_hand_card(idx)
             self._reorganize_hand()
             
     def _reorganize_hand(self):
         """Reorganiza as cartas na mão após remoção."""
-        slot_width = self.player_hand_zone.width // 5
-        slot_height = self.player_hand_zone.height - 20
+        slot_width = self._hand_slot_width
+        slot_y = self._hand_slot_y
+        left = self.player_hand_zone.left + 10
         
         for i, card in enumerate(self.player_hand):
-            slot_x = self.player_hand_zone.left + i * slot_width + 10
-            slot_y = self.player_hand_zone.top + 10
-            
-            card["rect"].x = slot_x
-            card["rect"].y = slot_y
-            card["original_pos"] = (slot_x, slot_y)
+            slot_pos = (left + i * slot_width, slot_y)
+            if card["original_pos"] == slot_pos:
+                continue  # Já está no slot final (ex.: recém-comprada)
+                
+            card["rect"].topleft = slot_pos
+            card["original_pos"] = slot_pos
             card["slot_index"] = i
             
+        self._sync_card_rects()
+        
     def _return_card_to_hand(self, card: dict):
         """Retorna carta para sua posição original na mão."""
         card["rect"].x, card["rect"].y = card["original_pos"]
-        card["is_selected"] = False
+        self._set_card_selected(card, False)
         
     def _select_card_simple(self, card: dict):
         """Seleciona carta com clique simples (sem drag)."""
         # Implementação simples - destacar carta selecionada
         for c in self.player_hand:
             c["is_selected"] = False
-        card["is_selected"] = True
+        self._card_anim["selected"].fill(False)
+        self._set_card_selected(card, True)
         self.selected_card = card
         logger.info(f"Selected card: {card['data']['name']}")
         
+    def _set_card_selected(self, card: dict, selected: bool):
+        """Marca seleção da carta no dict e no estado SoA da mão."""
+        card["is_selected"] = selected
+        idx = self._hand_index(card)
+        if idx is not None:
+            self._card_anim["selected"][idx] = selected
+            
     def _update_card_hover(self, pos: Tuple[int, int]):
         """Atualiza efeitos de hover nas cartas."""
-        for card in self.player_hand:
-            was_hovered = card["is_hovered"]
-            card["is_hovered"] = card["rect"].collidepoint(pos)
+        # Fora da zona da mão nenhuma carta pode estar sob o cursor
+        if self._hand_hover_zone.collidepoint(pos):
+            self._probe_rect.topleft = pos
+            hovered_index = self._probe_rect.collidelist(self._card_rects)
+        else:
+            hovered_index = -1
+            
+        previous = self._hovered_card_idx
+        if hovered_index == previous:
+            return
+            
+        # Só as cartas que mudaram de estado são tocadas
+        hand = self.player_hand
+        hovered = self._card_anim["hovered"]
+        if 0 <= previous < len(hand):
+            hand[previous]["is_hovered"] = False
+            hovered[previous] = False
+        if hovered_index >= 0:
+            card = hand[hovered_index]
+            card["is_hovered"] = True
+            hovered[hovered_index] = True
             
             # Log hover changes for debugging
-            if card["is_hovered"] and not was_hovered:
-                logger.debug(f"Hovering: {card['data']['name']}")
+            logger.debug(f"Hovering: {card['data']['name']}")
+        self._hovered_card_idx = hovered_index
                 
     def _update_card_animations(self, dt: float):
         """Sprint 2: Enhanced card animations using CardSprite system."""
-        import math
+        hand = self.player_hand
+        n = len(hand)
+        fallback = []
         
-        for card in self.player_hand:
+        for i, card in enumerate(hand):
             # Sprint 2: Use CardSprite if available
-            if card.get('sprite'):
+            card_sprite = card.get('sprite')
+            if card_sprite:
                 # CardSprite handles its own animations with enhanced pulsing
-                card_sprite = card['sprite']
                 card_sprite.update(self.mouse_pos, dt)
                 
-                # Sync position from CardSprite back to card rect
-                card["rect"] = card_sprite.rect.copy()
+                # Sync position from CardSprite back to card rect (in-place, mantém _card_rects válido)
+                card["rect"].update(card_sprite.rect)
             else:
-                # Fallback to original animation system (enhanced)
-                card["animation_time"] += dt
-                
-                # Enhanced hover effects
-                if card["is_hovered"] and not self.is_dragging:
-                    card["target_hover_y"] = -25  # More pronounced hover
-                    card["target_scale"] = 1.15   # Larger scale
-                    card["target_glow_alpha"] = 200  # Stronger glow
-                    card["target_rotation"] = 3   # More visible rotation
-                elif card["is_selected"]:
-                    card["target_hover_y"] = -15
-                    card["target_scale"] = 1.08
-                    card["target_glow_alpha"] = 120
-                    card["target_rotation"] = 1.5
-                else:
-                    card["target_hover_y"] = 0
-                    card["target_scale"] = 1.0
-                    card["target_glow_alpha"] = 0
-                    card["target_rotation"] = 0
-                    
-                # Smoother interpolation
-                ease_speed = 10.0
-                card["hover_offset_y"] += (card["target_hover_y"] - card["hover_offset_y"]) * dt * ease_speed
-                card["scale"] += (card["target_scale"] - card["scale"]) * dt * ease_speed
-                card["glow_alpha"] += (card["target_glow_alpha"] - card["glow_alpha"]) * dt * ease_speed
-                card["rotation"] += (card["target_rotation"] - card["rotation"]) * dt * ease_speed
-                
-                # P2: Efeito de "pulsing" mais sutil quando idle
-                if not card["is_hovered"] and not card["is_selected"]:
-                    # P2: Pulsing senoidal como especificado
-                    pulse_intensity = 3
-                    pulse_speed = 2.0
-                    time_offset = card["bob_offset"]
-                    pulse_offset = math.sin((card["animation_time"] + time_offset) * pulse_speed) * pulse_intensity
-                    card["hover_offset_y"] += pulse_offset
-                    
-                # P2: Animação de draw para cartas novas
-                if card.get("draw_animation", False):
-                    card["draw_progress"] = min(1.0, card["draw_progress"] + dt * 3.0)
-                    if card["draw_progress"] >= 1.0:
-                        card["draw_animation"] = False
-                        
-                # Atualizar posição do rect com offset
-                card["rect"].x = card["original_pos"][0]
-                card["rect"].y = card["original_pos"][1] + int(card["hover_offset_y"])
+                fallback.append(i)
                 
+        if not fallback:
+            return
+            
+        # Fallback to original animation system (enhanced), vetorizado sobre a mão toda
+        anim = self._card_anim
+        if update_card_anim_kernel is not None:
+            update_card_anim_kernel(*self._card_anim_args, bool(self.is_dragging), n, np.float32(dt))
+        else:
+            self._update_card_anim_numpy(n, dt)
+        
+        # Atualizar posição do rect com offset
+        offsets = anim["hover_y"][:n].astype(np.int32).tolist()  # Conversão em lote, sem escalares NumPy
+        for i in fallback:
+            card = hand[i]
+            original_x, original_y = card["original_pos"]
+            card["rect"].x = original_x
+            card["rect"].y = original_y + offsets[i]
+            
+    def _update_card_anim_numpy(self, n: int, dt: float):
+        """Caminho NumPy da animação da mão (quando Numba não está disponível)."""
+        # Views [:n] dos arrays, refeitas só quando o tamanho da mão muda
+        views_n, anim = self._card_anim_views
+        if views_n != n:
+            anim = {name: values[:n] for name, values in self._card_anim.items()}
+            self._card_anim_views = (n, anim)
+        hovered, selected = anim["hovered"], anim["selected"]
+        anim["anim_time"] += dt
+        
+        # Enhanced hover effects, sem branches (hover tem prioridade sobre seleção)
+        hover_active = hovered & (not self.is_dragging)
+        for name, (hover_value, selected_value, idle_value) in _CARD_ANIM_TARGETS:
+            anim[name][:] = np.where(hover_active, hover_value,
+                                     np.where(selected, selected_value, idle_value))
+        
+        # Smoother interpolation
+        ease = dt * 10.0
+        anim["hover_y"] += (anim["target_hover_y"] - anim["hover_y"]) * ease
+        anim["scale"] += (anim["target_scale"] - anim["scale"]) * ease
+        anim["glow"] += (anim["target_glow"] - anim["glow"]) * ease
+        anim["rotation"] += (anim["target_rotation"] - anim["rotation"]) * ease
+        
+        # P2: Efeito de "pulsing" senoidal mais sutil quando idle
+        # (seno vetorizado em um único buffer float32, somado só nas cartas idle)
+        idle = ~(hovered | selected)
+        pulse = anim["anim_time"] + anim["bob_offset"]
+        pulse *= 2.0
+        np.sin(pulse, out=pulse)
+        pulse *= 3.0
+        np.add(anim["hover_y"], pulse, out=anim["hover_y"], where=idle)
+        
+        # P2: Animação de draw para cartas novas
+        np.minimum(anim["draw_progress"] + dt * 3.0, 1.0, out=anim["draw_progress"])
+        
     def _reset_drag_state(self):
         """Reseta o estado de drag & drop."""
         if self.dragging_card:
-            self.dragging_card["is_selected"] = False
+            self._set_card_selected(self.dragging_card, False)
         self.dragging_card = None
         self.drag_start_pos = None
         self.is_dragging = False
@@ -1752,10 +2435,10 @@ class CombatScreen:
             self._start_turn_transition()
             
             # Sprint 2-b: Use TurnEngine for proper turn management
-            if hasattr(self, 'turn_engine'):
+            if self.turn_engine is not None:
                 # Process mini turn loop
                 game_continues = self.turn_engine.mini_turn_loop(
-                    particle_emitter=getattr(self, 'particle_manager', None)
+                    particle_emitter=self.particle_manager
                 )
                 
                 if not game_continues:
@@ -1777,8 +2460,7 @@ class CombatScreen:
                         logger.info(f"End turn: Drew {cards_drawn} new cards from deck")
                     else:
                         # Fallback: simple card draw
-                        if hasattr(self, 'draw_card_from_deck'):
-                            self.draw_card_from_deck(animate=True)
+                        self.draw_card_from_deck(animate=True)
             else:
                 # Fallback to combat engine
                 if hasattr(self.combat_engine, 'end_turn'):
@@ -1822,7 +2504,10 @@ class CombatScreen:
         # 1. Background IA escalado para tela
         self.screen.blit(self.background, (0, 0))
         
-        # 2. Zona de inimigos com overlay escuro + sprites
+        # Painéis estáticos (overlay de inimigos + painel da mão) em um blit
+        self.screen.blit(self._chrome_surface, (0, 0))
+        
+        # 2. Sprites de inimigos sobre o overlay escuro
         self._draw_enemy_zone()
         
         # 3. Sprite do jogador centralizado
@@ -1838,119 +2523,97 @@ class CombatScreen:
         self._draw_buttons()
         
         # 7. Debug info (se necessário)
-        if hasattr(self, 'debug_mode') and self.debug_mode:
+        if self.debug_mode:
             self._draw_debug_info()
             
         # Sprint 2-b: Draw particles (last for proper layering)
-        if hasattr(self, 'particle_manager'):
-            self.particle_manager.draw(self.screen)
+        self.particle_manager.draw(self.screen)
             
     def _draw_enemy_zone(self):
-        """Desenha zona de inimigos com overlay escuro e sprites escalados."""
-        # Criar overlay escuro para a zona
-        zone_surf = pygame.Surface(self.enemy_zone.size, pygame.SRCALPHA)
-        zone_surf.fill((0, 0, 0, 140))  # 55% opacidade
-        self.screen.blit(zone_surf, self.enemy_zone.topleft)
-        
+        """Desenha sprites escalados da zona de inimigos (overlay vem do chrome)."""
         # Desenhar sprites dos inimigos em grid flexível usando animações
-        if hasattr(self.combat_engine, 'enemies') and self.combat_engine.enemies:
+        if self._engine_has_enemies and self.combat_engine.enemies:
             enemies = self.combat_engine.enemies
             
-            # Calcular grid flexível baseado no número de inimigos
-            col_width = self.enemy_zone.width // len(enemies)
+            # Grid flexível baseado no número de inimigos
+            self._enemy_layout(len(enemies))
+            center_x = self._enemy_centers_x
             
+            # Sprites vão num único blits(); healthbars depois, com os rects devolvidos
+            sprite_blits = []
+            drawn_enemies = []
             for i, enemy in enumerate(enemies):
                 # Usar ID único para animação
                 unique_id = f"{self._get_enemy_anim_id(enemy)}_{i}"
                 
                 # Obter frame atual da animação
-                current_frame = animation_manager.get_current_frame(unique_id)
+                sprite = animation_manager.get_current_frame(unique_id)
                 
-                if current_frame:
-                    # Posicionar sprite na coluna correspondente
-                    pos_x = self.enemy_zone.left + col_width // 2 - current_frame.get_width() // 2 + i * col_width
-                    pos_y = self.enemy_zone.bottom - current_frame.get_height()
-                    
-                    sprite_rect = self.screen.blit(current_frame, (pos_x, pos_y))
-                    
-                    # Desenhar healthbar acima do sprite
-                    self._draw_enemy_healthbar(enemy, sprite_rect)
-                else:
+                if not sprite:
                     # Fallback para sprite estático se animação não disponível
-                    enemy_id = getattr(enemy, 'id', f"enemy_{i}")
-                    if enemy_id in self.enemy_sprites:
-                        sprite = self.enemy_sprites[enemy_id]
-                        pos_x = self.enemy_zone.left + col_width // 2 - sprite.get_width() // 2 + i * col_width
-                        pos_y = self.enemy_zone.bottom - sprite.get_height()
-                        sprite_rect = self.screen.blit(sprite, (pos_x, pos_y))
-                        self._draw_enemy_healthbar(enemy, sprite_rect)
+                    sprite = self.enemy_sprites.get(getattr(enemy, 'id', f"enemy_{i}"))
+                    if sprite is None:
+                        continue
+                        
+                # Posicionar sprite na coluna correspondente, apoiado na base da zona
+                pos_x = center_x[i] - sprite.get_width() // 2
+                pos_y = self.enemy_zone.bottom - sprite.get_height()
+                sprite_blits.append((sprite, (pos_x, pos_y)))
+                drawn_enemies.append(enemy)
+                
+            if sprite_blits:
+                sprite_rects = self.screen.blits(sprite_blits, True)
+                
+                # Desenhar healthbar acima de cada sprite
+                for enemy, sprite_rect in zip(drawn_enemies, sprite_rects):
+                    self._draw_enemy_healthbar(enemy, sprite_rect)
                     
     def _draw_enemy_healthbar(self, enemy, sprite_rect):
         """Desenha barra de vida do inimigo acima do sprite."""
-        # Posicionar barra acima do sprite
-        bar_rect = pygame.Rect(
-            sprite_rect.left, 
-            sprite_rect.top - 12, 
-            sprite_rect.width, 
-            8
-        )
+        # Posicionar barra acima do sprite (rects reaproveitados, atualizados in-place)
+        bar_rect = self._hp_bar_rect
+        bar_rect.update(sprite_rect.left, sprite_rect.top - 12, sprite_rect.width, 8)
         
-        # Fundo da barra (escuro)
-        pygame.draw.rect(self.screen, (40, 40, 40), bar_rect)
+        # Fundo da barra (escuro); fill sólido é o caminho mais rápido do SDL
+        self.screen.fill((40, 40, 40), bar_rect)
         
         # Barra de vida (proporcional ao HP)
-        if hasattr(enemy, 'hp') and hasattr(enemy, 'max_hp') and enemy.max_hp > 0:
-            hp_ratio = enemy.hp / enemy.max_hp
+        max_hp = getattr(enemy, 'max_hp', 0)
+        hp = getattr(enemy, 'hp', None)
+        if hp is not None and max_hp > 0:
+            hp_ratio = hp / max_hp
             hp_width = int((sprite_rect.width - 2) * hp_ratio)
             
             if hp_width > 0:
-                hp_rect = pygame.Rect(
-                    bar_rect.left + 1,
-                    bar_rect.top + 1, 
-                    hp_width,
-                    6
-                )
+                hp_rect = self._hp_fill_rect
+                hp_rect.update(bar_rect.left + 1, bar_rect.top + 1, hp_width, 6)
                 
                 # Cor da barra baseada no HP (verde -> amarelo -> vermelho)
-                if hp_ratio > 0.6:
-                    hp_color = (0, 200, 0)  # Verde
-                elif hp_ratio > 0.3:
-                    hp_color = (255, 255, 0)  # Amarelo
-                else:
-                    hp_color = (200, 0, 0)  # Vermelho
-                    
-                pygame.draw.rect(self.screen, hp_color, hp_rect)
+                self.screen.fill(_ENEMY_HP_COLOR_LUT[_hp_percent(hp, max_hp)], hp_rect)
                 
     def _get_enemy_anim_id(self, enemy) -> str:
-        """Retorna ID de animação para um inimigo."""
-        enemy_type_mapping = {
-            'goblin': 'goblin',
-            'orc': 'orc', 
-            'skeleton': 'skeleton',
-            'wizard': 'mage',
-            'dragon': 'dragon'
-        }
+        """
+        Retorna ID de animação para um inimigo.
         
-        # Converter enum para string
-        if hasattr(enemy.enemy_type, 'value'):
-            enemy_type_str = enemy.enemy_type.value.lower()
-        elif hasattr(enemy.enemy_type, 'name'):
-            enemy_type_str = enemy.enemy_type.name.lower()
-        else:
-            enemy_type_str = str(enemy.enemy_type).lower()
-            
-        return enemy_type_mapping.get(enemy_type_str, 'goblin')
+        Memorizado no próprio inimigo (como _enemy_type_str), então o draw
+        por frame paga só um lookup no __dict__.
+        """
+        anim_id = enemy.__dict__.get("_anim_id")
+        if anim_id is None:
+            anim_id = _ENEMY_ANIM_IDS.get(_enemy_type_str(enemy), 'goblin')
+            enemy.__dict__["_anim_id"] = anim_id
+        return anim_id
                 
     def _draw_player_sprite(self):
         """Sprint 2-b: Desenha sprite do jogador usando animação 30fps realtime."""
         # Sprint 2-b: Use realtime 30fps animation
-        if hasattr(self, 'player_animation') and self.player_animation:
+        if self.player_animation:
             try:
                 current_frame = self.player_animation.current()
                 if current_frame:
                     # Position sprite centered above hand zone
                     sprite_rect = current_frame.get_rect(
-                        midbottom=(self.width // 2, self.player_hand_zone.top - 10)
+                        midbottom=self._player_anchor
                     )
                     self.screen.blit(current_frame, sprite_rect)
                     return
@@ -1963,198 +2626,255 @@ class CombatScreen:
         if current_frame:
             # Position sprite centered above hand zone
             sprite_rect = current_frame.get_rect(
-                midbottom=(self.width // 2, self.player_hand_zone.top - 10)
+                midbottom=self._player_anchor
             )
             self.screen.blit(current_frame, sprite_rect)
         elif self.player_sprite:
             # Final fallback to static sprite
             sprite_rect = self.player_sprite.get_rect(
-                midbottom=(self.width // 2, self.player_hand_zone.top - 10)
+                midbottom=self._player_anchor
             )
             self.screen.blit(self.player_sprite, sprite_rect)
             
-    def _draw_status_card(self):
-        """Desenha status card do jogador com HP, mana e recursos."""
-        if not hasattr(self, 'status_card_zone'):
-            return
-            
-        # Fundo do status card com bordas arredondadas
+    def _build_status_card_bg(self, has_hp: bool = False, has_mana: bool = False) -> pygame.Surface:
+        """
+        Parte estática do status card (fundo, borda, título, divisória e trilhos
+        das barras) em uma surface.
+        
+        Args:
+            has_hp: Inclui o trilho cinza da barra de HP
+            has_mana: Inclui o trilho cinza da barra de mana
+        """
         status_surface = pygame.Surface(self.status_card_zone.size, pygame.SRCALPHA)
+        card_rect = status_surface.get_rect()
         
         # Fundo principal do card (azul-escuro translúcido)
-        pygame.draw.rect(status_surface, (20, 30, 80, 220), status_surface.get_rect(), border_radius=10)
+        pygame.draw.rect(status_surface, (20, 30, 80, 220), card_rect, border_radius=10)
         
         # Borda dourada
-        pygame.draw.rect(status_surface, (200, 180, 0), status_surface.get_rect(), 3, border_radius=10)
-        
-        # Blitar o fundo do status card
-        self.screen.blit(status_surface, self.status_card_zone.topleft)
-        
-        # Obter dados do jogador
-        player = None
-        if hasattr(self.combat_engine, 'player'):
-            player = self.combat_engine.player
-        elif hasattr(self, 'player'):
-            player = self.player
-            
-        # Configurações de texto
-        font_large = pygame.font.Font(None, 24)
-        font_medium = pygame.font.Font(None, 20)
-        font_small = pygame.font.Font(None, 16)
+        pygame.draw.rect(status_surface, (200, 180, 0), card_rect, 3, border_radius=10)
         
         # Título do card
-        title_text = font_large.render("Status", True, (255, 255, 255))
-        title_rect = title_text.get_rect(centerx=self.status_card_zone.centerx, y=self.status_card_zone.y + 10)
-        self.screen.blit(title_text, title_rect)
+        title_text, title_rect = self._render_text(24, "Status", (255, 255, 255))
+        title_rect.centerx = card_rect.centerx
+        title_rect.y = 10
+        status_surface.blit(title_text, title_rect)
         
         # Linha divisória
-        line_y = self.status_card_zone.y + 35
-        pygame.draw.line(self.screen, (200, 180, 0), 
-                        (self.status_card_zone.x + 10, line_y), 
-                        (self.status_card_zone.right - 10, line_y), 2)
+        pygame.draw.line(status_surface, (200, 180, 0), (10, 35), (card_rect.right - 10, 35), 2)
         
-        # Desenhar informações do jogador
+        # Trilhos das barras (mesmo layout de _draw_status_card)
         y_offset = 45
+        for present in (has_hp, has_mana):
+            if present:
+                status_surface.fill((100, 100, 100), (15, y_offset + 20, card_rect.width - 30, 8))
+                y_offset += 35
         
-        if player:
+        if pygame.display.get_surface() is not None:
+            status_surface = status_surface.convert_alpha()
+        return status_surface
+        
+    def _refresh_player_view(self):
+        """Copia para _player_view os dados do jogador que o HUD desenha."""
+        view = self._player_view
+        if self._engine_has_player:
+            player = self.combat_engine.player
+        else:
+            player = getattr(self, 'player', None)
+            
+        view.present = bool(player)
+        hp = getattr(player, 'hp', None)
+        max_hp = getattr(player, 'max_hp', None)
+        view.has_hp = hp is not None and max_hp is not None
+        if view.has_hp:
+            view.hp, view.max_hp = hp, max_hp
+            
+        mana = getattr(player, 'mana', None)
+        max_mana = getattr(player, 'max_mana', None)
+        view.has_mana = mana is not None and max_mana is not None
+        if view.has_mana:
+            view.mana, view.max_mana = mana, max_mana
+            
+        view.turn = getattr(self.combat_engine, 'turn_count', 1)
+        
+    def _draw_status_card(self):
+        """Desenha status card do jogador com HP, mana e recursos."""
+        # Dados do jogador já resolvidos em update()
+        player = self._player_view
+        has_hp = player.present and player.has_hp
+        has_mana = player.present and player.has_mana
+        
+        # Chrome e trilhos das barras não mudam: compostos uma vez, refeitos
+        # só se a zona mudar de tamanho ou o jogador ganhar/perder HP/mana
+        key = (*self.status_card_zone.size, has_hp, has_mana)
+        if key != self._status_card_key:
+            self._status_card_bg = self._build_status_card_bg(has_hp, has_mana)
+            self._status_card_key = key
+        self.screen.blit(self._status_card_bg, self.status_card_zone.topleft)
+            
+        # Desenhar informações do jogador (só o que muda: textos e preenchimento das barras)
+        text_x = self._status_text_x
+        bar_width = self._status_bar_width
+        bar_height = 8
+        y = self._status_rows_y
+        
+        if player.present:
             # HP do jogador
-            if hasattr(player, 'hp') and hasattr(player, 'max_hp'):
-                hp_text = f"HP: {player.hp}/{player.max_hp}"
-                hp_color = self._get_hp_color(player.hp / player.max_hp if player.max_hp > 0 else 0)
-                hp_surface = font_medium.render(hp_text, True, hp_color)
-                self.screen.blit(hp_surface, (self.status_card_zone.x + 15, self.status_card_zone.y + y_offset))
-                
-                # Barra de HP
-                bar_width = self.status_card_zone.width - 30
-                bar_height = 8
-                bar_x = self.status_card_zone.x + 15
-                bar_y = self.status_card_zone.y + y_offset + 20
+            if has_hp:
+                hp_ratio = player.hp / player.max_hp if player.max_hp > 0 else 0
+                hp_color = self._get_hp_color(player.hp, player.max_hp)
+                hp_surface, _ = self._render_text(20, f"HP: {player.hp}/{player.max_hp}", hp_color)
+                self.screen.blit(hp_surface, (text_x, y))
                 
-                # Fundo da barra
-                pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
+                # Barra de HP (trilho já está no chrome)
+                fill_width = int(bar_width * hp_ratio)
+                if fill_width > 0:
+                    self.screen.fill(hp_color, (text_x, y + 20, fill_width, bar_height))
                 
-                # Barra de HP
-                if player.max_hp > 0:
-                    hp_ratio = player.hp / player.max_hp
-                    fill_width = int(bar_width * hp_ratio)
-                    if fill_width > 0:
-                        pygame.draw.rect(self.screen, hp_color, (bar_x, bar_y, fill_width, bar_height))
-                
-                y_offset += 35
+                y += 35
             
             # Mana/Energia (se existir)
-            if hasattr(player, 'mana') and hasattr(player, 'max_mana'):
-                mana_text = f"Mana: {player.mana}/{player.max_mana}"
-                mana_surface = font_medium.render(mana_text, True, (100, 150, 255))
-                self.screen.blit(mana_surface, (self.status_card_zone.x + 15, self.status_card_zone.y + y_offset))
-                
-                # Barra de Mana
-                bar_x = self.status_card_zone.x + 15
-                bar_y = self.status_card_zone.y + y_offset + 20
+            if has_mana:
+                mana_surface, _ = self._render_text(20, f"Mana: {player.mana}/{player.max_mana}", (100, 150, 255))
+                self.screen.blit(mana_surface, (text_x, y))
                 
-                # Fundo da barra
-                pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-                
-                # Barra de Mana
+                # Barra de Mana (trilho já está no chrome)
                 if player.max_mana > 0:
-                    mana_ratio = player.mana / player.max_mana
-                    fill_width = int(bar_width * mana_ratio)
+                    fill_width = int(bar_width * player.mana / player.max_mana)
                     if fill_width > 0:
-                        pygame.draw.rect(self.screen, (100, 150, 255), (bar_x, bar_y, fill_width, bar_height))
+                        self.screen.fill((100, 150, 255), (text_x, y + 20, fill_width, bar_height))
                 
-                y_offset += 35
+                y += 35
             
             # Turno atual
-            turn_text = f"Turno: {getattr(self.combat_engine, 'turn_count', 1) if hasattr(self.combat_engine, 'turn_count') else 1}"
-            turn_surface = font_small.render(turn_text, True, (200, 200, 200))
-            self.screen.blit(turn_surface, (self.status_card_zone.x + 15, self.status_card_zone.y + y_offset))
+            turn_text = f"Turno: {player.turn}"
+            turn_surface, _ = self._render_text(16, turn_text, (200, 200, 200))
+            self.screen.blit(turn_surface, (text_x, y))
         else:
             # Fallback quando não há dados do jogador
-            no_data_text = font_medium.render("Carregando...", True, (150, 150, 150))
-            self.screen.blit(no_data_text, (self.status_card_zone.x + 15, self.status_card_zone.y + y_offset))
+            no_data_text, _ = self._render_text(20, "Carregando...", (150, 150, 150))
+            self.screen.blit(no_data_text, (text_x, y))
     
-    def _get_hp_color(self, hp_ratio):
-        """Retorna cor baseada na porcentagem de HP."""
-        if hp_ratio > 0.6:
-            return (0, 200, 0)  # Verde
-        elif hp_ratio > 0.3:
-            return (255, 200, 0)  # Amarelo
-        else:
-            return (255, 50, 50)  # Vermelho
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Retorna fonte padrão do tamanho pedido (compartilhada entre telas de combate)."""
+        return default_font(size)
+        
+    def _render_text(self, size: int, text: str, color) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Renderiza texto via helpers.render_text (cache compartilhado).
+        
+        A surface é compartilhada entre telas; o rect é novo a cada chamada,
+        então o chamador pode posicioná-lo livremente antes do blit.
+        
+        Args:
+            size: Tamanho da fonte
+            text: Texto a renderizar
+            color: Cor RGB do texto
+            
+        Returns:
+            Tupla (surface, rect)
+        """
+        surface = render_text(size, text, color)
+        return surface, surface.get_rect()
+        
+    def _get_hp_color(self, hp, max_hp):
+        """Retorna cor baseada na porcentagem de HP (lookup em _HP_COLOR_LUT)."""
+        return _HP_COLOR_LUT[_hp_percent(hp, max_hp)]
             
     def _draw_player_hand(self):
         """
         Desenha zona da mão do jogador com cartas - Sprint 2 Enhanced.
         Uses CardSprite system with pulsing glow and enhanced animations.
+        O painel da mão já vem pré-composto no chrome.
         """
-        # Painel azul-escuro translúcido para a mão
-        hand_overlay = pygame.Surface(self.player_hand_zone.size, pygame.SRCALPHA)
-        hand_overlay.fill((30, 40, 90, 200))  # Azul-escuro translúcido
-        self.screen.blit(hand_overlay, self.player_hand_zone.topleft)
-        
         # Sprint 2: Use CardSprite system for enhanced visuals
-        for card in self.player_hand:
+        # Imagens dos sprites vão em lote (na ordem da mão); o lote é descarregado
+        # antes de qualquer desenho avulso para preservar a sobreposição
+        batch = []
+        for i, card in enumerate(self.player_hand):
             # Sprint 2: Use CardSprite if available
-            if card.get("sprite"):
-                # Enhanced CardSprite with pulsing glow
-                card_sprite = card["sprite"]
-                card_sprite.draw(self.screen)
-                
-                # Draw card info on top
-                self._draw_card_info_overlay(card, card_sprite.rect)
+            card_sprite = card.get("sprite")
+            if card_sprite:
+                # Enhanced CardSprite with pulsing glow (info já composta na imagem)
+                batch.append((card_sprite.image, card_sprite.rect))
+                if card_sprite.outline_alpha > 0:
+                    self._flush_blits(batch)
+                    card_sprite.draw_effects(self.screen)
             else:
                 # Fallback to original rendering
-                self._draw_card_fallback(card)
+                self._flush_blits(batch)
+                self._draw_card_fallback(card, i)
+        self._flush_blits(batch)
+        
+    def _flush_blits(self, batch: List[Tuple[pygame.Surface, pygame.Rect]]):
+        """
+        Blita e esvazia uma sequência (surface, destino) numa única chamada.
+        
+        Usa fblits do pygame-ce quando disponível (cartas sem escala
+        compartilham a surface do template, o que o fblits aproveita).
+        """
+        if not batch:
+            return
+        fblits = getattr(self.screen, "fblits", None)
+        if fblits is not None:
+            fblits(batch)
+        else:
+            self.screen.blits(batch, False)
+        batch.clear()
                 
-    def _draw_card_info_overlay(self, card, card_rect):
-        """Sprint 2: Draw card information overlay on CardSprite."""
-        data = card["data"]
+    def _draw_card_info(self, target: pygame.Surface, data: dict, card_rect: pygame.Rect):
+        """
+        Sprint 2: Draw card information (name, cost badge, effects).
         
-        # Fonts for card info
-        font = pygame.font.Font(None, 20)
-        font_small = pygame.font.Font(None, 16)
+        Args:
+            target: Surface de destino (tela ou surface da própria carta)
+            data: Dados da carta
+            card_rect: Retângulo da carta em coordenadas de target
+        """
+        # Textos/selo não se sobrepõem: acumulados e enviados num único blits()
+        blit_ops = []
         
         # Card name
         if "name" in data:
-            name_surface = font.render(data["name"], True, (255, 255, 255))
-            name_rect = name_surface.get_rect(centerx=card_rect.centerx, y=card_rect.y + 10)
-            self.screen.blit(name_surface, name_rect)
+            name_surface, name_rect = self._render_text(20, data["name"], (255, 255, 255))
+            name_rect.centerx = card_rect.centerx
+            name_rect.y = card_rect.y + 10
+            blit_ops.append((name_surface, name_rect.topleft))
         
-        # Card cost (top-left corner)
+        # Card cost (top-left corner), selo pré-composto por valor
         if "cost" in data:
-            cost_surface = font_small.render(str(data["cost"]), True, (100, 200, 255))
-            cost_rect = pygame.Rect(card_rect.x + 5, card_rect.y + 5, 25, 25)
-            pygame.draw.circle(self.screen, (20, 30, 60), cost_rect.center, 12)
-            pygame.draw.circle(self.screen, (100, 200, 255), cost_rect.center, 12, 2)
-            cost_text_rect = cost_surface.get_rect(center=cost_rect.center)
-            self.screen.blit(cost_surface, cost_text_rect)
+            blit_ops.append((_cost_badge(data["cost"]), (card_rect.x + 5, card_rect.y + 5)))
         
         # Card effects (center)
         y_offset = card_rect.centery
         if "damage" in data:
-            damage_text = font_small.render(f"⚔️ {data['damage']}", True, (255, 100, 100))
-            damage_rect = damage_text.get_rect(centerx=card_rect.centerx, y=y_offset)
-            self.screen.blit(damage_text, damage_rect)
+            damage_text, damage_rect = self._render_text(16, f"⚔️ {data['damage']}", (255, 100, 100))
+            damage_rect.centerx = card_rect.centerx
+            blit_ops.append((damage_text, (damage_rect.x, y_offset)))
             y_offset += 20
             
         if "heal" in data:
-            heal_text = font_small.render(f"❤️ {data['heal']}", True, (100, 255, 100))
-            heal_rect = heal_text.get_rect(centerx=card_rect.centerx, y=y_offset)
-            self.screen.blit(heal_text, heal_rect)
+            heal_text, heal_rect = self._render_text(16, f"❤️ {data['heal']}", (100, 255, 100))
+            heal_rect.centerx = card_rect.centerx
+            blit_ops.append((heal_text, (heal_rect.x, y_offset)))
             y_offset += 20
             
         if "defense" in data:
-            defense_text = font_small.render(f"🛡️ {data['defense']}", True, (100, 100, 255))
-            defense_rect = defense_text.get_rect(centerx=card_rect.centerx, y=y_offset)
-            self.screen.blit(defense_text, defense_rect)
+            defense_text, defense_rect = self._render_text(16, f"🛡️ {data['defense']}", (100, 100, 255))
+            defense_rect.centerx = card_rect.centerx
+            blit_ops.append((defense_text, (defense_rect.x, y_offset)))
+            
+        if blit_ops:
+            target.blits(blit_ops, False)
     
-    def _draw_card_fallback(self, card):
+    def _draw_card_fallback(self, card, index: int):
         """Fallback card rendering when CardSprite is not available."""
-        # Aplicar transformações de animação
+        # Aplicar transformações de animação (estado SoA da mão)
+        anim = self._card_anim
         original_rect = card["rect"]
-        scale = max(0.1, card.get("scale", 1.0))  # Garantir escala mínima
-        rotation = card.get("rotation", 0)
-        glow_alpha = card.get("glow_alpha", 0)
+        scale = max(0.1, float(anim["scale"][index]))  # Garantir escala mínima
+        rotation = float(anim["rotation"][index])
+        glow_alpha = float(anim["glow"][index])
         
         # Calcular rect escalado com validação
         scaled_width = max(1, int(original_rect.width * scale))
@@ -2166,71 +2886,90 @@ class CombatScreen:
         
         # Cores dinâmicas com glow
         if card["is_selected"]:
-            border_color = (255, 215, 0)  # Dourado para selecionada
-            bg_color = (70, 80, 120, 220)
-            border_width = 3
+            state = "selected"
         elif card["is_hovered"]:
-            border_color = (150, 200, 255)  # Azul claro para hover
-            bg_color = (60, 70, 110, 220)
-            border_width = 2
+            state = "hovered"
         else:
-            border_color = (80, 80, 80)  # Cinza normal
-            bg_color = (50, 50, 50, 180)
-            border_width = 1
-            
-        # Criar surface da carta com animações
-        card_surface = pygame.Surface(scaled_rect.size, pygame.SRCALPHA)
+            state = "normal"
+        border_color = _CARD_FALLBACK_STYLES[state][0]
         
-        # Efeito de glow se necessário
+        # Efeito de glow se necessário (forma em cache, intensidade via alpha da surface)
         if glow_alpha > 5:
-            glow_width = max(1, scaled_rect.width + 10)
-            glow_height = max(1, scaled_rect.height + 10)
-            glow_surface = pygame.Surface((glow_width, glow_height), pygame.SRCALPHA)
-            glow_color = (*border_color, int(min(255, max(0, glow_alpha))))
-            pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), border_radius=8)
+            glow_surface = self._card_fallback_glow(scaled_rect.size, border_color)
+            glow_surface.set_alpha(int(min(255, glow_alpha)))
             glow_rect = glow_surface.get_rect(center=scaled_rect.center)
             self.screen.blit(glow_surface, glow_rect.topleft)
         
-        # Fundo da carta
-        card_surface.fill(bg_color)
-        
-        # Aplicar rotação se necessário
-        if abs(rotation) > 0.1:
-            card_surface = pygame.transform.rotate(card_surface, rotation)
-            rotated_rect = card_surface.get_rect(center=scaled_rect.center)
-            self.screen.blit(card_surface, rotated_rect.topleft)
-            display_rect = rotated_rect
-        else:
-            self.screen.blit(card_surface, scaled_rect.topleft)
-            display_rect = scaled_rect
-        
-        # Borda da carta
-        pygame.draw.rect(self.screen, border_color, display_rect, border_width, border_radius=5)
+        # Fundo + borda, com rotação discretizada em graus inteiros
+        rotation_bucket = round(rotation) if abs(rotation) > 0.1 else 0
+        frame = self._card_fallback_frame(scaled_rect.size, rotation_bucket, state)
+        display_rect = frame.get_rect(center=scaled_rect.center)
+        self.screen.blit(frame, display_rect.topleft)
         
         # Desenhar informações da carta
-        self._draw_card_info_overlay(card, display_rect)
+        self._draw_card_info(self.screen, data, display_rect)
+        
+    def _card_frame_cache_get(self, key: Tuple, build) -> pygame.Surface:
+        """Busca no LRU de molduras do fallback, compondo com build() na falta."""
+        cache = CombatScreen._CARD_FRAME_CACHE
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        surface = build()
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        cache[key] = surface
+        if len(cache) > CARD_FRAME_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
+        
+    def _card_fallback_frame(self, size: Tuple[int, int], rotation: int, state: str) -> pygame.Surface:
+        """Fundo e borda da carta fallback, já rotacionados, por (tamanho, grau, estado)."""
+        def build():
+            border_color, bg_color, border_width = _CARD_FALLBACK_STYLES[state]
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(bg_color)
+            if rotation:
+                surface = pygame.transform.rotate(surface, rotation)
+            # A borda contorna o retângulo envolvente, como no desenho direto na tela
+            pygame.draw.rect(surface, border_color, surface.get_rect(), border_width, border_radius=5)
+            return surface
+        return self._card_frame_cache_get(("frame", size, rotation, state), build)
+        
+    def _card_fallback_glow(self, size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+        """Glow opaco (arredondado) 10px maior que a carta; o chamador ajusta o alpha."""
+        def build():
+            surface = pygame.Surface((size[0] + 10, size[1] + 10), pygame.SRCALPHA)
+            pygame.draw.rect(surface, color, surface.get_rect(), border_radius=8)
+            return surface
+        return self._card_frame_cache_get(("glow", size, color), build)
         
     def _draw_buttons(self):
         """Desenha todos os botões da interface."""
         # Desenhar botão End Turn
-        if hasattr(self, 'end_turn_button'):
-            self.end_turn_button.draw(self.screen)
+        self.end_turn_button.draw(self.screen)
             
     def _draw_background_with_parallax(self):
         """Desenha background de combate épico com efeito parallax."""
         # Verificar se temos background IA carregado
-        if not hasattr(self, 'background_surface') or self.background_surface is None:
+        if self.background_surface is None:
             # Fallback: fundo preto simples
             self.screen.fill(theme.colors.SHADOW_BLACK)
             return
         
-        # Escalar background para tela mantendo proporção
+        # Escalar background para tela (uma vez por background/tamanho de tela)
         screen_size = self.screen.get_size()
-        background_scaled = pygame.transform.smoothscale(self.background_surface, screen_size)
+        if (self._parallax_bg_source is not self.background_surface
+                or self._parallax_bg_size != screen_size):
+            self._parallax_bg = pygame.transform.smoothscale(self.background_surface, screen_size)
+            self._parallax_bg_source = self.background_surface
+            self._parallax_bg_size = screen_size
+        background_scaled = self._parallax_bg
         
         # Calcular offset de parallax
         mouse_x, mouse_y = self.mouse_pos
-        center_x, center_y = self.width // 2, self.height // 2
+        center_x, center_y = self._screen_center
         
         # Parallax sutil - 2% de movimento
         parallax_strength = 0.02
@@ -2244,9 +2983,7 @@ class CombatScreen:
         self.screen.blit(background_scaled, bg_rect)
         
         # Adicionar overlay sutil para melhor contraste
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 20))  # Muito sutil
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(_overlay_surface((self.width, self.height), (0, 0, 0), 20), (0, 0))  # Muito sutil
         
     def _draw_zones(self):
         """Desenha as zonas de combate com painéis semi-transparentes."""
@@ -2264,6 +3001,18 @@ class CombatScreen:
             rect: Retângulo da zona
             zone_type: Tipo da zona ("enemy" ou "player")
         """
+        # Painel é estático: composto uma vez por tipo/tamanho
+        key = (zone_type, rect.width, rect.height)
+        panel_surface = self._zone_panel_cache.get(key)
+        if panel_surface is None:
+            panel_surface = self._build_zone_panel(rect, zone_type)
+            self._zone_panel_cache[key] = panel_surface
+            
+        # Desenhar no screen
+        self.screen.blit(panel_surface, rect.topleft)
+        
+    def _build_zone_panel(self, rect: pygame.Rect, zone_type: str) -> pygame.Surface:
+        """Compõe fundo, borda e textura do painel de uma zona."""
         # Criar surface semi-transparente
         panel_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
         
@@ -2287,8 +3036,10 @@ class CombatScreen:
             texture.set_alpha(60)  # Muito sutil
             panel_surface.blit(texture, (0, 0))
             
-        # Desenhar no screen
-        self.screen.blit(panel_surface, rect.topleft)
+        # Formato nativo do display: o blit por frame do painel não converte pixels
+        if pygame.display.get_surface() is not None:
+            panel_surface = panel_surface.convert_alpha()
+        return panel_surface
         
     def _draw_cards(self):
         """Desenha todas as cartas na zona do jogador."""
@@ -2326,10 +3077,8 @@ class CombatScreen:
         
         # Glow effect durante hover
         if slot.is_hovered and slot.glow_alpha > 0:
-            glow_surface = pygame.Surface((display_rect.width + 10, display_rect.height + 10), pygame.SRCALPHA)
-            glow_color = (255, 215, 0, int(slot.glow_alpha * 0.3))  # Dourado pulsante
-            pygame.draw.rect(glow_surface, glow_color, 
-                           (0, 0, display_rect.width + 10, display_rect.height + 10), 5)
+            glow_surface = slot.zone.get_glow(display_rect.width, display_rect.height)
+            glow_surface.set_alpha(int(slot.glow_alpha * 0.3))  # Dourado pulsante
             
             glow_rect = glow_surface.get_rect()
             glow_rect.center = display_rect.center
@@ -2337,15 +3086,13 @@ class CombatScreen:
         
         # Texto da carta
         if hasattr(card, 'name'):
-            font = pygame.font.Font(None, 24)
-            text_surface = font.render(card.name, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=(display_rect.width//2, 20))
+            text_surface, text_rect = self._render_text(24, card.name, (255, 255, 255))
+            text_rect.center = (display_rect.width//2, 20)
             card_surface.blit(text_surface, text_rect)
             
         # Custo da carta
         if hasattr(card, 'cost'):
-            cost_font = pygame.font.Font(None, 20)
-            cost_text = cost_font.render(str(card.cost), True, (100, 200, 255))
+            cost_text, _ = self._render_text(20, str(card.cost), (100, 200, 255))
             card_surface.blit(cost_text, (5, 5))
             
         # Desenhar carta no screen
@@ -2354,8 +3101,6 @@ class CombatScreen:
     def _draw_enemies(self):
         """Desenha todos os inimigos na zona de inimigos usando sprites IA."""
         # Zona inimigos (topo) - posições fixas
-        screen_width = self.screen.get_width()
-        
         # Obter inimigos do combat engine
         enemies = getattr(self.combat_engine, 'enemies', [])
         alive_enemies = [e for e in enemies if hasattr(e, 'hp') and e.hp > 0]
@@ -2370,15 +3115,14 @@ class CombatScreen:
             
             if enemy_sprite:
                 # Escalar sprite para tamanho apropriado
-                sprite_scaled = pygame.transform.scale(enemy_sprite, (200, 300))
+                sprite_scaled = self._scaled_sprite(enemy_sprite, (200, 300))
                 sprite_rect = sprite_scaled.get_rect(midtop=(x_pos, y_pos))
                 
                 # Efeito de hover
-                mouse_pos = pygame.mouse.get_pos()
-                if sprite_rect.collidepoint(mouse_pos):
+                if sprite_rect.collidepoint(self.mouse_pos):
                     # Glow effect para hover
-                    glow_surface = pygame.Surface((sprite_rect.width + 20, sprite_rect.height + 20), pygame.SRCALPHA)
-                    glow_surface.fill((255, 100, 100, 60))  # Brilho vermelho
+                    glow_surface = _overlay_surface((sprite_rect.width + 20, sprite_rect.height + 20),
+                                                    (255, 100, 100), 60)  # Brilho vermelho
                     glow_rect = glow_surface.get_rect(center=sprite_rect.center)
                     self.screen.blit(glow_surface, glow_rect)
                 
@@ -2392,6 +3136,20 @@ class CombatScreen:
                 # Fallback: retângulo simples
                 self._draw_enemy_placeholder(enemy, x_pos, y_pos)
     
+    def _scaled_sprite(self, sprite: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Sprite escalado para ``size``, calculado uma vez por sprite/tamanho.
+        
+        O original fica guardado junto da cópia para que o id() usado na
+        chave não seja reaproveitado por outra surface.
+        """
+        key = (id(sprite), size)
+        cached = self._scaled_sprites.get(key)
+        if cached is None:
+            cached = (sprite, pygame.transform.scale(sprite, size))
+            self._scaled_sprites[key] = cached
+        return cached[1]
+        
     def _get_enemy_sprite(self, enemy) -> Optional[pygame.Surface]:
         """
         Obtém sprite IA de um inimigo baseado no tipo/nome.
@@ -2402,24 +3160,20 @@ class CombatScreen:
         Returns:
             Surface do sprite ou None
         """
-        if not hasattr(self, 'enemy_sprites'):
-            return None
-            
-        # Mapear tipos de inimigos para sprites
-        enemy_type_map = {
-            'goblin': 'goblin_scout',
-            'orc': 'orc_berserker', 
-            'skeleton': 'skeleton_archer',
-            'mage': 'dark_mage'
-        }
-        
-        # Tentar identificar tipo do inimigo
-        enemy_name = getattr(enemy, 'name', '').lower()
-        enemy_id = getattr(enemy, 'id', '').lower()
-        
-        for enemy_type, sprite_key in enemy_type_map.items():
-            if enemy_type in enemy_name or enemy_type in enemy_id:
-                return self.enemy_sprites.get(sprite_key)
+        # Chave do sprite resolvida uma vez e memorizada no inimigo (nome/id
+        # não mudam); "" marca inimigo sem tipo reconhecido
+        sprite_key = enemy.__dict__.get("_sprite_key")
+        if sprite_key is None:
+            enemy_name = getattr(enemy, 'name', '').lower()
+            enemy_id = getattr(enemy, 'id', '').lower()
+            sprite_key = next(
+                (key for enemy_type, key in _ENEMY_SPRITE_KEYS.items()
+                 if enemy_type in enemy_name or enemy_type in enemy_id),
+                ""
+            )
+            enemy.__dict__["_sprite_key"] = sprite_key
+        if sprite_key:
+            return self.enemy_sprites.get(sprite_key)
         
         # Fallback: primeiro sprite disponível
         if self.enemy_sprites:
@@ -2439,27 +3193,23 @@ class CombatScreen:
         if not (hasattr(enemy, 'hp') and hasattr(enemy, 'max_hp')):
             return
             
-        bar_width = 120
-        bar_height = 8
-        bar_x = center_x - bar_width // 2
+        bg_rect = self._enemy_hp_bar_rect
+        bg_rect.midtop = (center_x, y)
         
         # Background da barra
-        bg_rect = pygame.Rect(bar_x, y, bar_width, bar_height)
-        pygame.draw.rect(self.screen, (60, 0, 0), bg_rect)
+        self.screen.fill((60, 0, 0), bg_rect)
         
         # Barra de HP
         hp_percent = enemy.hp / enemy.max_hp
-        hp_width = int(bar_width * hp_percent)
-        hp_rect = pygame.Rect(bar_x, y, hp_width, bar_height)
-        pygame.draw.rect(self.screen, (200, 60, 60), hp_rect)
+        hp_rect = (bg_rect.x, y, int(bg_rect.width * hp_percent), bg_rect.height)
+        self.screen.fill((200, 60, 60), hp_rect)
         
         # Borda
         pygame.draw.rect(self.screen, (255, 255, 255), bg_rect, 1)
         
         # Texto de HP
-        font = pygame.font.Font(None, 20)
-        hp_text = font.render(f"{enemy.hp}/{enemy.max_hp}", True, (255, 255, 255))
-        text_rect = hp_text.get_rect(center=(center_x, y - 12))
+        hp_text, text_rect = self._render_text(20, f"{enemy.hp}/{enemy.max_hp}", (255, 255, 255))
+        text_rect.center = (center_x, y - 12)
         self.screen.blit(hp_text, text_rect)
     
     def _draw_enemy_placeholder(self, enemy, x: int, y: int):
@@ -2471,35 +3221,29 @@ class CombatScreen:
             x, y: Posição
         """
         rect = pygame.Rect(x - 75, y, 150, 200)
-        pygame.draw.rect(self.screen, (120, 60, 60), rect)
+        self.screen.fill((120, 60, 60), rect)
         pygame.draw.rect(self.screen, (200, 100, 100), rect, 2)
         
         # Nome do inimigo
-        font = pygame.font.Font(None, 24)
         name = getattr(enemy, 'name', 'Enemy')
-        text = font.render(name, True, (255, 255, 255))
-        text_rect = text.get_rect(center=(x, y + 100))
+        text, text_rect = self._render_text(24, name, (255, 255, 255))
+        text_rect.center = (x, y + 100)
         self.screen.blit(text, text_rect)
         
     def _draw_player_sprite(self):
         """Desenha sprite do jogador na zona do jogador usando IA."""
-        if not hasattr(self, 'player_sprite') or self.player_sprite is None:
+        if self.player_sprite is None:
             return
             
-        # Zona jogador (base da tela)
-        screen_width = self.screen.get_width()
-        screen_height = self.screen.get_height()
-        
-        # Escalar sprite do jogador
-        player_scaled = pygame.transform.scale(self.player_sprite, (180, 280))
-        player_rect = player_scaled.get_rect(midbottom=(screen_width // 2, screen_height - 100))
+        # Escalar sprite do jogador (zona jogador, base da tela)
+        player_scaled = self._scaled_sprite(self.player_sprite, (180, 280))
+        player_rect = player_scaled.get_rect(midbottom=(self.width // 2, self.height - 100))
         
         # Efeito de hover
-        mouse_pos = pygame.mouse.get_pos()
-        if player_rect.collidepoint(mouse_pos):
+        if player_rect.collidepoint(self.mouse_pos):
             # Glow effect para hover
-            glow_surface = pygame.Surface((player_rect.width + 20, player_rect.height + 20), pygame.SRCALPHA)
-            glow_surface.fill((100, 150, 255, 60))  # Brilho azul
+            glow_surface = _overlay_surface((player_rect.width + 20, player_rect.height + 20),
+                                            (100, 150, 255), 60)  # Brilho azul
             glow_rect = glow_surface.get_rect(center=player_rect.center)
             self.screen.blit(glow_surface, glow_rect)
         
@@ -2507,101 +3251,122 @@ class CombatScreen:
         self.screen.blit(player_scaled, player_rect)
         
     def _draw_player_panel(self):
-        """Desenha o painel flutuante de estado do jogador."""
-        # Limpar surface do painel
-        self.player_panel_surface.fill((0, 0, 0, 0))
-        
-        # Background do painel com transparência
-        panel_bg = pygame.Surface((self.player_panel_rect.width, self.player_panel_rect.height), pygame.SRCALPHA)
-        panel_bg.fill((40, 40, 60, 180))
-        
-        # Borda dourada
-        pygame.draw.rect(panel_bg, (200, 180, 100, 200), 
-                        (0, 0, self.player_panel_rect.width, self.player_panel_rect.height), 2)
+        """
+        Desenha o painel flutuante de estado do jogador.
         
-        # Sombra (se asset disponível)
+        A parte estática (fundo, borda, trilhos) é pré-composta; por frame
+        vão para a tela só ela, os preenchimentos das barras e os textos,
+        sem limpar e recompor uma surface intermediária do painel.
+        """
+        # Obter dados do jogador
+        player = getattr(self.combat_engine, 'current_player', None)
+        has_hp = player is not None and hasattr(player, 'hp') and hasattr(player, 'max_hp')
+        has_mana = player is not None and hasattr(player, 'mana') and hasattr(player, 'max_mana')
+        
+        # Background do painel com borda e trilhos das barras (recomposto só
+        # quando muda o conjunto de barras)
+        key = (has_hp, has_mana)
+        if key != self._player_panel_key:
+            self._player_panel_bg = self._build_player_panel_bg(has_hp, has_mana)
+            self._player_panel_key = key
+        panel_bg = self._player_panel_bg
+        
+        # Sombra (se asset disponível), escalada uma vez
         if "panel_shadow" in self.assets:
-            shadow = self.assets["panel_shadow"]
-            shadow = pygame.transform.scale(shadow, 
-                                          (self.player_panel_rect.width + 20, self.player_panel_rect.height + 20))
+            shadow = self._player_panel_shadow
+            if shadow is None:
+                shadow = pygame.transform.scale(self.assets["panel_shadow"], 
+                                              (self.player_panel_rect.width + 20, self.player_panel_rect.height + 20))
+                self._player_panel_shadow = shadow
             shadow_rect = shadow.get_rect()
             shadow_rect.center = (self.player_panel_rect.centerx + 3, self.player_panel_rect.centery + 3)
             self.screen.blit(shadow, shadow_rect.topleft)
         
-        self.player_panel_surface.blit(panel_bg, (0, 0))
+        self.screen.blit(panel_bg, self.player_panel_rect.topleft)
         
-        # Obter dados do jogador
-        player = getattr(self.combat_engine, 'current_player', None)
         if player:
             self._draw_player_stats(player)
+        
+    def _build_player_panel_bg(self, has_hp: bool, has_mana: bool) -> pygame.Surface:
+        """
+        Compõe fundo translúcido, borda dourada e trilhos escuros das barras do painel.
+        
+        O resultado já vem mesclado sobre um painel transparente, como a
+        antiga surface intermediária, para ser blitado direto na tela.
+        """
+        width, height = self.player_panel_rect.size
+        panel_bg = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel_bg.fill((40, 40, 60, 180))
+        pygame.draw.rect(panel_bg, (200, 180, 100, 200), (0, 0, width, height), 2)
+        
+        hp_bg, mana_bg = self._player_panel_bars
+        if has_hp:
+            panel_bg.fill((60, 0, 0), hp_bg)
+        if has_mana:
+            panel_bg.fill((0, 0, 60), mana_bg)
             
-        # Desenhar painel no screen
-        self.screen.blit(self.player_panel_surface, self.player_panel_rect.topleft)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.blit(panel_bg, (0, 0))
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        return panel
         
     def _draw_player_stats(self, player):
-        """Desenha as estatísticas do jogador no painel."""
+        """Desenha as estatísticas do jogador direto na tela, sobre o fundo do painel."""
+        ox = self.player_panel_rect.x
         panel_width = self.player_panel_rect.width
-        panel_height = self.player_panel_rect.height
+        hp_bg, mana_bg = self._player_panel_bars_screen
+        screen = self.screen
         
-        # HP Bar
+        # Textos ficam acima das barras (sem sobreposição com os fills):
+        # acumulados e enviados num único blits() no fim
+        blit_ops = []
+        
+        # HP Bar (trilho já está no fundo do painel)
         if hasattr(player, 'hp') and hasattr(player, 'max_hp'):
-            hp_width = panel_width // 2 - 20
-            hp_height = 12
-            hp_x = 10
-            hp_y = 15
-            
-            # Background da barra
-            hp_bg = pygame.Rect(hp_x, hp_y, hp_width, hp_height)
-            pygame.draw.rect(self.player_panel_surface, (60, 0, 0), hp_bg)
+            hp_x, hp_y, hp_width, hp_height = hp_bg
             
             # Preenchimento da barra
             hp_percent = player.hp / player.max_hp if player.max_hp > 0 else 0
             hp_fill_width = int(hp_width * hp_percent)
-            hp_fill = pygame.Rect(hp_x, hp_y, hp_fill_width, hp_height)
-            pygame.draw.rect(self.player_panel_surface, (200, 50, 50), hp_fill)
+            if hp_fill_width > 0:
+                screen.fill((200, 50, 50), (hp_x, hp_y, hp_fill_width, hp_height))
             
             # Texto HP
-            font = pygame.font.Font(None, 20)
-            hp_text = font.render(f"HP: {player.hp}/{player.max_hp}", True, (255, 255, 255))
-            self.player_panel_surface.blit(hp_text, (hp_x, hp_y - 15))
+            hp_text, _ = self._render_text(20, f"HP: {player.hp}/{player.max_hp}", (255, 255, 255))
+            blit_ops.append((hp_text, (hp_x, hp_y - 15)))
             
-        # Mana Bar
+        # Mana Bar (trilho já está no fundo do painel)
         if hasattr(player, 'mana') and hasattr(player, 'max_mana'):
-            mana_width = panel_width // 2 - 20  
-            mana_height = 12
-            mana_x = panel_width // 2 + 10
-            mana_y = 15
-            
-            # Background da barra
-            mana_bg = pygame.Rect(mana_x, mana_y, mana_width, mana_height)
-            pygame.draw.rect(self.player_panel_surface, (0, 0, 60), mana_bg)
+            mana_x, mana_y, mana_width, mana_height = mana_bg
             
             # Preenchimento da barra
             mana_percent = player.mana / player.max_mana if player.max_mana > 0 else 0
             mana_fill_width = int(mana_width * mana_percent)
-            mana_fill = pygame.Rect(mana_x, mana_y, mana_fill_width, mana_height)
-            pygame.draw.rect(self.player_panel_surface, (50, 50, 200), mana_fill)
+            if mana_fill_width > 0:
+                screen.fill((50, 50, 200), (mana_x, mana_y, mana_fill_width, mana_height))
             
             # Texto Mana
-            mana_text = font.render(f"Mana: {player.mana}/{player.max_mana}", True, (255, 255, 255))
-            self.player_panel_surface.blit(mana_text, (mana_x, mana_y - 15))
+            mana_text, _ = self._render_text(20, f"Mana: {player.mana}/{player.max_mana}", (255, 255, 255))
+            blit_ops.append((mana_text, (mana_x, mana_y - 15)))
             
         # Informações de cartas
         deck_count = len(getattr(player, 'deck', []))
         hand_count = len(getattr(player, 'hand', []))
         
-        info_font = pygame.font.Font(None, 18)
-        deck_text = info_font.render(f"Deck: {deck_count}", True, (200, 200, 200))
-        hand_text = info_font.render(f"Hand: {hand_count}", True, (200, 200, 200))
+        deck_text, _ = self._render_text(18, f"Deck: {deck_count}", (200, 200, 200))
+        hand_text, _ = self._render_text(18, f"Hand: {hand_count}", (200, 200, 200))
         
-        self.player_panel_surface.blit(deck_text, (10, panel_height - 25))
-        self.player_panel_surface.blit(hand_text, (80, panel_height - 25))
+        bottom_y = self._player_panel_bottom_y
+        blit_ops.append((deck_text, (ox + 10, bottom_y)))
+        blit_ops.append((hand_text, (ox + 80, bottom_y)))
         
-        # Ícone de carta (se disponível)
+        # Ícone de carta (se disponível), escalado uma vez
         if "icon_card" in self.assets:
-            icon = self.assets["icon_card"]
-            icon = pygame.transform.scale(icon, (16, 16))
-            self.player_panel_surface.blit(icon, (panel_width - 25, panel_height - 25))
+            icon = self._scaled_sprite(self.assets["icon_card"], (16, 16))
+            blit_ops.append((icon, (ox + panel_width - 25, bottom_y)))
+            
+        screen.blits(blit_ops, False)
             
     def _draw_particles(self):
         """Desenha o sistema de partículas."""
@@ -2611,50 +3376,49 @@ class CombatScreen:
         """Desenha overlays e transições especiais."""
         # Overlay de transição de turno
         if self.turn_transition_active and self.turn_transition_alpha > 0:
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, self.turn_transition_alpha))
+            overlay = _overlay_surface((self.width, self.height), (0, 0, 0), self.turn_transition_alpha)
             self.screen.blit(overlay, (0, 0))
             
             # Texto de transição
             if self.turn_transition_alpha > 100:
-                font = pygame.font.Font(None, 48)
-                text = font.render("Enemy Turn", True, (255, 255, 255))
-                text_rect = text.get_rect(center=(self.width//2, self.height//2))
+                text, text_rect = self._render_text(48, "Enemy Turn", (255, 255, 255))
+                text_rect.center = self._screen_center
                 self.screen.blit(text, text_rect)
                 
         # Overlay de pause
         if self.state == CombatState.PAUSED:
-            pause_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            pause_overlay.fill((0, 0, 0, 100))
-            self.screen.blit(pause_overlay, (0, 0))
+            self.screen.blit(_overlay_surface((self.width, self.height), (0, 0, 0), 100), (0, 0))
             
             # Texto de pause
-            font = pygame.font.Font(None, 64)
-            pause_text = font.render("PAUSED", True, (255, 255, 255))
-            text_rect = pause_text.get_rect(center=(self.width//2, self.height//2))
+            pause_text, text_rect = self._render_text(64, "PAUSED", (255, 255, 255))
+            text_rect.center = self._screen_center
             self.screen.blit(pause_text, text_rect)
             
             # Instrução
-            inst_font = pygame.font.Font(None, 24)
-            inst_text = inst_font.render("Press ESC to exit or P to resume", True, (200, 200, 200))
-            inst_rect = inst_text.get_rect(center=(self.width//2, self.height//2 + 50))
+            inst_text, inst_rect = self._render_text(24, "Press ESC to exit or P to resume", (200, 200, 200))
+            inst_rect.center = (self.width//2, self.height//2 + 50)
             self.screen.blit(inst_text, inst_rect)
             
     def _draw_debug_info(self):
-        """Desenha informações de debug."""
-        debug_font = pygame.font.Font(None, 20)
-        
-        debug_lines = [
-            f"State: {self.state.value}",
-            f"Mouse: {self.mouse_pos}",
-            f"Selected Card: {self.selected_card}",
-            f"Targeted Enemy: {self.targeted_enemy}",
-            f"Turn Transition: {self.turn_transition_active}"
-        ]
+        """
+        Desenha informações de debug.
         
-        for i, line in enumerate(debug_lines):
-            debug_surface = debug_font.render(line, True, (255, 255, 0))
-            self.screen.blit(debug_surface, (10, 10 + i * 22))
+        Só chamado com debug_mode ligado; as linhas são formatadas e
+        renderizadas de novo apenas quando algum valor exibido muda.
+        """
+        values = (self.state.value, self.mouse_pos, self.selected_card,
+                  self.targeted_enemy, self.turn_transition_active)
+        if values != self._debug_values:
+            debug_font = self._get_font(20)
+            labels = ("State", "Mouse", "Selected Card", "Targeted Enemy", "Turn Transition")
+            self._debug_surfaces = [
+                debug_font.render(f"{label}: {value}", True, (255, 255, 0))
+                for label, value in zip(labels, values)
+            ]
+            self._debug_values = values
+        
+        self.screen.blits([(debug_surface, (10, 10 + i * 22))
+                           for i, debug_surface in enumerate(self._debug_surfaces)], False)
 
     def run(self) -> bool:
         """
@@ -2671,10 +3435,18 @@ class CombatScreen:
                 # Calculate delta time
                 dt = clock.tick(60) / 1000.0
                 
-                # Handle events
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return False
+                # Handle events: QUIT encerra antes de despachar o resto da fila
+                events = pygame.event.get()
+                if any(event.type == pygame.QUIT for event in events):
+                    return False
+                    
+                last = len(events) - 1
+                for i, event in enumerate(events):
+                    # Só a última posição de uma sequência de MOUSEMOTION importa
+                    # (hover/drag usam apenas event.pos)
+                    if (event.type == pygame.MOUSEMOTION and i < last
+                            and events[i + 1].type == pygame.MOUSEMOTION):
+                        continue
                         
                     result = self.handle_event(event)
                     if result == "victory":
@@ -2687,11 +3459,17 @@ class CombatScreen:
                 # Update
                 self.update(dt)
                 
-                # Draw
-                self.draw()
-                
-                # Update display
-                pygame.display.flip()
+                # Draw apenas quando algo mudou: tela inteira ou só as regiões em movimento
+                if self._dirty:
+                    self.draw()
+                    
+                    # Update display
+                    pygame.display.flip()
+                    self._dirty = False
+                    self._dirty_regions = []
+                elif self._dirty_regions:
+                    self._draw_regions(self._dirty_regions)
+                    self._dirty_regions = []
                 
         except Exception as e:
             logger.error(f"Error in combat loop: {e}", exc_info=True)
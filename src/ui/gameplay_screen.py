@@ -30,7 +30,10 @@ from ..enemies.intelligent_combat import IntelligentCombatEngine
 from ..ui.theme import UITheme, theme
 from ..ui.animation import AnimationManager, EasingType
 from ..ui.particles import ParticleSystem, ParticleEmitter, ParticleType
-from ..ui.helpers import fit_height, fit_width, create_gradient_surface, draw_outlined_text, apply_glow_effect
+from ..ui.helpers import (
+    fit_height, fit_width, create_gradient_surface, draw_outlined_text, apply_glow_effect,
+    default_font, render_text
+)
 from ..components.button import Button
 from ..generators.asset_generator import AssetGenerator
 from ..utils.asset_loader import load_ia_assets
@@ -52,6 +55,29 @@ class GameplayState(Enum):
     SETTINGS = "settings"
 
 
+# Tamanhos das fontes nomeadas da tela (texto renderizado via render_text)
+FONT_SIZES = {
+    "title": 48,
+    "subtitle": 32,
+    "text": 24,
+    "small": 18
+}
+
+
+def _enemy_type_name(enemy) -> str:
+    """
+    Nome do EnemyType em minúsculas (prefixo dos IDs de animação).
+    
+    Memorizado no próprio inimigo: o tipo não muda e o draw consulta
+    todo frame.
+    """
+    name = enemy.__dict__.get("_type_name")
+    if name is None:
+        name = enemy.enemy_type.name.lower()
+        enemy.__dict__["_type_name"] = name
+    return name
+
+
 class GameplayScreen:
     """
     Tela principal de gameplay com sistema completo de jogo.
@@ -107,12 +133,7 @@ class GameplayScreen:
         
         # Carregar fontes
         pygame.font.init()
-        self.fonts = {
-            "title": pygame.font.Font(None, 48),
-            "subtitle": pygame.font.Font(None, 32),
-            "text": pygame.font.Font(None, 24),
-            "small": pygame.font.Font(None, 18)
-        }
+        self.fonts = {name: default_font(size) for name, size in FONT_SIZES.items()}
         
         # Inicializar player padrão
         self.player = Player(
@@ -125,6 +146,10 @@ class GameplayScreen:
         
         logger.info("Componentes básicos inicializados")
         
+    def _text(self, font_name: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Texto com a fonte nomeada, vindo do cache compartilhado de render_text."""
+        return render_text(FONT_SIZES[font_name], text, color)
+        
     def _load_assets(self):
         """Carrega todos os assets necessários."""
         try:
@@ -393,19 +418,11 @@ class GameplayScreen:
             # Inicializar animações dos inimigos
             if self.combat_engine:
                 for i, enemy in enumerate(self.combat_engine.enemies):
-                    enemy_type = enemy.enemy_type.name.lower()
+                    enemy_type = _enemy_type_name(enemy)
                     unique_id = f"{enemy_type}_{i}"
                     
-                    # Copiar animações base para ID único
-                    if enemy_type in animation_manager.animations:
-                        for action, animation in animation_manager.animations[enemy_type].items():
-                            animation_manager.add_animation(
-                                entity_id=unique_id,
-                                action=action,
-                                frames=animation.frames.copy(),
-                                fps=animation.fps,
-                                loop=animation.loop
-                            )
+                    # Compartilhar clips base; ID único só tem estado de reprodução
+                    animation_manager.share_animations(enemy_type, unique_id)
                     
                     # Iniciar animação idle
                     animation_manager.play_animation(unique_id, "idle")
@@ -544,7 +561,7 @@ class GameplayScreen:
             self.screen.blit(bg, (0, 0))
         
         # Título
-        title_text = self.fonts["title"].render("Medieval Deck", True, (255, 215, 0))
+        title_text = self._text("title", "Medieval Deck", (255, 215, 0))
         title_rect = title_text.get_rect(center=(self.width // 2, 150))
         self.screen.blit(title_text, title_rect)
         
@@ -560,7 +577,7 @@ class GameplayScreen:
             self.screen.blit(bg, (0, 0))
         
         # Título
-        title_text = self.fonts["subtitle"].render("Escolha seu Personagem", True, (255, 255, 255))
+        title_text = self._text("subtitle", "Escolha seu Personagem", (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, 100))
         self.screen.blit(title_text, title_rect)
         
@@ -590,12 +607,12 @@ class GameplayScreen:
             self.screen.blit(bg, (0, 0))
         
         # Título
-        title_text = self.fonts["subtitle"].render("Construir Deck", True, (255, 255, 255))
+        title_text = self._text("subtitle", "Construir Deck", (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, 100))
         self.screen.blit(title_text, title_rect)
         
         # Placeholder para interface de deck
-        placeholder_text = self.fonts["text"].render("Interface de construção de deck em desenvolvimento", True, (200, 200, 200))
+        placeholder_text = self._text("text", "Interface de construção de deck em desenvolvimento", (200, 200, 200))
         placeholder_rect = placeholder_text.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(placeholder_text, placeholder_rect)
         
@@ -621,7 +638,7 @@ class GameplayScreen:
             for i, enemy in enumerate(enemies):
                 if enemy.hp > 0:  # Apenas inimigos vivos
                     # Animação do inimigo
-                    enemy_type = enemy.enemy_type.name.lower()
+                    enemy_type = _enemy_type_name(enemy)
                     unique_id = f"{enemy_type}_{i}"
                     current_frame = animation_manager.get_current_frame(unique_id)
                     
@@ -699,7 +716,7 @@ class GameplayScreen:
         pygame.draw.rect(panel_surface, (200, 50, 50), hp_fill)
         
         # Texto HP
-        hp_text = self.fonts["small"].render(f"HP: {self.player.hp}/{self.player.max_hp}", True, (255, 255, 255))
+        hp_text = self._text("small", f"HP: {self.player.hp}/{self.player.max_hp}", (255, 255, 255))
         panel_surface.blit(hp_text, (hp_x, hp_y - 15))
         
         # Mana Bar
@@ -712,7 +729,7 @@ class GameplayScreen:
         mana_fill = pygame.Rect(mana_x, hp_y, mana_fill_width, hp_height)
         pygame.draw.rect(panel_surface, (50, 50, 200), mana_fill)
         
-        mana_text = self.fonts["small"].render(f"Mana: {self.player.mana}/{self.player.max_mana}", True, (255, 255, 255))
+        mana_text = self._text("small", f"Mana: {self.player.mana}/{self.player.max_mana}", (255, 255, 255))
         panel_surface.blit(mana_text, (mana_x, hp_y - 15))
         
         self.screen.blit(panel_surface, panel_rect.topleft)
@@ -722,7 +739,7 @@ class GameplayScreen:
         pygame.draw.rect(self.screen, (100, 50, 150), end_turn_button)
         pygame.draw.rect(self.screen, (150, 100, 200), end_turn_button, 2)
         
-        end_turn_text = self.fonts["text"].render("End Turn", True, (255, 255, 255))
+        end_turn_text = self._text("text", "End Turn", (255, 255, 255))
         text_rect = end_turn_text.get_rect(center=end_turn_button.center)
         self.screen.blit(end_turn_text, text_rect)
         
@@ -734,11 +751,11 @@ class GameplayScreen:
         self.screen.blit(overlay, (0, 0))
         
         # Texto de vitória
-        victory_text = self.fonts["title"].render("VITÓRIA!", True, (255, 215, 0))
+        victory_text = self._text("title", "VITÓRIA!", (255, 215, 0))
         victory_rect = victory_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
         self.screen.blit(victory_text, victory_rect)
         
-        continue_text = self.fonts["text"].render("Pressione ESC para continuar", True, (255, 255, 255))
+        continue_text = self._text("text", "Pressione ESC para continuar", (255, 255, 255))
         continue_rect = continue_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
         self.screen.blit(continue_text, continue_rect)
         
@@ -750,11 +767,11 @@ class GameplayScreen:
         self.screen.blit(overlay, (0, 0))
         
         # Texto de derrota
-        defeat_text = self.fonts["title"].render("DERROTA", True, (200, 50, 50))
+        defeat_text = self._text("title", "DERROTA", (200, 50, 50))
         defeat_rect = defeat_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
         self.screen.blit(defeat_text, defeat_rect)
         
-        continue_text = self.fonts["text"].render("Pressione ESC para continuar", True, (255, 255, 255))
+        continue_text = self._text("text", "Pressione ESC para continuar", (255, 255, 255))
         continue_rect = continue_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
         self.screen.blit(continue_text, continue_rect)
         
@@ -766,12 +783,12 @@ class GameplayScreen:
             self.screen.blit(bg, (0, 0))
         
         # Título
-        title_text = self.fonts["subtitle"].render("Configurações", True, (255, 255, 255))
+        title_text = self._text("subtitle", "Configurações", (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, 100))
         self.screen.blit(title_text, title_rect)
         
         # Placeholder para configurações
-        placeholder_text = self.fonts["text"].render("Interface de configurações em desenvolvimento", True, (200, 200, 200))
+        placeholder_text = self._text("text", "Interface de configurações em desenvolvimento", (200, 200, 200))
         placeholder_rect = placeholder_text.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(placeholder_text, placeholder_rect)
         
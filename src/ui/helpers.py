@@ -5,9 +5,70 @@ Helpers para escalonamento, posicionamento e efeitos visuais.
 """
 
 import pygame
+from functools import lru_cache
 from typing import Tuple
 
 
+@lru_cache(maxsize=16)
+def default_font(size: int) -> pygame.font.Font:
+    """
+    Fonte padrão do pygame no tamanho pedido, criada uma única vez por processo.
+    
+    Construir pygame.font.Font reabre e reprocessa o TTF padrão; código de
+    draw deve pegar a fonte daqui em vez de criá-la a cada frame.
+    Requer pygame.font inicializado.
+    
+    Args:
+        size: Tamanho da fonte em pontos
+        
+    Returns:
+        Fonte compartilhada (não alterar estilo, ex.: set_bold)
+    """
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=512)
+def render_text(size: int, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Texto renderizado com a fonte padrão, memorizado por (tamanho, texto, cor).
+    
+    HUDs redesenham as mesmas strings ("HP: 30/30", "End Turn") a cada
+    frame; a surface é compartilhada e só deve ser usada para blit.
+    Chamar render_text.cache_clear() se o modo de vídeo mudar.
+    
+    Args:
+        size: Tamanho da fonte
+        text: Texto a renderizar
+        color: Cor RGB do texto
+        
+    Returns:
+        Surface do texto (convertida para o display, se houver um)
+    """
+    surface = default_font(size).render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+def ensure_alpha_format(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Garante que a superficie está no formato de display com alpha.
+    
+    Superficies fora do formato nativo são convertidas a cada blit pelo
+    pygame; converter uma vez no carregamento evita esse custo por frame.
+    Requer display já inicializado.
+    
+    Args:
+        surface: Superficie carregada
+        
+    Returns:
+        A própria superficie, ou uma cópia convertida com convert_alpha()
+    """
+    if surface.get_flags() & pygame.SRCALPHA and surface.get_bitsize() == 32:
+        return surface
+    return surface.convert_alpha()
+
+
 def fit_height(surface: pygame.Surface, target_h: int) -> pygame.Surface:
     """
     Redimensiona uma superficie mantendo proporção baseada na altura alvo.
@@ -64,7 +125,9 @@ def create_gradient_surface(size: Tuple[int, int], color_top: Tuple[int, int, in
     Returns:
         Superficie com gradiente aplicado
     """
-    surface = pygame.Surface(size, pygame.SRCALPHA)
+    # Gradiente vertical: gerar uma coluna de 1px e esticar na horizontal
+    # (scale sem filtro replica a coluna exatamente, bem mais barato que linha a linha)
+    strip = pygame.Surface((1, size[1]), pygame.SRCALPHA)
     
     for y in range(size[1]):
         blend_factor = y / (size[1] - 1) if size[1] > 1 else 0
@@ -73,9 +136,9 @@ def create_gradient_surface(size: Tuple[int, int], color_top: Tuple[int, int, in
         g = int(color_top[1] * (1 - blend_factor) + color_bottom[1] * blend_factor)
         b = int(color_top[2] * (1 - blend_factor) + color_bottom[2] * blend_factor)
         
-        pygame.draw.line(surface, (r, g, b, alpha), (0, y), (size[0], y))
+        strip.set_at((0, y), (r, g, b, alpha))
     
-    return surface
+    return pygame.transform.scale(strip, size)
 
 
 def draw_outlined_text(surface: pygame.Surface, text: str, pos: Tuple[int, int], 
@@ -173,6 +173,8 @@ class MVPCombatScreen:
         
         self.current_biome = "cathedral"
         self.selected_card_index = 0
+        # Posição do mouse atualizada pelos eventos (evita mouse.get_pos() no draw)
+        self.mouse_pos = (0, 0)
         
         # Initialize game systems
         self.deck = MVPDeck()
@@ -562,7 +564,10 @@ class MVPCombatScreen:
     
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """Handle events. Returns action string or None."""
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return "back_to_menu"
                 
@@ -875,7 +880,7 @@ class MVPCombatScreen:
             return
         
         # Get mouse position for hover detection
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.mouse_pos
         
         # Use Theme constants for consistency
         card_w, card_h = Theme.CARD_SIZE
@@ -1132,7 +1137,7 @@ class MVPCombatScreen:
             return
         
         # Get mouse position for hover detection
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.mouse_pos
         
         # CORREÇÃO: Usar Theme.CARD_SIZE para consistência
         card_width, card_height = 140, 90  # Tamanhos específicos para hand zone
@@ -1708,7 +1713,10 @@ class MVPCombatScreen:
     
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """Handle events."""
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return "back_to_menu"
                 
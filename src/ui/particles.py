@@ -12,7 +12,7 @@ Implementa efeitos sutis como:
 import pygame
 import random
 import math
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 from dataclasses import dataclass
 
@@ -91,6 +91,10 @@ class Particle:
     """Representa uma partícula individual - Enhanced for P2."""
     
     def __init__(self, x: float, y: float, particle_type: ParticleType):
+        self.reset(x, y, particle_type)
+        
+    def reset(self, x: float, y: float, particle_type: ParticleType):
+        """(Re)inicializa a partícula; o pool usa isto para reaproveitar instâncias mortas."""
         self.x = x
         self.y = y
         self.type = particle_type
@@ -312,6 +316,42 @@ class Particle:
         surface.blit(temp_surface, (self.x - self.size, self.y - self.size))
 
 
+# Partículas mortas por tipo, reaproveitadas em vez de alocar novas a cada
+# rajada. Separadas por tipo para que reset() reescreva exatamente os mesmos
+# atributos que a instância já tinha.
+PARTICLE_POOL_LIMIT = 256
+_particle_pool: Dict[ParticleType, List[Particle]] = {}
+
+
+def _acquire_particle(x: float, y: float, particle_type: ParticleType) -> Particle:
+    """Retorna partícula do pool (reinicializada) ou cria uma nova."""
+    free = _particle_pool.get(particle_type)
+    if free:
+        particle = free.pop()
+        particle.reset(x, y, particle_type)
+        return particle
+    return Particle(x, y, particle_type)
+
+
+def _release_particle(particle: Particle):
+    """Devolve partícula morta ao pool do seu tipo (descartada se o pool estiver cheio)."""
+    free = _particle_pool.setdefault(particle.type, [])
+    if len(free) < PARTICLE_POOL_LIMIT:
+        free.append(particle)
+
+
+def _update_particles(particles: List[Particle], dt: float) -> List[Particle]:
+    """Atualiza as partículas e devolve as vivas (na mesma ordem); as mortas vão ao pool."""
+    alive = []
+    for particle in particles:
+        particle.update(dt)
+        if particle.is_alive:
+            alive.append(particle)
+        else:
+            _release_particle(particle)
+    return alive
+
+
 class ParticleEmitter:
     """Emissor de partículas para uma região específica - Enhanced for P2."""
     
@@ -391,8 +431,7 @@ class ParticleEmitter:
         px = self.x + random.uniform(0, self.width)
         py = self.y + random.uniform(0, self.height)
         
-        particle = Particle(px, py, self.particle_type)
-        self.particles.append(particle)
+        self.particles.append(_acquire_particle(px, py, self.particle_type))
     
     def update(self, dt: float):
         """
@@ -414,10 +453,7 @@ class ParticleEmitter:
                 self.last_emission -= emission_interval
         
         # Atualiza partículas existentes
-        for particle in self.particles[:]:  # Cópia da lista
-            particle.update(dt)
-            if not particle.is_alive:
-                self.particles.remove(particle)
+        self.particles = _update_particles(self.particles, dt)
     
     def draw(self, surface: pygame.Surface):
         """Desenha todas as partículas."""
@@ -429,6 +465,8 @@ class ParticleEmitter:
     
     def clear(self):
         """Remove todas as partículas."""
+        for particle in self.particles:
+            _release_particle(particle)
         self.particles.clear()
 
 
@@ -444,7 +482,7 @@ class ParticleSystem:
         """Cria efeito de impacto na posição especificada."""
         # Criar várias partículas de faísca dourada
         for _ in range(random.randint(5, 10)):
-            particle = Particle(x, y, ParticleType.GOLDEN_SPARKS)
+            particle = _acquire_particle(x, y, ParticleType.GOLDEN_SPARKS)
             # Adicionar velocidade radial
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(20, 50)
@@ -454,10 +492,7 @@ class ParticleSystem:
             
     def update(self, dt: float):
         """Atualiza todas as partículas."""
-        for particle in self.particles[:]:  # Cópia da lista
-            particle.update(dt)
-            if not particle.is_alive:
-                self.particles.remove(particle)
+        self.particles = _update_particles(self.particles, dt)
                 
     def draw(self, surface: pygame.Surface):
         """Desenha todas as partículas."""
@@ -468,8 +503,12 @@ class ParticleSystem:
 class ParticleManager:
     """Gerenciador global de sistemas de partículas."""
     
+    # Máximo de emissores de rajada guardados para reuso
+    BURST_POOL_LIMIT = 16
+    
     def __init__(self):
         self.emitters: List[ParticleEmitter] = []
+        self._burst_pool: List[ParticleEmitter] = []
     
     def add_emitter(self, emitter: ParticleEmitter):
         """Adiciona emissor ao gerenciador."""
@@ -513,66 +552,62 @@ class ParticleManager:
         self.add_emitter(emitter)
         return emitter
     
-    def create_spark_burst(self, x: float, y: float, count: int = 10):
-        """Cria rajada de faíscas douradas (para hover de botões)."""
-        emitter = ParticleEmitter(
-            x - 10, y - 10, 20, 20,
-            ParticleType.GOLDEN_SPARKS,
-            emission_rate=0,  # Apenas burst
-            max_particles=count
-        )
+    def _emit_burst(self, x: float, y: float, width: float, height: float,
+                    particle_type: ParticleType, count: int) -> ParticleEmitter:
+        """
+        Emite uma rajada com um emissor one-shot, reaproveitado do pool se houver.
+        
+        O emissor fica inativo (sem emissão contínua), então update() o
+        remove sozinho quando as partículas morrem e o devolve ao pool.
+        """
+        if self._burst_pool:
+            emitter = self._burst_pool.pop()
+            emitter.set_position(x, y)
+            emitter.width = width
+            emitter.height = height
+            emitter.particle_type = particle_type
+            emitter.max_particles = count
+            emitter.last_emission = 0.0
+        else:
+            emitter = ParticleEmitter(
+                x, y, width, height,
+                particle_type,
+                emission_rate=0,  # Apenas burst
+                max_particles=count
+            )
+            emitter.one_shot = True
+            emitter.is_active = False
+            
         emitter.emit_burst(count)
         self.add_emitter(emitter)
-        
-        # Remove emissor após 3 segundos
-        import threading
-        def remove_later():
-            import time
-            time.sleep(3)
-            self.remove_emitter(emitter)
-        
-        threading.Thread(target=remove_later, daemon=True).start()
+        return emitter
+    
+    def create_spark_burst(self, x: float, y: float, count: int = 10):
+        """Cria rajada de faíscas douradas (para hover de botões)."""
+        self._emit_burst(x - 10, y - 10, 20, 20, ParticleType.GOLDEN_SPARKS, count)
         
     def spawn_hit_particles(self, pos: Tuple[int, int], count: int = 12):
         """Sprint 2-b: Spawn hit particles at position for combat damage."""
         x, y = pos
-        emitter = ParticleEmitter(
-            x - 15, y - 15, 30, 30,
-            ParticleType.DAMAGE_SPARKS,
-            emission_rate=0,  # Burst only
-            max_particles=count
-        )
-        emitter.emit_burst(count)
-        self.add_emitter(emitter)
+        self._emit_burst(x - 15, y - 15, 30, 30, ParticleType.DAMAGE_SPARKS, count)
         
         # Also add impact burst for extra effect
-        impact_emitter = ParticleEmitter(
-            x - 10, y - 10, 20, 20,
-            ParticleType.IMPACT_BURST,
-            emission_rate=0,
-            max_particles=8
-        )
-        impact_emitter.emit_burst(8)
-        self.add_emitter(impact_emitter)
-        
-        # Auto-remove after particles fade
-        import threading
-        def remove_later():
-            import time
-            time.sleep(2)
-            self.remove_emitter(emitter)
-            self.remove_emitter(impact_emitter)
-        
-        threading.Thread(target=remove_later, daemon=True).start()
+        self._emit_burst(x - 10, y - 10, 20, 20, ParticleType.IMPACT_BURST, 8)
+    
+    def has_live_bursts(self) -> bool:
+        """Verifica se alguma rajada one-shot ainda tem partículas vivas."""
+        return any(emitter.one_shot and emitter.particles for emitter in self.emitters)
     
     def update(self, dt: float):
         """Atualiza todos os emissores."""
         for emitter in self.emitters[:]:  # Cópia da lista
             emitter.update(dt)
             
-            # Remove emissores vazios e inativos
+            # Remove emissores vazios e inativos (one-shot voltam ao pool)
             if not emitter.is_active and len(emitter.particles) == 0:
                 self.emitters.remove(emitter)
+                if emitter.one_shot and len(self._burst_pool) < self.BURST_POOL_LIMIT:
+                    self._burst_pool.append(emitter)
     
     def draw(self, surface: pygame.Surface):
         """Desenha todas as partículas."""
@@ -4,43 +4,117 @@ Medieval Deck - Loader de Sprite Sheets
 Carregador automático de sprite sheets e integração com sistema de animação.
 """
 
+import io
 import pygame
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import logging
 
 from ..gameplay.animation import animation_manager
 
 logger = logging.getLogger(__name__)
 
+# Ações padrão e número de frames
+ACTION_FRAMES = {
+    "idle": 8,
+    "attack": 12,
+    "cast": 10,
+    "hurt": 10,
+    "death": 8
+}
 
-def load_sprite_sheet(sheet_path: str, n_frames: int) -> List[pygame.Surface]:
+
+def iter_files_parallel(paths: Iterable[str], max_workers: int = 4) -> Iterator[Tuple[str, bytes]]:
+    """
+    Lê arquivos do disco em paralelo (I/O em threads), entregando cada um ao terminar.
+    
+    A decodificação/convert_alpha fica com quem consome, na thread
+    principal, pois o pygame exige que operações de surface ocorram nela.
+    Arquivos que falham na leitura são omitidos.
+    
+    Args:
+        paths: Caminhos dos arquivos (duplicados são lidos uma vez)
+        max_workers: Número de threads de leitura
+        
+    Yields:
+        Tuplas (path, bytes) na ordem em que as leituras terminam
+    """
+    unique_paths = list(dict.fromkeys(str(path) for path in paths))
+    if not unique_paths:
+        return
+        
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(Path(path).read_bytes): path for path in unique_paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                data = future.result()
+            except OSError as e:
+                logger.debug(f"Falha ao ler {path}: {e}")
+                continue
+            yield path, data
+
+
+def read_files_parallel(paths: Iterable[str], max_workers: int = 4) -> Dict[str, bytes]:
+    """
+    Lê arquivos do disco em paralelo e retorna tudo de uma vez.
+    
+    Args:
+        paths: Caminhos dos arquivos (duplicados são lidos uma vez)
+        max_workers: Número de threads de leitura
+        
+    Returns:
+        Dicionário {path: bytes} apenas com os arquivos lidos com sucesso
+    """
+    return dict(iter_files_parallel(paths, max_workers))
+
+
+def load_image(path: str, data: Optional[bytes] = None) -> pygame.Surface:
+    """Decodifica imagem (de bytes pré-carregados, se houver) com convert_alpha."""
+    if data is not None:
+        return pygame.image.load(io.BytesIO(data), path).convert_alpha()
+    return pygame.image.load(path).convert_alpha()
+
+
+def character_sheet_paths(char_id: str, sprite_sheets_dir: str = "assets/sprite_sheets") -> List[str]:
+    """Retorna os caminhos existentes dos sprite sheets de um personagem."""
+    sheets_path = Path(sprite_sheets_dir)
+    paths = []
+    for action in ACTION_FRAMES:
+        sheet_file = sheets_path / f"{char_id}_{action}_sheet.png"
+        if sheet_file.exists():
+            paths.append(str(sheet_file))
+    return paths
+
+
+def load_sprite_sheet(sheet_path: str, n_frames: int, data: Optional[bytes] = None) -> List[pygame.Surface]:
     """
     Carrega sprite sheet e divide em frames individuais.
     
     Args:
         sheet_path: Caminho para o arquivo PNG do sprite sheet
         n_frames: Número de frames no sheet
+        data: Conteúdo do arquivo já lido (opcional, evita I/O aqui)
         
     Returns:
         Lista de surfaces dos frames
     """
     try:
         # Carregar sprite sheet
-        sheet_surface = pygame.image.load(sheet_path).convert_alpha()
+        sheet_surface = load_image(sheet_path, data)
         
         # Calcular dimensões de cada frame
         sheet_width = sheet_surface.get_width()
         sheet_height = sheet_surface.get_height()
         frame_width = sheet_width // n_frames
         
-        # Extrair cada frame
+        # Extrair cada frame como região do sheet (atlas), sem copiar pixels
         frames = []
         for i in range(n_frames):
             x = i * frame_width
             frame_rect = pygame.Rect(x, 0, frame_width, sheet_height)
-            frame_surface = sheet_surface.subsurface(frame_rect).copy()
-            frames.append(frame_surface)
+            frames.append(sheet_surface.subsurface(frame_rect))
             
         logger.debug(f"Carregado sprite sheet: {sheet_path} ({n_frames} frames)")
         return frames
@@ -50,13 +124,15 @@ def load_sprite_sheet(sheet_path: str, n_frames: int) -> List[pygame.Surface]:
         return []
 
 
-def load_character_animations(char_id: str, sprite_sheets_dir: str = "assets/sprite_sheets") -> bool:
+def load_character_animations(char_id: str, sprite_sheets_dir: str = "assets/sprite_sheets",
+                              preloaded: Optional[Dict[str, bytes]] = None) -> bool:
     """
     Carrega todas as animações de um personagem e registra no animation_manager.
     
     Args:
         char_id: ID do personagem
         sprite_sheets_dir: Diretório dos sprite sheets
+        preloaded: Bytes já lidos por read_files_parallel (opcional)
         
     Returns:
         True se pelo menos uma animação foi carregada
@@ -64,21 +140,15 @@ def load_character_animations(char_id: str, sprite_sheets_dir: str = "assets/spr
     sheets_path = Path(sprite_sheets_dir)
     loaded_count = 0
     
-    # Ações padrão e número de frames
-    action_frames = {
-        "idle": 8,
-        "attack": 12,
-        "cast": 10,
-        "hurt": 10,
-        "death": 8
-    }
-    
     try:
-        for action, n_frames in action_frames.items():
+        if preloaded is None:
+            preloaded = read_files_parallel(character_sheet_paths(char_id, sprite_sheets_dir))
+            
+        for action, n_frames in ACTION_FRAMES.items():
             sheet_file = sheets_path / f"{char_id}_{action}_sheet.png"
             
             if sheet_file.exists():
-                frames = load_sprite_sheet(str(sheet_file), n_frames)
+                frames = load_sprite_sheet(str(sheet_file), n_frames, preloaded.get(str(sheet_file)))
                 
                 if frames:
                     # Determinar se deve fazer loop
@@ -125,8 +195,13 @@ def load_all_character_animations(characters: List[str], sprite_sheets_dir: str
     """
     results = {}
     
+    # Ler todos os sheets de uma vez, em paralelo
+    preloaded = read_files_parallel(
+        path for char_id in characters for path in character_sheet_paths(char_id, sprite_sheets_dir)
+    )
+    
     for char_id in characters:
-        success = load_character_animations(char_id, sprite_sheets_dir)
+        success = load_character_animations(char_id, sprite_sheets_dir, preloaded)
         results[char_id] = success
         
     successful = sum(1 for success in results.values() if success)